@@ -0,0 +1,128 @@
+"""
+Runs the timing benchmarks and saves their results, so they can be compared between commits::
+
+    python -m bench --output before.json
+    git checkout my-branch
+    python -m bench --output after.json --compare before.json
+
+The results file is JSON, holding the per-call time of every benchmark in microseconds keyed by
+its name. Comparing exits with a non-zero status if any benchmark got slower by more than the
+threshold.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+
+from bench import utils
+
+SUITES = (
+    "allow",
+    "call",
+    "call_count",
+    "matcher",
+    "equality",
+    "attribute",
+    "async",
+    "construct",
+    "space",
+)
+
+
+def _commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, results, threshold):
+    """Print how each result changed relative to a baseline.
+
+    :param dict baseline: The per-call times of the baseline run, keyed by benchmark name.
+    :param dict results: The per-call times of this run, keyed by benchmark name.
+    :param float threshold: The relative slowdown above which a benchmark counts as a regression.
+    :return: The names of the benchmarks that regressed.
+    :rtype: list
+    """
+
+    regressions = []
+
+    print()
+    print("{:<60} {:>12} {:>12} {:>8}".format("", "baseline", "current", "change"))
+    for name, usec in results.items():
+        if name not in baseline:
+            continue
+
+        change = usec / baseline[name] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = " !"
+        print(
+            "{:<60} {:>12.3f} {:>12.3f} {:>+7.1%}{}".format(
+                name, baseline[name], usec, change, flag
+            )
+        )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description=__doc__)
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        help="The benchmark suites to run, out of {}. Runs all of them by default.".format(
+            ", ".join(SUITES)
+        ),
+    )
+    parser.add_argument("--output", help="Save the results to this JSON file.")
+    parser.add_argument("--compare", help="Compare to the results in this JSON file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The relative slowdown that counts as a regression. Defaults to 0.1 (10%%).",
+    )
+    args = parser.parse_args(argv)
+
+    for suite in args.suites:
+        if suite not in SUITES:
+            parser.error("unknown suite: {}".format(suite))
+
+    for suite in args.suites or SUITES:
+        print("# {}".format(suite))
+        importlib.import_module("bench.{}_bench".format(suite)).main()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "commit": _commit(),
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "results": utils.results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        if compare(baseline, utils.results, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
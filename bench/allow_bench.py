@@ -0,0 +1,67 @@
+"""Benchmarks for declaring allowances and expectations."""
+
+from bench.utils import measure, report
+from dobles import DoubleSpec, allow, allow_many, expect
+from dobles.instance_double import InstanceDouble
+from dobles.testing import User
+
+
+METHODS = {
+    "instance_method": "value",
+    "get_name": "value",
+    "method_with_varargs": "value",
+    "method_with_default_args": "value",
+    "method_with_varkwargs": "value",
+    "method_with_positional_arguments": "value",
+    "method_with_doc": "value",
+    "some_property": "value",
+}
+
+
+def _allow_each(subject):
+    for method_name, value in METHODS.items():
+        getattr(allow(subject), method_name).and_return(value)
+
+
+def main():
+    subject = InstanceDouble("dobles.testing.User")
+    user = User("Bob Barker", 100)
+
+    report(
+        "allow(instance_double).method",
+        measure(lambda: allow(subject).instance_method),
+    )
+    report(
+        "expect(instance_double).method",
+        measure(lambda: expect(subject).instance_method),
+    )
+    report(
+        "allow(partial_double).method.and_return(value)",
+        measure(lambda: allow(user).instance_method.and_return("value")),
+    )
+    report(
+        "allow(new_instance).method",
+        measure(lambda: allow(User("Bob Barker", 100)).instance_method),
+    )
+    report(
+        "allow(new_instance_double).method.and_return(value) x8",
+        measure(
+            lambda: _allow_each(InstanceDouble("dobles.testing.User")), number=1000
+        ),
+    )
+    report(
+        "allow_many(new_instance_double, 8 methods)",
+        measure(
+            lambda: allow_many(InstanceDouble("dobles.testing.User"), METHODS),
+            number=1000,
+        ),
+    )
+    spec = DoubleSpec("dobles.testing.User", allow=METHODS)
+    report(
+        "DoubleSpec(8 methods).instance_double()",
+        measure(spec.instance_double, number=1000),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmarks for calling doubled async methods."""
+
+from bench.utils import measure, report
+from dobles import allow
+from dobles.instance_double import InstanceDouble
+
+NUMBER = 100000
+
+
+def run(coroutine):
+    """Run a coroutine that never suspends to completion, without an event loop.
+
+    :param coroutine coroutine: The coroutine to run.
+    :return: The value the coroutine returned.
+    """
+
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+
+    raise RuntimeError("The coroutine suspended.")
+
+
+def main():
+    subject = InstanceDouble("dobles.testing.AsyncUser")
+
+    report(
+        "await instance_double.method()",
+        measure(
+            lambda: run(subject.instance_method()),
+            number=NUMBER,
+            setup=lambda: allow(subject).instance_method.and_return("value"),
+        ),
+    )
+    report(
+        "await instance_double.method(arg) with_args",
+        measure(
+            lambda: run(subject.method_with_positional_arguments("Bob")),
+            number=NUMBER,
+            setup=lambda: allow(subject)
+            .method_with_positional_arguments.with_args("Bob")
+            .and_return("value"),
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
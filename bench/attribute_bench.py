@@ -0,0 +1,43 @@
+"""Benchmarks for calling doubled properties and dunder methods."""
+
+from bench.utils import measure, report
+from dobles import allow
+from dobles.testing import User
+
+NUMBER = 100000
+
+
+def main():
+    user = User("Bob Barker", 100)
+
+    report(
+        "partial_double.property",
+        measure(
+            lambda: user.some_property,
+            number=NUMBER,
+            setup=lambda: allow(user).some_property.and_return("value"),
+        ),
+    )
+    report(
+        "partial_double()",
+        measure(
+            lambda: user(),
+            number=NUMBER,
+            setup=lambda: allow(user).__call__.and_return("value"),
+        ),
+    )
+    report(
+        "with partial_double",
+        measure(
+            lambda: user.__enter__() and user.__exit__(None, None, None),
+            number=NUMBER // 2,
+            setup=lambda: (
+                allow(user).__enter__.and_return(True),
+                allow(user).__exit__.and_return(False),
+            ),
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
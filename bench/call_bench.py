@@ -0,0 +1,62 @@
+"""Benchmarks for calling doubled methods."""
+
+from bench.utils import measure, report
+from dobles import allow
+from dobles.instance_double import InstanceDouble
+from dobles.testing import User
+
+NUMBER = 100000
+
+
+def main():
+    subject = InstanceDouble("dobles.testing.User")
+
+    report(
+        "instance_double.method()",
+        measure(
+            lambda: subject.instance_method(),
+            number=NUMBER,
+            setup=lambda: allow(subject).instance_method.and_return("value"),
+        ),
+    )
+    report(
+        "instance_double.method(arg, bar=kwarg)",
+        measure(
+            lambda: subject.method_with_default_args("foo", bar="baz"),
+            number=NUMBER,
+            setup=lambda: allow(subject).method_with_default_args.and_return("value"),
+        ),
+    )
+    report(
+        "instance_double.method(arg) with_args",
+        measure(
+            lambda: subject.method_with_positional_arguments("Bob"),
+            number=NUMBER,
+            setup=lambda: allow(subject)
+            .method_with_positional_arguments.with_args("Bob")
+            .and_return("value"),
+        ),
+    )
+    report(
+        "instance_double.method(arg) among 1000 with_args",
+        measure(
+            lambda: subject.method_with_positional_arguments(500),
+            number=NUMBER // 10,
+            setup=lambda: [
+                allow(subject).method_with_positional_arguments.with_args(i)
+                for i in range(1000)
+            ],
+        ),
+    )
+    report(
+        "partial_double.class_method(arg)",
+        measure(
+            lambda: User.class_method("Bob"),
+            number=NUMBER,
+            setup=lambda: allow(User).class_method.and_return("value"),
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
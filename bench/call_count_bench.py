@@ -0,0 +1,61 @@
+"""Benchmarks for call count restrictions."""
+
+from bench.utils import measure, report
+from dobles import allow, expect
+from dobles.call_count_accumulator import CallCountAccumulator
+from dobles.instance_double import InstanceDouble
+
+NUMBER = 100000
+
+
+def _counted(restriction):
+    counter = CallCountAccumulator()
+    restriction(counter)
+
+    def call():
+        counter.called().has_too_many_calls()
+
+    return call
+
+
+def main():
+    subject = InstanceDouble("dobles.testing.User")
+
+    for name, restriction in [
+        ("exactly", lambda counter: counter.set_exact(NUMBER * 10)),
+        ("at_least", lambda counter: counter.set_minimum(1)),
+        ("at_most", lambda counter: counter.set_maximum(NUMBER * 10)),
+    ]:
+        report(
+            "counter.called().has_too_many_calls() {}".format(name),
+            measure(_counted(restriction), number=NUMBER),
+        )
+
+    report(
+        "instance_double.method() exactly",
+        measure(
+            lambda: subject.instance_method(),
+            number=NUMBER,
+            setup=lambda: expect(subject).instance_method.exactly(NUMBER),
+        ),
+    )
+    report(
+        "instance_double.method() at_least",
+        measure(
+            lambda: subject.instance_method(),
+            number=NUMBER,
+            setup=lambda: expect(subject).instance_method.at_least(1),
+        ),
+    )
+    report(
+        "instance_double.method() at_most",
+        measure(
+            lambda: subject.instance_method(),
+            number=NUMBER,
+            setup=lambda: allow(subject).instance_method.at_most(NUMBER),
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Benchmarks for constructing dobles from dotted paths."""
+
+from bench.utils import measure, report
+from dobles import ClassDouble, InstanceDouble, allow
+from dobles.patch import Patch
+from dobles.utils import get_target
+
+
+def main():
+    report(
+        "get_target(path)",
+        measure(lambda: get_target("dobles.testing.User")),
+    )
+    report(
+        "InstanceDouble(path)",
+        measure(lambda: InstanceDouble("dobles.testing.User")),
+    )
+    report(
+        "ClassDouble(path)",
+        measure(lambda: ClassDouble("dobles.testing.User"), number=1000),
+    )
+    report(
+        "allow(path).method",
+        measure(lambda: allow("dobles.testing.User").class_method),
+    )
+    report(
+        "Patch(path)",
+        measure(lambda: Patch("dobles.testing.User").restore_original_object()),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmarks for matching large buffer and array arguments, which must stay cheap to compare."""
+
+from array import array
+
+from bench.utils import measure, report
+from dobles import allow
+from dobles.instance_double import InstanceDouble
+
+SIZE = 8 * 2**20
+
+
+def _report_match(name, declared, argument):
+    subject = InstanceDouble("dobles.testing.User")
+
+    report(
+        "{} of {} MB".format(name, SIZE // 2**20),
+        measure(
+            lambda: subject.method_with_positional_arguments(argument),
+            number=10,
+            setup=lambda: allow(subject).method_with_positional_arguments.with_args(
+                declared
+            ),
+        ),
+    )
+
+
+def main():
+    _report_match("bytes", bytes(SIZE), bytes(SIZE))
+    _report_match("bytearray", bytearray(SIZE), bytearray(SIZE))
+    _report_match("memoryview", memoryview(bytearray(SIZE)), memoryview(bytes(SIZE)))
+    _report_match("array of ints", array("q", bytes(SIZE)), array("q", bytes(SIZE)))
+    _report_match("array of floats", array("d", bytes(SIZE)), array("d", bytes(SIZE)))
+
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    _report_match(
+        "numpy int array",
+        numpy.zeros(SIZE // 8, dtype="int64"),
+        numpy.zeros(SIZE // 8, dtype="int64"),
+    )
+    _report_match("numpy float array", numpy.zeros(SIZE // 8), numpy.zeros(SIZE // 8))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmarks for finding the allowance that handles a call, by how it matches arguments."""
+
+from bench.utils import measure, report
+from dobles import allow
+from dobles.instance_double import InstanceDouble
+from dobles.matchers import between
+
+NUMBER = 100000
+
+
+def _declare(subject, count, declare):
+    def setup():
+        for i in range(count):
+            declare(allow(subject).method_with_positional_arguments, i)
+
+    return setup
+
+
+def main():
+    # Unhashable arguments and custom matchers are compared against every allowance, so they are
+    # called fewer times as the number of allowances grows.
+    subject = InstanceDouble("dobles.testing.User")
+
+    for count in (1, 10, 1000):
+        report(
+            "any args among {}".format(count),
+            measure(
+                lambda: subject.method_with_positional_arguments("Bob"),
+                number=NUMBER,
+                setup=_declare(
+                    subject, count, lambda allowance, i: allowance.and_return(i)
+                ),
+            ),
+        )
+        report(
+            "exact args among {}".format(count),
+            measure(
+                lambda: subject.method_with_positional_arguments(0),
+                number=NUMBER,
+                setup=_declare(
+                    subject, count, lambda allowance, i: allowance.with_args(i)
+                ),
+            ),
+        )
+        report(
+            "unhashable exact args among {}".format(count),
+            measure(
+                lambda: subject.method_with_positional_arguments([0]),
+                number=NUMBER // 10 // count or 1,
+                setup=_declare(
+                    subject, count, lambda allowance, i: allowance.with_args([i])
+                ),
+            ),
+        )
+        report(
+            "custom matcher among {}".format(count),
+            measure(
+                lambda: subject.method_with_positional_arguments(0),
+                number=NUMBER // 10 // count or 1,
+                setup=_declare(
+                    subject,
+                    count,
+                    lambda allowance, i: allowance.with_args_validator(
+                        lambda foo, i=i: foo == i
+                    ),
+                ),
+            ),
+        )
+        report(
+            "argument matcher among {}".format(count),
+            measure(
+                lambda: subject.method_with_positional_arguments(0),
+                number=NUMBER // 10 // count or 1,
+                setup=_declare(
+                    subject,
+                    count,
+                    lambda allowance, i: allowance.with_args(between(i, i)),
+                ),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
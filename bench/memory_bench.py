@@ -0,0 +1,70 @@
+"""Measures the memory held by dobles per declared stub, using tracemalloc."""
+
+import gc
+import tracemalloc
+
+from dobles import allow, teardown
+from dobles.instance_double import InstanceDouble
+from dobles.testing import User
+
+COUNT = 10000
+
+
+def measure_memory(declare, count=COUNT):
+    """Return the memory still allocated after ``declare`` was called ``count`` times.
+
+    :param func declare: Declares one stub, given its index.
+    :param int count: The number of stubs to declare.
+    :return: The number of bytes held per stub.
+    :rtype: float
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    for i in range(count):
+        declare(i)
+
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    teardown()
+
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename")) / count
+
+
+def report(name, size):
+    print("{:<60} {:>10.0f} bytes".format(name, size))
+
+
+def main():
+    subject = InstanceDouble("dobles.testing.User")
+    allow(subject).instance_method
+    report(
+        "allow(instance_double).method",
+        measure_memory(lambda i: allow(subject).instance_method),
+    )
+
+    subjects = [InstanceDouble("dobles.testing.User") for _ in range(COUNT)]
+    report(
+        "allow(new instance_double).method",
+        measure_memory(lambda i: allow(subjects[i]).instance_method),
+    )
+
+    users = [User("Bob Barker", 100) for _ in range(COUNT)]
+    report(
+        "allow(new partial_double).method.and_return(value)",
+        measure_memory(lambda i: allow(users[i]).instance_method.and_return(i)),
+    )
+
+    report(
+        "allow(discarded partial_double).method.and_return(value)",
+        measure_memory(
+            lambda i: allow(User("Bob Barker", 100)).instance_method.and_return(i)
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
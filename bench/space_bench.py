@@ -0,0 +1,60 @@
+"""Benchmarks for verifying and tearing down spaces holding many proxies."""
+
+import time
+
+from bench.utils import report
+from dobles import allow, expect
+from dobles.instance_double import InstanceDouble
+from dobles.lifecycle import current_space, teardown
+
+SIZES = (10, 100, 1000, 10000, 100000)
+
+
+def measure_space(operation, size, repeat=3):
+    """Time a single call of an operation on a space holding a number of proxies.
+
+    :param func operation: Called with the ``Space`` to time.
+    :param int size: The number of proxies, half with an allowance and half with an expectation.
+    :param int repeat: How many fresh spaces to time the operation on.
+    :return: The fastest time, in microseconds.
+    :rtype: float
+    """
+
+    subjects = [InstanceDouble("dobles.testing.User") for _ in range(size)]
+    timings = []
+
+    for _ in range(repeat):
+        for i, subject in enumerate(subjects):
+            if i % 2:
+                expect(subject).instance_method
+            else:
+                allow(subject).instance_method
+            subject.instance_method()
+
+        space = current_space()
+        start = time.perf_counter()
+        operation(space)
+        timings.append(time.perf_counter() - start)
+        teardown()
+
+    return min(timings) * 1e6
+
+
+def _repeat(size):
+    return 5 if size < 10000 else 1
+
+
+def main():
+    for size in SIZES:
+        report(
+            "Space.verify() with {} proxies".format(size),
+            measure_space(lambda space: space.verify(), size, repeat=_repeat(size)),
+        )
+        report(
+            "Space.teardown() with {} proxies".format(size),
+            measure_space(lambda space: space.teardown(), size, repeat=_repeat(size)),
+        )
+
+
+if __name__ == "__main__":
+    main()
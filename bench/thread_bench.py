@@ -0,0 +1,77 @@
+"""Measures call throughput and accounting accuracy with many threads calling one double."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dobles import allow, teardown
+from dobles.instance_double import InstanceDouble
+
+CALLS = 64000
+
+
+def hammer(func, threads, calls=CALLS):
+    """Call ``func`` ``calls`` times, spread over a number of threads.
+
+    :param func func: The zero argument callable to call.
+    :param int threads: The number of threads to call it from.
+    :param int calls: The total number of calls.
+    :return: The results of every call and the elapsed time in seconds.
+    :rtype: list, float
+    """
+
+    def work(count):
+        return [func() for _ in range(count)]
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        batches = list(executor.map(work, [calls // threads] * threads))
+        elapsed = time.perf_counter() - start
+
+    return [result for batch in batches for result in batch], elapsed
+
+
+def report(name, threads, elapsed, problems):
+    print(
+        "{:<40} {:>3} threads {:>12.0f} calls/sec  {}".format(
+            name, threads, CALLS / elapsed, problems or "ok"
+        )
+    )
+
+
+def main():
+    for threads in (1, 8, 64):
+        subject = InstanceDouble("dobles.testing.User")
+        allowance = allow(subject).instance_method.and_return("Bob Barker")
+        _, elapsed = hammer(subject.instance_method, threads)
+        lost = CALLS - allowance._call_counter.count
+        report("and_return(value)", threads, elapsed, lost and "{} lost".format(lost))
+        teardown()
+
+    for threads in (1, 8, 64):
+        subject = InstanceDouble("dobles.testing.User")
+        allowance = allow(subject).instance_method.and_return_from(
+            value for value in range(CALLS)
+        )
+        results, elapsed = hammer(subject.instance_method, threads)
+        duplicates = len(results) - len(set(results))
+        report(
+            "and_return_from(generator)",
+            threads,
+            elapsed,
+            duplicates and "{} duplicates".format(duplicates),
+        )
+        teardown()
+
+    for threads in (1, 8, 64):
+        subject = InstanceDouble("dobles.testing.User")
+        for arg in range(100):
+            allow(subject).method_with_positional_arguments.with_args(arg)
+        _, elapsed = hammer(
+            lambda: subject.method_with_positional_arguments(50), threads
+        )
+        report("with_args among 100", threads, elapsed, None)
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Helpers shared by the dobles benchmarks."""
+
+import timeit
+
+from dobles.lifecycle import teardown
+
+# Every result reported so far, in order, keyed by benchmark name. Read by ``python -m bench``.
+results = {}
+
+
+def measure(func, number=10000, repeat=5, setup=None):
+    """Time ``func`` and return the best per-call duration.
+
+    The dobles lifecycle is torn down after every repetition so that each one starts from an empty
+    ``Space``.
+
+    :param func func: The zero argument callable to time.
+    :param func setup: An optional zero argument callable that declares the dobles ``func`` needs.
+        It is run before every repetition and is not timed.
+    :param int number: How many times to call ``func`` per repetition.
+    :param int repeat: How many repetitions to run.
+    :return: The fastest per-call time, in microseconds.
+    :rtype: float
+    """
+
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        timings.append(timeit.timeit(func, number=number))
+        teardown()
+
+    return min(timings) / number * 1e6
+
+
+def report(name, usec):
+    """Print a single benchmark result.
+
+    :param str name: The name of the benchmark.
+    :param float usec: The per-call time in microseconds.
+    """
+
+    results[name] = usec
+    print("{:<60} {:>10.3f} usec".format(name, usec))
@@ -1,9 +1,27 @@
 __version__ = "4.0.2"
 
+from dobles.allowance_spec import AllowanceSpec  # noqa
+from dobles.allowance import raising  # noqa
 from dobles.class_double import ClassDouble  # noqa
+from dobles.double_spec import DoubleSpec  # noqa
+from dobles.equality import array_close, register_equality  # noqa
 from dobles.instance_double import InstanceDouble  # noqa
-from dobles.lifecycle import clear, no_builtin_verification, teardown, verify  # noqa
+from dobles.lifecycle import (  # noqa
+    Layer,
+    clear,
+    isolated_space,
+    no_builtin_verification,
+    set_call_history_capacity,
+    set_max_repr_length,
+    teardown,
+    verify,
+)
 from dobles.object_double import ObjectDouble  # noqa
-from dobles.targets.allowance_target import allow, allow_constructor  # noqa
+from dobles.targets.allowance_target import (  # noqa
+    allow,
+    allow_constructor,
+    allow_many,
+)
 from dobles.targets.expectation_target import expect, expect_constructor  # noqa
 from dobles.targets.patch_target import patch, patch_class  # noqa
+from dobles.targets.received_target import received  # noqa
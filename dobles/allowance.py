@@ -1,13 +1,23 @@
 import functools
 import inspect
+from threading import Lock
 from typing import Any
 
 import dobles.lifecycle
 from dobles.call_count_accumulator import CallCountAccumulator
+from dobles.equality import uses_plain_equality, values_equal
 from dobles.exceptions import MockExpectationError, VerifyingBuiltinDoubleArgumentError
+from dobles.failure_message import ArgumentsOf, FailureMessage, ReprOf
+from dobles.matchers import compile_arguments, has_matchers
 from dobles.verification import verify_arguments
 
 _any = object()
+_no_constant = object()
+_no_value = object()
+
+
+def _return_value(*args, **kwargs):
+    return None
 
 
 async def _async_return_value(*args, **kwargs):
@@ -47,53 +57,197 @@ def check_func_takes_args(func):
     return any([arg_spec.args, arg_spec.varargs, arg_spec.varkw, arg_spec.defaults])
 
 
-def build_argument_repr_string(args, kwargs):
-    args = [repr(x) for x in args]
-    kwargs = ["{}={!r}".format(k, v) for k, v in kwargs.items()]
-    return "({})".format(", ".join(args + kwargs))
+class Raising(object):
+    """
+    Raises an exception when called. Exception classes and factories are called anew for every
+    raise, so no traceback or context is carried over from one raise to the next. Exception
+    instances are reraised as they are, after discarding the traceback of their previous raise.
+    """
+
+    __slots__ = ("_exception", "_args", "_kwargs")
+
+    def __init__(self, exception, args=(), kwargs=None):
+        """
+        :param exception: The exception to raise, or an exception class or factory called with
+            ``args`` and ``kwargs`` to build it.
+        :param tuple args: Positional arguments used to build the exception.
+        :param dict kwargs: Keyword arguments used to build the exception.
+        """
+
+        self._exception = exception
+        self._args = args
+        self._kwargs = kwargs or {}
+
+    def __call__(self, *args, **kwargs):
+        exception = self._exception
+
+        if isinstance(exception, BaseException):
+            exception.__traceback__ = None
+            exception.__context__ = None
+        else:
+            exception = exception(*self._args, **self._kwargs)
+
+        try:
+            raise exception
+        finally:
+            # The traceback references this frame, which would otherwise reference the exception.
+            exception = None
+
+
+def raising(exception, *args, **kwargs):
+    """Builds a value for ``and_return`` and ``and_return_from`` that raises an exception instead.
+
+    Allows a sequence of calls to fail before succeeding::
+
+        allow(client).fetch.and_return(raising(TimeoutError), raising(TimeoutError), "data")
+
+    :param exception: The exception to raise, or an exception class or factory to build it with.
+    :param args: Positional arguments used to build the exception.
+    :param kwargs: Keyword arguments used to build the exception.
+    :rtype: Raising
+    """
+
+    return Raising(exception, args, kwargs)
+
+
+class SequentialReturnValues(object):
+    """
+    Returns the values of an iterable one at a time, and keeps returning the last one once the
+    iterable is exhausted. Values are only pulled from the iterable as they are needed, one call
+    at a time, so concurrent calls never receive the same value twice. ``Raising`` values are
+    raised instead of being returned.
+    """
+
+    __slots__ = ("_values", "_last_value", "_method_name", "_lock")
+
+    def __init__(self, values, method_name):
+        """
+        :param iterable values: The values to return.
+        :param str method_name: The name of the allowance method used, for error messages.
+        """
+
+        self._values = iter(values)
+        self._last_value = _no_value
+        self._method_name = method_name
+        self._lock = Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            value = self._last_value = next(self._values, self._last_value)
+
+        if value is _no_value:
+            raise TypeError(
+                "{}() expected at least 1 return value".format(self._method_name)
+            )
+        elif type(value) is Raising:
+            value(*args, **kwargs)
+
+        return value
+
+
+def arguments_match(args, kwargs, expected_args, expected_kwargs):
+    """Compares the arguments of a call to the arguments a double was declared with.
+
+    Each argument is compared with ``values_equal``: with the equality check registered for its
+    type, or with ``==`` in both directions, so either side may define equality. When no argument
+    has a registered check, arguments that ``==`` finds equal as a whole match without comparing
+    each one.
+
+    :param tuple args: The positional arguments of the call.
+    :param dict kwargs: The keyword arguments of the call.
+    :param tuple expected_args: The declared positional arguments.
+    :param dict expected_kwargs: The declared keyword arguments.
+    :rtype: bool
+    """
+
+    if len(args) != len(expected_args) or len(kwargs) != len(expected_kwargs):
+        return False
+
+    # Types with a registered check, such as NumPy arrays, are never compared with ``==``, which
+    # may not return a boolean, or may find values equal that the check doesn't.
+    if (
+        uses_plain_equality(args)
+        and uses_plain_equality(expected_args)
+        and args == expected_args
+        and (
+            not kwargs
+            or uses_plain_equality(kwargs.values())
+            and uses_plain_equality(expected_kwargs.values())
+            and kwargs == expected_kwargs
+        )
+    ):
+        return True
+
+    if not all(map(values_equal, args, expected_args)):
+        return False
+
+    for key, value in expected_kwargs.items():
+        if key not in kwargs:
+            return False
+        elif not values_equal(kwargs[key], value):
+            return False
+
+    return True
 
 
 class Allowance(object):
     """An individual method allowance (stub)."""
 
-    def __init__(self, target, method_name, caller):
+    __slots__ = (
+        "_target",
+        "_method_name",
+        "_caller",
+        "_revision",
+        "args",
+        "kwargs",
+        "_argument_matcher",
+        "_custom_matcher",
+        "_is_satisfied",
+        "_call_counter",
+        "is_async",
+        "_return_value",
+        "_constant_return_value",
+    )
+
+    def __init__(self, target, method_name, caller, revision):
         """
         :param Target target: The object owning the method to stub.
         :param str method_name: The name of the method to stub.
+        :param Caller caller: Where the allowance was declared.
+        :param Revision revision: Bumped whenever the arguments, return value or call count
+            restrictions of the allowance change.
         """
 
         self._target = target
         self._method_name = method_name
         self._caller = caller
+        self._revision = revision
         self.args = _any
         self.kwargs = _any
+        self._argument_matcher = None
         self._custom_matcher = None
         self._is_satisfied = True
         self._call_counter = CallCountAccumulator()
 
-        self.is_async: bool = target.is_attr_async(method_name)
+        self.is_async = target.is_attr_async(method_name)
         if self.is_async:
             self._return_value = _async_return_value
+            self._constant_return_value = _no_constant
         else:
-            self._return_value = lambda *args, **kwargs: None
+            self._return_value = _return_value
+            self._constant_return_value = None
 
     def and_raise(self, exception, *args, **kwargs):
         """Causes the double to raise the provided exception when called.
 
-        If provided, additional arguments (positional and keyword) passed to
+        When given an exception class or a factory function, a new exception is built for every
+        call. If provided, additional arguments (positional and keyword) passed to
         `and_raise` are used in the exception instantiation.
 
-        :param Exception exception: The exception to raise.
+        :param exception: The exception to raise, or an exception class or factory to build it.
         """
 
-        def proxy_exception(*proxy_args, **proxy_kwargs):
-            raise exception
-
-        async def async_proxy_exception(*proxy_args, **proxy_kwargs):
-            raise exception
-
-        self._return_value = async_proxy_exception if self.is_async else proxy_exception
-        return self
+        return self.and_return_result_of(Raising(exception, args, kwargs))
 
     def and_return(self, *return_values):
         """Set a return value for an allowance
@@ -110,13 +264,32 @@ class Allowance(object):
         if not return_values:
             raise TypeError("and_return() expected at least 1 return value")
 
-        return_values = list(return_values)
-        final_value = return_values.pop()
+        if (
+            len(return_values) == 1
+            and not self.is_async
+            and type(return_values[0]) is not Raising
+        ):
+            self._constant_return_value = return_values[0]
+            self._revision.bump()
+            return self
+
+        return self.and_return_result_of(
+            SequentialReturnValues(return_values, "and_return")
+        )
+
+    def and_return_from(self, return_values):
+        """Set the return values of an allowance from an iterable
+
+        Causes the double to return the items of the iterable in order, one at a time as the double
+        is called. Items are only taken from the iterable when the double is called, so generators
+        and readers can supply a large number of values without building them up front. Once the
+        iterable is exhausted, the double continues to return the last item.
+
+        :param iterable return_values: The values the double will return when called.
+        """
 
         self.and_return_result_of(
-            lambda *args, **kwargs: (
-                return_values.pop(0) if return_values else final_value
-            )
+            SequentialReturnValues(return_values, "and_return_from")
         )
         return self
 
@@ -128,6 +301,8 @@ class Allowance(object):
         """
 
         self._return_value = _maybe_async(self.is_async, return_value)
+        self._constant_return_value = _no_constant
+        self._revision.bump()
 
         return self
 
@@ -145,15 +320,33 @@ class Allowance(object):
     def with_args(self, *args, **kwargs):
         """Declares that the double can only be called with the provided arguments.
 
+        Arguments can be given as matchers from ``dobles.matchers``, which accept any argument
+        they match.
+
         :param args: Any positional arguments required for invocation.
         :param kwargs: Any keyword arguments required for invocation.
         """
 
-        self.args = args
-        self.kwargs = kwargs
+        self.set_arguments(args, kwargs)
         self.verify_arguments()
         return self
 
+    def set_arguments(self, args, kwargs):
+        """Declares the arguments the double can be called with, without verifying them.
+
+        Used when the arguments have already been verified against the signature of the method.
+
+        :param tuple args: The positional arguments required for invocation.
+        :param dict kwargs: The keyword arguments required for invocation.
+        """
+
+        self.args = args
+        self.kwargs = kwargs
+        self._argument_matcher = (
+            compile_arguments(args, kwargs) if has_matchers(args, kwargs) else None
+        )
+        self._revision.bump()
+
     def with_args_validator(self, matching_function):
         """Define a custom function for testing arguments
 
@@ -161,7 +354,9 @@ class Allowance(object):
         """
         self.args = None
         self.kwargs = None
+        self._argument_matcher = None
         self._custom_matcher = matching_function
+        self._revision.bump()
         return self
 
     def __call__(self, *args, **kwargs):
@@ -180,8 +375,7 @@ class Allowance(object):
     def with_no_args(self):
         """Declares that the double can only be called with no arguments."""
 
-        self.args = ()
-        self.kwargs = {}
+        self.set_arguments((), {})
         self.verify_arguments()
         return self
 
@@ -204,25 +398,14 @@ class Allowance(object):
         :rtype: bool
         """
 
-        if self.args is None and self.kwargs is None:
+        if self._argument_matcher is not None:
+            return self._argument_matcher(args, kwargs)
+        elif self.args is None and self.kwargs is None:
             return False
         elif self.args is _any and self.kwargs is _any:
             return True
-        elif args == self.args and kwargs == self.kwargs:
-            return True
-        elif len(args) != len(self.args) or len(kwargs) != len(self.kwargs):
-            return False
-
-        if not all(x == y or y == x for x, y in zip(args, self.args)):
-            return False
 
-        for key, value in self.kwargs.items():
-            if key not in kwargs:
-                return False
-            elif not (kwargs[key] == value or value == kwargs[key]):
-                return False
-
-        return True
+        return arguments_match(args, kwargs, self.args, self.kwargs)
 
     def satisfy_custom_matcher(self, args, kwargs):
         """Return a boolean indicating if the args satisfy the stub
@@ -244,8 +427,59 @@ class Allowance(object):
         """
 
         self._called()
+
+        constant_return_value = self._constant_return_value
+        if constant_return_value is not _no_constant:
+            return constant_return_value
+
         return self._return_value(*args, **kwargs)
 
+    def accepts_every_call(self):
+        """Returns a boolean indicating whether or not the allowance can handle any call on its own.
+
+        This is the case if it accepts arbitrary arguments and has no upper bound on its call count.
+
+        :rtype: bool
+        """
+
+        return (
+            self.args is _any
+            and self.kwargs is _any
+            and not self._call_counter.has_exact
+            and not self._call_counter.has_maximum
+        )
+
+    def compile_dispatch(self):
+        """Builds a function that handles calls on behalf of the allowance.
+
+        Only valid while ``accepts_every_call`` is true, and must be rebuilt whenever the
+        allowance changes.
+
+        :return: A function taking the args tuple and kwargs dict of a call.
+        :rtype: func
+        """
+
+        verify_arguments = self.verify_arguments
+        called = self._call_counter.called
+        constant_return_value = self._constant_return_value
+
+        if constant_return_value is not _no_constant:
+
+            def dispatch(args, kwargs):
+                verify_arguments(args, kwargs)
+                called()
+                return constant_return_value
+
+        else:
+            return_value = self._return_value
+
+            def dispatch(args, kwargs):
+                verify_arguments(args, kwargs)
+                called()
+                return return_value(*args, **kwargs)
+
+        return dispatch
+
     def verify_arguments(self, args=None, kwargs=None):
         """Ensures that the arguments specified match the signature of the real method.
 
@@ -269,6 +503,7 @@ class Allowance(object):
         """
 
         self._call_counter.set_exact(n)
+        self._revision.bump()
         return self
 
     @verify_count_is_non_negative
@@ -279,6 +514,7 @@ class Allowance(object):
         """
 
         self._call_counter.set_minimum(n)
+        self._revision.bump()
         return self
 
     @verify_count_is_non_negative
@@ -289,6 +525,7 @@ class Allowance(object):
         """
 
         self._call_counter.set_maximum(n)
+        self._revision.bump()
         return self
 
     def never(self):
@@ -331,22 +568,24 @@ class Allowance(object):
         """
 
         raise MockExpectationError(
-            "{} '{}' to be called {}on {!r} with {}, but was not. ({}:{})".format(
+            FailureMessage(
+                "{} '{}' to be called {}on {} with {}, but was not. ({}:{})",
                 expect_or_allow,
                 self._method_name,
                 self._call_counter.error_string(),
-                self._target.obj,
+                ReprOf(self._target.obj),
                 self._expected_argument_string(),
                 self._caller.filename,
                 self._caller.lineno,
+                max_repr_length=dobles.lifecycle.max_repr_length(),
             )
         )
 
     def _expected_argument_string(self):
-        """Generates a string describing what arguments the double expected.
+        """Describes what arguments the double expected, for a ``FailureMessage``.
 
-        :return: A string describing expected arguments.
-        :rtype: str
+        :return: A string or ``ArgumentsOf`` describing expected arguments.
+        :rtype: str, ArgumentsOf
         """
 
         if self.args is _any and self.kwargs is _any:
@@ -354,4 +593,4 @@ class Allowance(object):
         elif self._custom_matcher:
             return "custom matcher: '{}'".format(self._custom_matcher.__name__)
         else:
-            return build_argument_repr_string(self.args, self.kwargs)
+            return ArgumentsOf(self.args, self.kwargs)
@@ -0,0 +1,163 @@
+import dobles.lifecycle
+from dobles.allowance import verify_count_is_non_negative
+from dobles.exceptions import VerifyingBuiltinDoubleArgumentError
+from dobles.verification import verify_arguments
+
+# The steps declaring the arguments of an allowance, recorded with the declared args and kwargs.
+_ARGUMENT_STEPS = frozenset(["with_args", "with_no_args"])
+
+
+def as_allowance_specs(values):
+    """Wraps the plain return values in a mapping of method names in ``AllowanceSpec``s.
+
+    :param dict values: Return values or ``AllowanceSpec``s keyed by method name.
+    :return: ``AllowanceSpec``s keyed by method name.
+    :rtype: dict
+    """
+
+    return {
+        method_name: (
+            value
+            if isinstance(value, AllowanceSpec)
+            else AllowanceSpec().and_return(value)
+        )
+        for method_name, value in values.items()
+    }
+
+
+class AllowanceSpec(object):
+    """
+    A recorded allowance configuration that can be applied to any number of allowances. Supports
+    the same configuration methods as ``Allowance``::
+
+        spec = AllowanceSpec().with_args("hello").and_return("Carl says hello")
+        allow_many(user, {"speak": spec})
+
+    Arguments are verified against the signature of each method the spec is applied to. Return
+    values are shared by every allowance the spec is applied to, so iterables passed to
+    ``and_return_from`` are consumed by all of them together.
+    """
+
+    __slots__ = ("_steps",)
+
+    def __init__(self):
+        self._steps = []
+
+    def _record(self, method_name, *args, **kwargs):
+        self._steps.append((method_name, args, kwargs))
+        return self
+
+    def and_raise(self, exception, *args, **kwargs):
+        """See ``Allowance.and_raise``."""
+
+        return self._record("and_raise", exception, *args, **kwargs)
+
+    def and_return(self, *return_values):
+        """See ``Allowance.and_return``."""
+
+        if not return_values:
+            raise TypeError("and_return() expected at least 1 return value")
+
+        return self._record("and_return", *return_values)
+
+    def and_return_from(self, return_values):
+        """See ``Allowance.and_return_from``."""
+
+        return self._record("and_return_from", return_values)
+
+    def and_return_result_of(self, return_value):
+        """See ``Allowance.and_return_result_of``."""
+
+        return self._record("and_return_result_of", return_value)
+
+    def with_args(self, *args, **kwargs):
+        """See ``Allowance.with_args``."""
+
+        return self._record("with_args", *args, **kwargs)
+
+    __call__ = with_args
+
+    def with_args_validator(self, matching_function):
+        """See ``Allowance.with_args_validator``."""
+
+        return self._record("with_args_validator", matching_function)
+
+    def with_no_args(self):
+        """See ``Allowance.with_no_args``."""
+
+        return self._record("with_no_args")
+
+    @verify_count_is_non_negative
+    def exactly(self, n):
+        """See ``Allowance.exactly``."""
+
+        return self._record("exactly", n)
+
+    @verify_count_is_non_negative
+    def at_least(self, n):
+        """See ``Allowance.at_least``."""
+
+        return self._record("at_least", n)
+
+    @verify_count_is_non_negative
+    def at_most(self, n):
+        """See ``Allowance.at_most``."""
+
+        return self._record("at_most", n)
+
+    def never(self):
+        """See ``Allowance.never``."""
+
+        return self.exactly(0)
+
+    def once(self):
+        """See ``Allowance.once``."""
+
+        return self.exactly(1)
+
+    def twice(self):
+        """See ``Allowance.twice``."""
+
+        return self.exactly(2)
+
+    @property
+    def times(self):
+        return self
+
+    time = times
+
+    def verify_arguments(self, target, method_name):
+        """Ensures that the arguments specified match the signature of a method.
+
+        :param Target target: The object owning the method.
+        :param str method_name: The name of the method.
+        :raise: ``VerifyingDoubleArgumentError`` if the arguments do not match.
+        """
+
+        for step, args, kwargs in self._steps:
+            if step not in _ARGUMENT_STEPS:
+                continue
+
+            try:
+                verify_arguments(target, method_name, args, kwargs)
+            except VerifyingBuiltinDoubleArgumentError:
+                if dobles.lifecycle.ignore_builtin_verification():
+                    raise
+
+    def apply(self, allowance, verify=True):
+        """Configures an allowance according to the spec.
+
+        :param Allowance allowance: The allowance to configure.
+        :param bool verify: Whether to verify the arguments of the spec against the signature of
+            the method. Only skipped when ``verify_arguments`` has already done so.
+        :return: The configured allowance.
+        :rtype: Allowance
+        """
+
+        for step, args, kwargs in self._steps:
+            if not verify and step in _ARGUMENT_STEPS:
+                allowance.set_arguments(args, kwargs)
+            else:
+                getattr(allowance, step)(*args, **kwargs)
+
+        return allowance
@@ -1,10 +1,36 @@
+import sys
+from threading import Lock
+
+
 def pluralize(word, count):
     return word if count == 1 else word + "s"
 
 
 class CallCountAccumulator(object):
+    """
+    Counts the calls made to a double and checks them against its call count restrictions. The
+    restrictions are folded into a ceiling and a floor whenever they change, so checking a call
+    count is a single integer comparison. Calls may be counted from several threads at once.
+    """
+
+    __slots__ = (
+        "_call_count",
+        "_exact",
+        "_minimum",
+        "_maximum",
+        "_ceiling",
+        "_floor",
+        "_lock",
+    )
+
     def __init__(self):
+        self._lock = Lock()
         self._call_count = 0
+        self._exact = None
+        self._minimum = None
+        self._maximum = None
+        self._ceiling = sys.maxsize
+        self._floor = 0
 
     def set_exact(self, n):
         """Set an exact call count expectation
@@ -13,6 +39,7 @@ class CallCountAccumulator(object):
         """
 
         self._exact = n
+        self._update_bounds()
 
     def set_minimum(self, n):
         """Set a minimum call count expectation
@@ -21,6 +48,7 @@ class CallCountAccumulator(object):
         """
 
         self._minimum = n
+        self._update_bounds()
 
     def set_maximum(self, n):
         """Set a maximum call count expectation
@@ -29,6 +57,16 @@ class CallCountAccumulator(object):
         """
 
         self._maximum = n
+        self._update_bounds()
+
+    def _update_bounds(self):
+        """Recompute the highest and lowest call counts allowed by the restrictions."""
+
+        upper = [n for n in (self._exact, self._maximum) if n is not None]
+        lower = [n for n in (self._exact, self._minimum) if n is not None]
+
+        self._ceiling = min(upper) if upper else sys.maxsize
+        self._floor = max(lower) if lower else 0
 
     def has_too_many_calls(self):
         """Test if there have been too many calls
@@ -36,11 +74,7 @@ class CallCountAccumulator(object):
         :rtype boolean
         """
 
-        if self.has_exact and self._call_count > self._exact:
-            return True
-        if self.has_maximum and self._call_count > self._maximum:
-            return True
-        return False
+        return self._call_count > self._ceiling
 
     def has_too_few_calls(self):
         """Test if there have not been enough calls
@@ -48,11 +82,7 @@ class CallCountAccumulator(object):
         :rtype boolean
         """
 
-        if self.has_exact and self._call_count < self._exact:
-            return True
-        if self.has_minimum and self._call_count < self._minimum:
-            return True
-        return False
+        return self._call_count < self._floor
 
     def has_incorrect_call_count(self):
         """Test if there have not been a valid number of calls
@@ -76,12 +106,13 @@ class CallCountAccumulator(object):
         :rtype: boolean
         """
 
-        return self.has_exact and self._exact == 0
+        return self._exact == 0
 
     def called(self):
         """Increment the call count"""
 
-        self._call_count += 1
+        with self._lock:
+            self._call_count += 1
         return self
 
     @property
@@ -100,7 +131,7 @@ class CallCountAccumulator(object):
         :rtype boolean
         """
 
-        return getattr(self, "_minimum", None) is not None
+        return self._minimum is not None
 
     @property
     def has_maximum(self):
@@ -109,7 +140,7 @@ class CallCountAccumulator(object):
         :rtype boolean
         """
 
-        return getattr(self, "_maximum", None) is not None
+        return self._maximum is not None
 
     @property
     def has_exact(self):
@@ -118,7 +149,7 @@ class CallCountAccumulator(object):
         :rtype boolean
         """
 
-        return getattr(self, "_exact", None) is not None
+        return self._exact is not None
 
     def _restriction_string(self):
         """Get a string explaining the expectation currently set
@@ -0,0 +1,127 @@
+from collections import deque, namedtuple
+
+import dobles.allowance
+from dobles.failure_message import build_argument_repr_string
+
+# Calls are not recorded unless a capacity is set with ``set_call_history_capacity``.
+DEFAULT_CAPACITY = 0
+
+Call = namedtuple("Call", ["args", "kwargs", "thread", "timestamp"])
+
+
+class CallHistory(object):
+    """
+    The most recent calls made to a doubled method, kept in a ring buffer so that methods called
+    millions of times use a bounded amount of memory.
+    """
+
+    __slots__ = ("_calls", "record")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        :param int capacity: The number of calls to remember. Older calls are forgotten.
+        """
+
+        self._calls = deque(maxlen=capacity)
+        # Called with an ``(args, kwargs, thread ident, timestamp)`` tuple for each call.
+        self.record = self._calls.append
+
+    @property
+    def capacity(self):
+        return self._calls.maxlen
+
+    def clear(self):
+        """Forgets every remembered call."""
+
+        self._calls.clear()
+
+    def calls(self):
+        """Returns the remembered calls, oldest first.
+
+        :rtype: list
+        """
+
+        return [Call._make(call) for call in self._calls.copy()]
+
+
+class ReceivedCalls(object):
+    """The calls a doubled method received, optionally narrowed down by their arguments."""
+
+    def __init__(self, method_name, calls):
+        """
+        :param str method_name: The name of the doubled method.
+        :param list calls: The ``Call`` objects.
+        """
+
+        self._method_name = method_name
+        self._calls = calls
+
+    def with_args(self, *args, **kwargs):
+        """Narrows the calls down to those made with the given arguments.
+
+        Arguments are compared the same way ``Allowance.with_args`` compares them.
+
+        :return: The matching calls.
+        :rtype: ReceivedCalls
+        """
+
+        calls = [
+            call
+            for call in self._calls
+            if dobles.allowance.arguments_match(call.args, call.kwargs, args, kwargs)
+        ]
+        return ReceivedCalls(self._method_name, calls)
+
+    def with_no_args(self):
+        """Narrows the calls down to those made without arguments.
+
+        :return: The matching calls.
+        :rtype: ReceivedCalls
+        """
+
+        return self.with_args()
+
+    @property
+    def calls(self):
+        """The calls, oldest first.
+
+        :rtype: list
+        """
+
+        return list(self._calls)
+
+    @property
+    def count(self):
+        """The number of calls. Never more than the capacity of the call history.
+
+        :rtype: int
+        """
+
+        return len(self._calls)
+
+    @property
+    def last(self):
+        """The most recent call, if there was one.
+
+        :rtype: Call, None
+        """
+
+        return self._calls[-1] if self._calls else None
+
+    def __len__(self):
+        return len(self._calls)
+
+    def __iter__(self):
+        return iter(self._calls)
+
+    def __bool__(self):
+        return bool(self._calls)
+
+    def __repr__(self):
+        return "<ReceivedCalls of '{}': [{}]>".format(
+            self._method_name,
+            ", ".join(
+                build_argument_repr_string(call.args, call.kwargs)
+                for call in self._calls
+            ),
+        )
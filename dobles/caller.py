@@ -0,0 +1,20 @@
+class Caller(object):
+    """
+    A cheap reference to the place an allowance or expectation was declared. Only the code object
+    and the line number are captured, the filename is read from the code object when it is first
+    needed (usually when building a failure message).
+    """
+
+    __slots__ = ("_code", "lineno")
+
+    def __init__(self, frame):
+        """
+        :param frame frame: The stack frame that declared the double.
+        """
+
+        self._code = frame.f_code
+        self.lineno = frame.f_lineno
+
+    @property
+    def filename(self):
+        return self._code.co_filename
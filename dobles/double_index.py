@@ -0,0 +1,166 @@
+from dobles.allowance import _any
+from dobles.equality import HASHABLE_VALUE_TYPES, equality_check_for
+
+
+def _is_indexable(value):
+    """Determines if hashing a value is equivalent to comparing it with ``==``.
+
+    This is the case for builtin scalars, containers of them, and objects that use the default
+    identity based ``__eq__`` and ``__hash__`` without a registered equality check.
+
+    :param object value: The argument to test.
+    :rtype: bool
+    """
+
+    value_type = type(value)
+
+    if value_type in HASHABLE_VALUE_TYPES:
+        return True
+    if value_type is tuple or value_type is frozenset:
+        return all(map(_is_indexable, value))
+
+    return (
+        value_type.__eq__ is object.__eq__
+        and value_type.__hash__ is object.__hash__
+        and equality_check_for(value_type) is None
+    )
+
+
+def index_key(args, kwargs):
+    """Returns a hashable key for a set of arguments.
+
+    :param tuple args: The positional arguments.
+    :param dict kwargs: The keyword arguments.
+    :return: The key, or None if the arguments can't be safely compared by hash.
+    :rtype: tuple, None
+    """
+
+    if not all(map(_is_indexable, args)):
+        return None
+    if kwargs and not all(map(_is_indexable, kwargs.values())):
+        return None
+
+    return tuple(args), frozenset(kwargs.items())
+
+
+class DoubleIndex(object):
+    """
+    A lookup structure over a newest-first list of allowances or expectations. Finds the same
+    double a linear scan of ``satisfy_exact_match``, ``satisfy_custom_matcher`` and
+    ``satisfy_any_args_match`` would, but without comparing against every double that was declared
+    with hashable arguments.
+
+    The index is rebuilt into new tables that are published all at once, so it can be used from
+    several threads while being rebuilt.
+    """
+
+    __slots__ = ("_dobles", "_revision", "_tables")
+
+    def __init__(self, dobles, revision):
+        """
+        :param list dobles: The allowances or expectations to index, newest first.
+        :param Revision revision: Bumped whenever ``dobles`` or their arguments change.
+        """
+
+        self._dobles = dobles
+        self._revision = revision
+        self._tables = (None,)
+
+    def find(self, args, kwargs):
+        """Returns the double that should handle a call.
+
+        :param tuple args: The positional arguments of the call.
+        :param dict kwargs: The keyword arguments of the call.
+        :return: The matching ``Allowance`` or ``Expectation``, if one was found.
+        :rtype: Allowance, Expectation, None
+        """
+
+        tables = self._tables
+        if tables[0] != self._revision.number:
+            tables = self._build()
+
+        _, dobles, exact, _, custom, _ = tables
+        key = index_key(args, kwargs) if exact else None
+
+        if key is None:
+            double = self._scan_exact(dobles, args, kwargs)
+        else:
+            double = self._find_exact(tables, key, args, kwargs)
+
+        if double is not None:
+            return double
+
+        for double in custom:
+            if double.satisfy_custom_matcher(args, kwargs):
+                return double
+
+    def _find_exact(self, tables, key, args, kwargs):
+        """Finds the newest double declared with matching arguments or accepting any arguments.
+
+        :param tuple tables: The tables returned by ``_build``.
+        :param tuple key: The ``index_key`` of the arguments.
+        :return: The matching double, if one was found.
+        """
+
+        _, dobles, exact, unindexed, _, best = tables
+        position = exact.get(key, best)
+        if position < best:
+            best = position
+
+        for position in unindexed:
+            if position >= best:
+                break
+            double = dobles[position]
+            if double.satisfy_exact_match(args, kwargs):
+                return double
+
+        if best < len(dobles):
+            double = dobles[best]
+            if double.satisfy_exact_match(args, kwargs):
+                return double
+
+    def _scan_exact(self, dobles, args, kwargs):
+        """Finds the newest double accepting the arguments by comparing against each one.
+
+        :param list dobles: The dobles to scan.
+        :return: The matching double, if one was found.
+        """
+
+        for double in dobles:
+            if double.satisfy_exact_match(args, kwargs):
+                return double
+
+    def _build(self):
+        """Indexes the dobles by the arguments they were declared with.
+
+        :return: The revision indexed, a snapshot of the dobles, the position of the newest double
+            for each argument key, the positions of dobles with unhashable arguments, the dobles
+            with custom matchers and the position of the newest double accepting any arguments.
+        :rtype: tuple
+        """
+
+        revision = self._revision.number
+        dobles = list(self._dobles)
+        exact = {}
+        unindexed = []
+        custom = []
+        any_args_position = len(dobles)
+
+        for position, double in enumerate(dobles):
+            if double.args is _any and double.kwargs is _any:
+                any_args_position = min(any_args_position, position)
+            elif double.args is None and double.kwargs is None:
+                custom.append(double)
+            elif double._argument_matcher is not None:
+                # Arguments declared with matchers are never hashed.
+                unindexed.append(position)
+            else:
+                key = index_key(double.args, double.kwargs)
+                if key is None:
+                    unindexed.append(position)
+                else:
+                    exact.setdefault(key, position)
+
+        self._tables = (revision, dobles, exact, unindexed, custom, any_args_position)
+
+        return self._tables
@@ -0,0 +1,83 @@
+from inspect import currentframe
+
+from dobles.allowance_spec import as_allowance_specs
+from dobles.caller import Caller
+from dobles.instance_double import InstanceDouble, _get_dobles_target
+from dobles.lifecycle import current_space
+from dobles.target import Target
+from dobles.verification import verify_specs
+
+
+class DoubleSpec(object):
+    """
+    A set of allowances and expectations for instances of a class, verified once when the spec is
+    created, that can be stamped onto any number of fresh dobles::
+
+        client_spec = DoubleSpec(
+            "myapp.Client",
+            allow={"get": "value", "put": AllowanceSpec().with_args("key", "value")},
+            expect={"close": AllowanceSpec().once()},
+        )
+
+        @pytest.fixture
+        def client():
+            return client_spec.instance_double()
+
+    The values of ``allow`` and ``expect`` are return values or ``AllowanceSpec``s, as for
+    ``allow_many``. Each stamped double gets its own allowances and expectations, and so its own
+    call counts, which are verified and torn down with the test that stamped it.
+
+    :param str path: The absolute module path to the class.
+    :param dict allow: The allowances to declare, keyed by method name.
+    :param dict expect: The expectations to declare, keyed by method name.
+    :raise: ``VerifyingDoubleGroupError`` listing every method that can't be doubled as declared.
+    """
+
+    __slots__ = ("_path", "_cls", "_allowances", "_expectations", "_caller")
+
+    def __init__(self, path, allow=None, expect=None):
+        self._path = path
+        self._cls = _get_dobles_target(path)
+        self._allowances = as_allowance_specs(allow or {})
+        self._expectations = as_allowance_specs(expect or {})
+        self._caller = Caller(currentframe().f_back)
+
+        verify_specs(
+            Target(InstanceDouble(path)),
+            list(self._allowances.items()) + list(self._expectations.items()),
+        )
+
+    def instance_double(self, **kwargs):
+        """Creates an ``InstanceDouble`` of the class with the dobles of the spec.
+
+        :param kwargs: Attributes to set on the double, as for ``InstanceDouble``.
+        :return: The new double.
+        :rtype: InstanceDouble
+        """
+
+        double = InstanceDouble(self._path, **kwargs)
+        self.apply(double)
+        return double
+
+    def apply(self, obj):
+        """Declares the dobles of the spec on an existing object.
+
+        Applying the spec to an instance or ``InstanceDouble`` of the spec's class skips
+        verification entirely, since the spec was verified against the class when it was created.
+        Other objects are verified first.
+
+        :param object obj: The object to double.
+        :return: The new ``Allowance``s and ``Expectation``s, each keyed by method name.
+        :rtype: tuple
+        :raise: ``VerifyingDoubleGroupError`` if the object doesn't support the spec.
+        """
+
+        doubled_type = obj._dobles_target if type(obj) is InstanceDouble else type(obj)
+
+        proxy = current_space().proxy_for(obj)
+        return proxy.add_dobles(
+            self._allowances,
+            self._expectations,
+            self._caller,
+            verify=doubled_type is not self._cls,
+        )
@@ -0,0 +1,273 @@
+"""
+How arguments are compared to the arguments dobles were declared with. By default values are
+compared with ``==`` in both directions, but a check can be registered for a type when ``==``
+doesn't answer whether two values are the same, or answers it too slowly.
+"""
+
+import sys
+from array import array
+
+# Types whose hash is consistent with their equality, so arguments of these types can be matched
+# by hashing them. Registering an equality check for them is not supported.
+HASHABLE_VALUE_TYPES = frozenset([int, float, complex, str, bytes, bool, type(None)])
+_BYTE_STRING_TYPES = (bytes, bytearray)
+# Buffer formats whose items are equal exactly when their bytes are: integers and characters.
+_BYTEWISE_FORMATS = frozenset("bBchHiIlLqQnN")
+
+# How many types ``equality_check_for`` remembers the check of. Arguments of classes created at
+# runtime would otherwise keep every such class alive, so the types are forgotten once the limit is
+# reached. Weak references are not used, since they make every lookup several times slower.
+_MAX_RESOLVED_TYPES = 1024
+
+_checks = {}
+_resolved = {}
+# The types that ``equality_check_for`` found no check for.
+_unchecked = set()
+_numpy_registered = False
+
+
+def register_equality(value_type, check):
+    """Registers how values of a type are compared to declared arguments.
+
+    The check is used instead of ``==`` whenever either the argument or the declared value is an
+    instance of the type or one of its subclasses, with the argument first. It must be symmetric,
+    since it is used in either case::
+
+        register_equality(Frame, lambda frame, other: frame.equals(other))
+
+    :param type value_type: The type to compare with the check.
+    :param func check: A function taking two values and returning whether they are equal.
+    :raise: ``TypeError`` if the type is a builtin scalar type.
+    """
+
+    if value_type in HASHABLE_VALUE_TYPES:
+        raise TypeError(
+            "Cannot register an equality check for {}".format(value_type.__name__)
+        )
+
+    _checks[value_type] = check
+    _resolved.clear()
+    _unchecked.clear()
+
+
+def equality_check_for(value_type):
+    """Returns the check registered for a type or the closest of its base classes.
+
+    :param type value_type: The type of a value.
+    :return: The registered check, if there is one.
+    :rtype: func, None
+    """
+
+    try:
+        return _resolved[value_type]
+    except KeyError:
+        pass
+
+    if not _numpy_registered and "numpy" in sys.modules:
+        _register_numpy()
+
+    check = next(
+        (_checks[cls] for cls in value_type.__mro__ if cls in _checks),
+        None,
+    )
+    if len(_resolved) >= _MAX_RESOLVED_TYPES:
+        _resolved.clear()
+        _unchecked.clear()
+
+    _resolved[value_type] = check
+    if check is None:
+        _unchecked.add(value_type)
+
+    return check
+
+
+def uses_plain_equality(values):
+    """Returns whether none of the values has a type with a registered equality check.
+
+    :param iterable values: The values to look at.
+    :rtype: bool
+    """
+
+    for value in values:
+        value_type = type(value)
+        if value_type not in _unchecked and equality_check_for(value_type) is not None:
+            return False
+
+    return True
+
+
+def values_equal(actual, expected):
+    """Compares an argument of a call to the argument a double was declared with.
+
+    :param object actual: The argument of the call.
+    :param object expected: The declared argument.
+    :rtype: bool
+    """
+
+    if actual is expected:
+        return True
+
+    check = equality_check_for(type(expected)) or equality_check_for(type(actual))
+    if check is None:
+        return actual == expected or expected == actual
+
+    return check(actual, expected)
+
+
+def buffers_equal(actual, expected):
+    """Compares objects supporting the buffer protocol without copying their contents.
+
+    Values are compared the way ``memoryview`` compares them: by shape and by the value of each
+    item.
+
+    :rtype: bool
+    """
+
+    if isinstance(actual, _BYTE_STRING_TYPES) and isinstance(
+        expected, _BYTE_STRING_TYPES
+    ):
+        return actual == expected
+
+    try:
+        actual_view = memoryview(actual)
+    except TypeError:
+        return False
+
+    with actual_view:
+        try:
+            expected_view = memoryview(expected)
+        except TypeError:
+            return False
+
+        with expected_view:
+            if (
+                actual_view.format == expected_view.format
+                and actual_view.format in _BYTEWISE_FORMATS
+                and actual_view.shape == expected_view.shape
+                and actual_view.c_contiguous
+                and expected_view.c_contiguous
+            ):
+                return _bytes_equal(actual_view, expected_view)
+
+            return actual_view == expected_view
+
+
+def _bytes_equal(actual_view, expected_view):
+    """Compares the bytes of two contiguous buffers of the same size.
+
+    ``memoryview`` compares items one at a time, so most of the bytes are compared as 8 byte words
+    to compare 8 times fewer items.
+
+    :param memoryview actual_view: The first buffer.
+    :param memoryview expected_view: The second buffer.
+    :rtype: bool
+    """
+
+    actual_bytes = actual_view.cast("B")
+    expected_bytes = expected_view.cast("B")
+    words_end = len(actual_bytes) // 8 * 8
+
+    return (
+        actual_bytes[:words_end].cast("Q") == expected_bytes[:words_end].cast("Q")
+        and actual_bytes[words_end:] == expected_bytes[words_end:]
+    )
+
+
+def arrays_equal(actual, expected):
+    """Compares two NumPy arrays by shape, dtype and contents.
+
+    :rtype: bool
+    """
+
+    numpy = sys.modules["numpy"]
+
+    if not (isinstance(actual, numpy.ndarray) and isinstance(expected, numpy.ndarray)):
+        return False
+    elif actual.shape != expected.shape or actual.dtype != expected.dtype:
+        return False
+
+    return bool(numpy.array_equal(actual, expected))
+
+
+class ArrayClose(object):
+    """A declared argument matching NumPy arrays of the same shape with values close to its own."""
+
+    __slots__ = ("_expected", "_rtol", "_atol", "_equal_nan")
+
+    def __init__(self, expected, rtol, atol, equal_nan):
+        """
+        :param ndarray expected: The array to compare to.
+        :param float rtol: The relative tolerance.
+        :param float atol: The absolute tolerance.
+        :param bool equal_nan: Whether NaNs are equal to each other.
+        """
+
+        self._expected = expected
+        self._rtol = rtol
+        self._atol = atol
+        self._equal_nan = equal_nan
+
+    def matches(self, actual):
+        """Returns whether an array is close to the expected one.
+
+        :rtype: bool
+        """
+
+        numpy = sys.modules["numpy"]
+
+        return (
+            isinstance(actual, numpy.ndarray)
+            and actual.shape == self._expected.shape
+            and bool(
+                numpy.allclose(
+                    actual,
+                    self._expected,
+                    rtol=self._rtol,
+                    atol=self._atol,
+                    equal_nan=self._equal_nan,
+                )
+            )
+        )
+
+    def __repr__(self):
+        return "array_close({!r}, rtol={!r}, atol={!r})".format(
+            self._expected, self._rtol, self._atol
+        )
+
+
+def array_close(expected, rtol=1e-05, atol=1e-08, equal_nan=False):
+    """Declares an argument matching NumPy arrays whose values are close to those of an array::
+
+        allow(model).predict.with_args(array_close(features, atol=1e-6))
+
+    Arrays match if they have the same shape and ``numpy.allclose`` accepts them.
+
+    :param ndarray expected: The array to compare to.
+    :param float rtol: The relative tolerance.
+    :param float atol: The absolute tolerance.
+    :param bool equal_nan: Whether NaNs are equal to each other.
+    :rtype: ArrayClose
+    """
+
+    return ArrayClose(expected, rtol, atol, equal_nan)
+
+
+def _array_close_matches(actual, expected):
+    if isinstance(expected, ArrayClose):
+        return expected.matches(actual)
+
+    return actual.matches(expected)
+
+
+def _register_numpy():
+    """Registers the NumPy equality check, once NumPy has been imported by the code under test."""
+
+    global _numpy_registered
+
+    _numpy_registered = True
+    register_equality(sys.modules["numpy"].ndarray, arrays_equal)
+
+
+for _buffer_type in (bytearray, memoryview, array):
+    register_equality(_buffer_type, buffers_equal)
+register_equality(ArrayClose, _array_close_matches)
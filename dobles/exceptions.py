@@ -66,6 +66,36 @@ class VerifyingBuiltinDoubleArgumentError(VerifyingDoubleArgumentError):
     pass
 
 
+class VerifyingDoubleGroupError(AssertionError):
+    """
+    An exception raised when attempting to double several methods at once, some of which do not
+    exist on the real object or are declared with arguments that do not match their signature.
+    """
+
+    def __init__(self, errors, doubled_obj):
+        """
+        :param dict errors: The ``VerifyingDoubleError`` or ``VerifyingDoubleArgumentError`` of
+            each method that could not be doubled, keyed by method name.
+        :param object doubled_obj: The real object being doubled.
+        """
+
+        self.errors = errors
+        self._doubled_obj = doubled_obj
+        self.args = (errors, doubled_obj)
+
+    def __str__(self):
+        return "Cannot double {} of {}:\n{}".format(
+            "{} method{}".format(
+                len(self.errors), "" if len(self.errors) == 1 else "s"
+            ),
+            self._doubled_obj,
+            "\n".join(
+                "    {}: {}".format(method_name, error)
+                for method_name, error in self.errors.items()
+            ),
+        )
+
+
 class VerifyingDoubleImportError(AssertionError):
     """
     An exception raised when attempting to create a verifying double from an invalid module path.
@@ -4,14 +4,17 @@ from dobles.allowance import Allowance
 class Expectation(Allowance):
     """An individual method expectation (mock)."""
 
-    def __init__(self, target, method_name, caller):
+    __slots__ = ()
+
+    def __init__(self, target, method_name, caller, revision):
         """
         :param Target target: The object owning the method to mock.
         :param str method_name: The name of the method to mock.
-        :param tuple caller: Details of the stack frame where the expectation was made.
+        :param Caller caller: Where the expectation was declared.
+        :param Revision revision: Bumped whenever the arguments the expectation accepts change.
         """
 
-        super(Expectation, self).__init__(target, method_name, caller)
+        super(Expectation, self).__init__(target, method_name, caller, revision)
         self._is_satisfied = False
 
     def satisfy_any_args_match(self):
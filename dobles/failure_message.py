@@ -0,0 +1,123 @@
+import reprlib
+
+DEFAULT_MAX_REPR_LENGTH = 1000
+
+
+def build_argument_repr_string(args, kwargs, repr=repr):
+    """Describes the arguments of a call.
+
+    :param tuple args: The positional arguments.
+    :param dict kwargs: The keyword arguments.
+    :param func repr: The function used to describe each argument.
+    :rtype: str
+    """
+
+    args = [repr(x) for x in args]
+    kwargs = ["{}={}".format(k, repr(v)) for k, v in kwargs.items()]
+    return "({})".format(", ".join(args + kwargs))
+
+
+class BoundedRepr(reprlib.Repr):
+    """
+    A ``reprlib.Repr`` that cuts the repr of an object off in the middle once it is longer than a
+    number of characters. Large strings and bytes are sliced before they are described, and only
+    the first 20 items of containers, nested up to 3 levels deep, are described at all.
+    """
+
+    def __init__(self, max_length):
+        """
+        :param int max_length: The number of characters after which reprs are cut off.
+        """
+
+        super(BoundedRepr, self).__init__()
+        self.max_length = max_length
+        self.maxlevel = 3
+        self.maxstring = self.maxlong = self.maxother = max_length
+        self.maxtuple = self.maxlist = self.maxarray = 20
+        self.maxdict = self.maxset = self.maxfrozenset = self.maxdeque = 20
+
+    def repr(self, x):
+        return self.shorten(super(BoundedRepr, self).repr(x))
+
+    def repr_bytes(self, x, level):
+        return self.repr_str(x, level)
+
+    def shorten(self, text):
+        """Cuts text off in the middle, as ``reprlib`` does, if it is longer than the maximum.
+
+        :param str text: The text to shorten.
+        :rtype: str
+        """
+
+        if len(text) <= self.max_length:
+            return text
+
+        head = max(0, (self.max_length - 3) // 2)
+        tail_start = len(text) - max(0, self.max_length - 3 - head)
+        return text[:head] + "..." + text[tail_start:]
+
+
+class ReprOf(object):
+    """An object to describe in a ``FailureMessage``."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def render(self, bounded_repr):
+        return bounded_repr.repr(self._obj)
+
+
+class ArgumentsOf(object):
+    """The arguments of a call to describe in a ``FailureMessage``."""
+
+    __slots__ = ("_args", "_kwargs")
+
+    def __init__(self, args, kwargs):
+        self._args = args
+        self._kwargs = kwargs
+
+    def render(self, bounded_repr):
+        return build_argument_repr_string(self._args, self._kwargs, bounded_repr.repr)
+
+
+class FailureMessage(object):
+    """
+    The message of a failed verification, formatted only once it is rendered. Objects in the
+    message are described by ``ReprOf`` and ``ArgumentsOf`` values, whose reprs are cut off after
+    the maximum repr length of the space the failure occurred in, so arguments with huge or slow
+    reprs only cost anything when a message is actually shown.
+    """
+
+    __slots__ = ("_template", "_values", "_max_repr_length", "_rendered")
+
+    def __init__(self, template, *values, max_repr_length=DEFAULT_MAX_REPR_LENGTH):
+        """
+        :param str template: The message, with a ``{}`` placeholder for each value.
+        :param values: The values to format the template with.
+        :param int max_repr_length: The number of characters after which reprs are cut off.
+        """
+
+        self._template = template
+        self._values = values
+        self._max_repr_length = max_repr_length
+        self._rendered = None
+
+    def __str__(self):
+        if self._rendered is None:
+            bounded_repr = BoundedRepr(self._max_repr_length)
+            self._rendered = self._template.format(
+                *(
+                    value.render(bounded_repr)
+                    if isinstance(value, (ReprOf, ArgumentsOf))
+                    else value
+                    for value in self._values
+                )
+            )
+            self._values = ()
+
+        return self._rendered
+
+    def __repr__(self):
+        return repr(str(self))
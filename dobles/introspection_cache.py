@@ -0,0 +1,215 @@
+"""
+An optional on-disk cache of class introspection results, shared by every process that runs a test
+suite (e.g. pytest-xdist workers). Enabled by the pytest plugin with ``--dobles-cache``.
+
+Classifying the attributes of a class is by far the most expensive introspection dobles does. The
+slow part is finding the class that defines each attribute and its kind, so what gets persisted is
+the description ``target.describe_class_attrs`` produces from ``inspect.classify_class_attrs``:
+the kind of each attribute, its defining class and where its object was found. The objects
+themselves are looked up from the live class.
+
+Entries are stored in one JSON file per module, keyed by the qualified name of the class. Each
+entry records a digest of the source files of every module in the class's MRO, as well as the
+names in each of those classes' namespaces, and is discarded if either no longer matches.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+# Part of the key of every entry, so that entries written in an older format are never read.
+_FORMAT_VERSION = b"2"
+
+_directory = None
+_modules = {}
+# The qualified names of the classes with new entries, keyed by module name.
+_dirty_entries = {}
+_file_digests = {}
+
+
+def enable(directory):
+    """Start reading and writing cache entries in a directory.
+
+    :param str directory: The directory to store the cache files in. Must exist.
+    """
+
+    global _directory
+
+    _directory = str(directory)
+    _modules.clear()
+    _dirty_entries.clear()
+
+
+def disable():
+    """Save any new cache entries and stop using the cache."""
+
+    global _directory
+
+    if _directory is not None:
+        save()
+
+    _directory = None
+    _modules.clear()
+    _dirty_entries.clear()
+
+
+def is_enabled():
+    """Determines if the cache is in use.
+
+    :rtype: bool
+    """
+
+    return _directory is not None
+
+
+def save():
+    """Write the entries of every module that has new ones to disk.
+
+    The new entries are merged into the ones on disk just before the file is replaced, so that
+    processes adding entries for the same module don't discard each other's. Files are replaced
+    atomically so concurrent processes never read partial files. Errors are ignored, since the
+    cache is only an optimization.
+    """
+
+    for module_name, qualnames in _dirty_entries.items():
+        entries = _read_entries(module_name)
+        for qualname in qualnames:
+            entries[qualname] = _modules[module_name][qualname]
+
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=_directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(temp_path, _module_path(module_name))
+        except OSError:
+            pass
+
+    _dirty_entries.clear()
+
+
+def load_class_attrs(cls, classes):
+    """Look up the description of the attributes of a class in the cache.
+
+    :param type cls: The class to look up.
+    :param tuple classes: The classes in the MRO of ``cls`` and of its metaclass.
+    :return: The description ``target.describe_class_attrs`` produced for the class, or None if
+        there is no valid entry for the class.
+    :rtype: dict, None
+    """
+
+    key = _entry_key(cls, classes)
+    if key is None:
+        return None
+
+    entry = _entries_for(cls.__module__).get(cls.__qualname__)
+    if entry is None or entry["key"] != key:
+        return None
+    if entry["namespaces"] != [list(klass.__dict__) for klass in classes]:
+        return None
+
+    return entry["attrs"]
+
+
+def store_class_attrs(cls, classes, described):
+    """Save the description of the attributes of a class to the cache.
+
+    :param type cls: The class the attributes belong to.
+    :param tuple classes: The classes in the MRO of ``cls`` and of its metaclass.
+    :param dict described: The result of ``target.describe_class_attrs`` for the class.
+    """
+
+    key = _entry_key(cls, classes)
+    if key is None:
+        return
+
+    _entries_for(cls.__module__)[cls.__qualname__] = {
+        "key": key,
+        "namespaces": [list(klass.__dict__) for klass in classes],
+        "attrs": described,
+    }
+    _dirty_entries.setdefault(cls.__module__, set()).add(cls.__qualname__)
+
+
+def _entry_key(cls, classes):
+    """Computes the digest an entry for a class must have to be valid.
+
+    :param type cls: The class to key.
+    :param tuple classes: The classes in the MRO of ``cls`` and of its metaclass.
+    :return: A digest of the source of every module in the MRO, or None if the class can't be
+        cached because it isn't reachable by its qualified name.
+    :rtype: str, None
+    """
+
+    if _directory is None or "<locals>" in cls.__qualname__:
+        return None
+
+    obj = sys.modules.get(cls.__module__)
+    for part in cls.__qualname__.split("."):
+        obj = getattr(obj, part, None)
+    if obj is not cls:
+        return None
+
+    digest = hashlib.sha1(_FORMAT_VERSION)
+    digest.update(sys.version.encode())
+    for klass in classes:
+        digest.update(klass.__module__.encode())
+        digest.update(klass.__qualname__.encode())
+        digest.update(_file_digest(klass.__module__))
+
+    return digest.hexdigest()
+
+
+def _file_digest(module_name):
+    """Returns a digest of the source file of a module.
+
+    :param str module_name: The name of the module.
+    :return: The digest, or an empty one for modules without a source file.
+    :rtype: bytes
+    """
+
+    if module_name not in _file_digests:
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+        try:
+            with open(path, "rb") as f:
+                _file_digests[module_name] = hashlib.sha1(f.read()).digest()
+        except (OSError, TypeError):
+            _file_digests[module_name] = b""
+
+    return _file_digests[module_name]
+
+
+def _module_path(module_name):
+    return os.path.join(_directory, module_name + ".json")
+
+
+def _entries_for(module_name):
+    """Returns the cache entries of a module, reading them from disk the first time.
+
+    :param str module_name: The name of the module.
+    :return: The entries, keyed by qualified name.
+    :rtype: dict
+    """
+
+    if module_name not in _modules:
+        _modules[module_name] = _read_entries(module_name)
+
+    return _modules[module_name]
+
+
+def _read_entries(module_name):
+    """Reads the cache entries of a module from disk.
+
+    :param str module_name: The name of the module.
+    :return: The entries, keyed by qualified name, or an empty dict if there is no valid file.
+    :rtype: dict
+    """
+
+    try:
+        with open(_module_path(module_name)) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    return entries if isinstance(entries, dict) else {}
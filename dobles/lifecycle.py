@@ -1,27 +1,143 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
 from threading import local
 
+from dobles.call_history import DEFAULT_CAPACITY
+from dobles.failure_message import DEFAULT_MAX_REPR_LENGTH
 from dobles.space import Space
 
 _thread_local_data = local()
+_context_space = ContextVar("dobles_context_space", default=None)
+# The spaces of the active ``Layer``s, oldest first. Shared by every thread.
+_layer_spaces = []
+# The length after which failure messages cut off descriptions of objects. Kept for the whole
+# session rather than per ``Space``, so that it survives teardown.
+_max_repr_length = DEFAULT_MAX_REPR_LENGTH
+# The number of calls each doubled method remembers, kept for the whole session like
+# ``_max_repr_length``.
+_call_history_capacity = DEFAULT_CAPACITY
 
 
 def current_space():
-    """An accessor for the current thread's active ``Space``.
+    """An accessor for the active ``Space``.
+
+    This is the space of the enclosing ``isolated_space`` block if there is one, and the current
+    thread's space otherwise.
 
     :return: The active ``Space``.
     :rtype: Space
     """
 
+    space = _context_space.get()
+    if space is not None:
+        return space
+
     if not hasattr(_thread_local_data, "current_space"):
-        _thread_local_data.current_space = Space()
+        _thread_local_data.current_space = Space(_layer_spaces)
 
     return _thread_local_data.current_space
 
 
+def _existing_space():
+    """Returns the active ``Space`` without creating one.
+
+    :return: The active ``Space``, if there is one.
+    :rtype: Space, None
+    """
+
+    space = _context_space.get()
+    if space is not None:
+        return space
+
+    return getattr(_thread_local_data, "current_space", None)
+
+
+@contextmanager
+def isolated_space():
+    """Gives the enclosed code its own ``Space``.
+
+    The space is stored in a context variable rather than per thread, so each asyncio task that
+    enters an ``isolated_space`` gets its own, and tasks it spawns share it. Test bodies can then
+    run concurrently on one event loop without their dobles interfering::
+
+        async def run(test_body):
+            with isolated_space():
+                await test_body()
+
+        await asyncio.gather(*(run(test_body) for test_body in test_bodies))
+
+    Expectations are verified when the block completes without an exception, and every double
+    declared in it is torn down when it exits either way. Note that doubling an object modifies
+    the object itself, so concurrent blocks must not double the same objects.
+    """
+
+    token = _context_space.set(Space(_layer_spaces))
+    try:
+        yield
+        verify()
+    finally:
+        teardown()
+        _context_space.reset(token)
+
+
+class Layer(object):
+    """
+    A set of dobles that stays installed across tests, so that module or session scoped fixtures
+    can double objects once instead of in every test::
+
+        @pytest.fixture(scope="session", autouse=True)
+        def stubbed_client():
+            layer = Layer()
+            with layer:
+                allow(Client).fetch.and_return("cached value")
+            yield
+            layer.teardown()
+
+    Dobles declared inside a ``with`` block belong to the layer. Tests are layered over every
+    active layer: their own allowances take priority over the layer's, and are discarded at
+    teardown without restoring the methods the layer doubled. The call counts of the layer's own
+    dobles accumulate over all tests, and its expectations are only checked by ``verify``, but
+    ``received`` only reports the calls made since the layer's setup or the previous teardown.
+
+    The dobles of a layer must not change while tests are layered over it, i.e. outside of the
+    setup of the fixture that owns it. Layers are shared by every thread.
+    """
+
+    def __init__(self):
+        self._space = Space(list(_layer_spaces))
+        self._tokens = []
+        _layer_spaces.append(self._space)
+
+    def __enter__(self):
+        self._tokens.append(_context_space.set(self._space))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _context_space.reset(self._tokens.pop())
+        self._space.forget_calls()
+
+    def verify(self):
+        """Verifies the expectations declared in the layer.
+
+        :raise: ``MockExpectationError`` on the first expectation that is not satisfied, if any.
+        """
+
+        self._space.verify()
+
+    def teardown(self):
+        """Removes the layer and restores the objects it doubled."""
+
+        _layer_spaces.remove(self._space)
+        self._space.teardown()
+
+
 def teardown():
     """Tears down the current dobles environment. Must be called after each test case."""
-    if hasattr(_thread_local_data, "current_space"):
+    space = _context_space.get()
+    if space is not None:
+        space.teardown()
+        _context_space.set(Space(_layer_spaces))
+    elif hasattr(_thread_local_data, "current_space"):
         _thread_local_data.current_space.teardown()
         del _thread_local_data.current_space
 
@@ -32,10 +148,10 @@ def clear(*objects_to_clear):
     :param object objects_to_clear: The objects to remove allowances and
     expectations from.
     """
-    if not hasattr(_thread_local_data, "current_space"):
+    space = _existing_space()
+    if space is None:
         return
 
-    space = current_space()
     for obj in objects_to_clear:
         space.clear(obj)
 
@@ -47,8 +163,9 @@ def verify():
     test case, but before teardown.
     """
 
-    if hasattr(_thread_local_data, "current_space"):
-        _thread_local_data.current_space.verify()
+    space = _existing_space()
+    if space is not None:
+        space.verify()
 
 
 @contextmanager
@@ -65,6 +182,55 @@ def no_builtin_verification():
     current_space().skip_builtin_verification = False
 
 
+def set_call_history_capacity(capacity):
+    """Sets how many calls each doubled method remembers for ``received``.
+
+    Calls are not recorded by default. Applies to methods doubled from then on, in every thread,
+    until it is set again, e.g. when called from a ``conftest.py``. Only the most recent calls are
+    kept, and a capacity of 0 turns call recording back off.
+
+    :param int capacity: The number of calls to remember per method.
+    """
+
+    global _call_history_capacity
+
+    _call_history_capacity = capacity
+
+
+def call_history_capacity():
+    """The number of calls each doubled method remembers for ``received``.
+
+    :rtype: int
+    """
+
+    return _call_history_capacity
+
+
+def set_max_repr_length(length):
+    """Sets the length after which the description of an object in a failure message is cut off.
+
+    Applies to every failure from then on, in every thread, until it is set again. Pytest runs can
+    set it with the ``--dobles-max-repr-length`` option instead. Longer reprs are cut off in the
+    middle, and strings, bytes and containers are cut short before they are described, so huge
+    arguments stay cheap to report.
+
+    :param int length: The number of characters after which reprs are cut off.
+    """
+
+    global _max_repr_length
+
+    _max_repr_length = length
+
+
+def max_repr_length():
+    """The length after which the description of an object in a failure message is cut off.
+
+    :rtype: int
+    """
+
+    return _max_repr_length
+
+
 def ignore_builtin_verification():
     """Check if we ignoring builtin argument verification errors.
 
@@ -0,0 +1,497 @@
+"""
+Argument matchers, for declaring the arguments of a double by what they look like rather than by
+what they are equal to::
+
+    allow(user).set_name.with_args(matches_regex(r"^[A-Z]"))
+    allow(cache).put.with_args(instance_of(str), between(0, 60) | None)
+
+Matchers can be used in any ``with_args`` position, and nested in each other and in
+``any_of``, ``all_of`` and ``not_``. The matchers of an allowance are combined into a single
+predicate when it is declared. Arguments that can't be compared to the values of a matcher, such as
+containers of NumPy arrays, don't match it rather than raising.
+"""
+
+import math
+import re
+import sys
+from collections.abc import Container, Iterable, Mapping, Set
+from numbers import Complex, Real
+
+from dobles.equality import register_equality, values_equal
+
+# Number ABCs, preceded by the builtin types that implement them so that isinstance checks for the
+# most common numbers don't go through the slower ABC machinery.
+_REAL_TYPES = (int, float, Real)
+_COMPLEX_TYPES = (int, float, complex, Complex)
+_MAX_FLOAT = sys.float_info.max
+
+
+def _predicate_for(value):
+    """Returns a function telling whether an argument matches a matcher or equals a value.
+
+    :param object value: A ``Matcher`` or a value to compare arguments to.
+    :rtype: func
+    """
+
+    if isinstance(value, Matcher):
+        return value.predicate
+
+    def predicate(argument):
+        try:
+            return bool(values_equal(argument, value))
+        except Exception:
+            return False
+
+    return predicate
+
+
+def _is_hashable(value):
+    return getattr(type(value), "__hash__", None) is not None
+
+
+class Matcher(object):
+    """
+    Matches the arguments of a call. ``predicate`` is a function of one argument that returns
+    whether the argument matches, and never raises. Matchers can be combined with ``|``, ``&``
+    and ``~``.
+    """
+
+    __slots__ = ("predicate",)
+
+    def __or__(self, other):
+        return any_of(self, other)
+
+    def __ror__(self, other):
+        return any_of(other, self)
+
+    def __and__(self, other):
+        return all_of(self, other)
+
+    def __rand__(self, other):
+        return all_of(other, self)
+
+    def __invert__(self):
+        return not_(self)
+
+
+class AnyOfType(Matcher):
+    """Matches arguments whose type is exactly one of the given types."""
+
+    __slots__ = ("_types",)
+
+    def __init__(self, types):
+        self._types = types
+        type_set = frozenset(types)
+        self.predicate = lambda argument: type(argument) in type_set
+
+    def __repr__(self):
+        return "any_of_type({})".format(", ".join(t.__name__ for t in self._types))
+
+
+class InstanceOf(Matcher):
+    """Matches instances of any of the given classes or their subclasses."""
+
+    __slots__ = ("_classes",)
+
+    def __init__(self, classes):
+        self._classes = classes
+        self.predicate = lambda argument: isinstance(argument, classes)
+
+    def __repr__(self):
+        return "instance_of({})".format(", ".join(c.__name__ for c in self._classes))
+
+
+class MatchesRegex(Matcher):
+    """Matches strings containing a match for a regular expression."""
+
+    __slots__ = ("_pattern",)
+
+    def __init__(self, pattern):
+        self._pattern = pattern
+        search = pattern.search
+        string_type = type(pattern.pattern)
+        self.predicate = lambda argument: (
+            isinstance(argument, string_type) and search(argument) is not None
+        )
+
+    def __repr__(self):
+        return "matches_regex({!r})".format(self._pattern.pattern)
+
+
+class Between(Matcher):
+    """Matches values that lie within a range."""
+
+    __slots__ = ("_low", "_high", "_inclusive")
+
+    def __init__(self, low, high, inclusive):
+        self._low = low
+        self._high = high
+        self._inclusive = inclusive
+        # Only values comparable to the bounds are compared, so comparisons never raise. Other
+        # than numbers, that is only values of the exact types of the bounds, since subclasses
+        # such as ``datetime`` may refuse to be compared to instances of their base class.
+        number_bounds = isinstance(low, Real) and isinstance(high, Real)
+        bound_types = frozenset([type(low), type(high)])
+        if not number_bounds:
+            # Raises if the bounds can't be compared, rather than when the matcher is used.
+            low <= high
+
+        def is_comparable(argument):
+            if number_bounds:
+                return isinstance(argument, _REAL_TYPES)
+
+            return type(argument) in bound_types
+
+        if inclusive:
+            self.predicate = lambda argument: (
+                is_comparable(argument) and low <= argument <= high
+            )
+        else:
+            self.predicate = lambda argument: (
+                is_comparable(argument) and low < argument < high
+            )
+
+    def __repr__(self):
+        if self._inclusive:
+            return "between({!r}, {!r})".format(self._low, self._high)
+
+        return "between({!r}, {!r}, inclusive=False)".format(self._low, self._high)
+
+
+class Contains(Matcher):
+    """
+    Matches containers that contain all of the given items. Matchers among the items match
+    iterables with at least one item matching them.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items):
+        self._items = items
+        item_checks = tuple(
+            item.predicate for item in items if isinstance(item, Matcher)
+        )
+        items = tuple(item for item in items if not isinstance(item, Matcher))
+        # Strings only contain strings, and sets and mappings can only contain hashable items.
+        # Containers that would raise when asked for an item never match instead.
+        text_types = tuple(
+            text_type
+            for text_type in (str, (bytes, bytearray))
+            if all(isinstance(item, text_type) for item in items)
+        )
+        hashing_types = (Set, Mapping) if all(map(_is_hashable, items)) else ()
+
+        def predicate(argument):
+            if isinstance(argument, (str, bytes, bytearray)):
+                if not isinstance(argument, text_types):
+                    return False
+            elif isinstance(argument, (Set, Mapping)):
+                if not isinstance(argument, hashing_types):
+                    return False
+            elif not isinstance(argument, Container):
+                return False
+
+            try:
+                for item in items:
+                    if item not in argument:
+                        return False
+
+                if item_checks:
+                    if not isinstance(argument, Iterable):
+                        return False
+
+                    for check in item_checks:
+                        if not any(map(check, argument)):
+                            return False
+            except Exception:
+                # Comparing items such as NumPy arrays with ``==`` may raise.
+                return False
+
+            return True
+
+        self.predicate = predicate
+
+    def __repr__(self):
+        return "contains({})".format(", ".join(map(repr, self._items)))
+
+
+class Approximately(Matcher):
+    """Matches numbers close to a value."""
+
+    __slots__ = ("_value", "_rel_tol", "_abs_tol")
+
+    def __init__(self, value, rel_tol, abs_tol):
+        self._value = value
+        self._rel_tol = rel_tol
+        self._abs_tol = abs_tol
+        if isinstance(value, Real):
+            number_types, is_close = _REAL_TYPES, math.isclose
+        else:
+            number_types, is_close = _COMPLEX_TYPES, _complex_isclose
+
+        # Numbers too large to be converted to a float, such as huge ints, are never close.
+        self.predicate = lambda argument: (
+            isinstance(argument, number_types)
+            and _fits_in_a_float(argument)
+            and is_close(argument, value, rel_tol=rel_tol, abs_tol=abs_tol)
+        )
+
+    def __repr__(self):
+        return "approximately({!r}, rel_tol={!r}, abs_tol={!r})".format(
+            self._value, self._rel_tol, self._abs_tol
+        )
+
+
+def _fits_in_a_float(number):
+    """Returns whether a number can be converted to a float or complex without overflowing.
+
+    :param Complex number: The number.
+    :rtype: bool
+    """
+
+    return (
+        type(number) is float
+        or not isinstance(number, Real)
+        or -_MAX_FLOAT <= number <= _MAX_FLOAT
+    )
+
+
+def _complex_isclose(a, b, rel_tol, abs_tol):
+    return abs(a - b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
+
+
+class ContainsEntries(Matcher):
+    """Matches mappings that contain the given keys, with values matching the given ones."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries):
+        self._entries = entries
+        checks = tuple((key, _predicate_for(value)) for key, value in entries.items())
+
+        def predicate(argument):
+            if not isinstance(argument, Mapping):
+                return False
+
+            for key, check in checks:
+                if key not in argument or not check(argument[key]):
+                    return False
+
+            return True
+
+        self.predicate = predicate
+
+    def __repr__(self):
+        return "contains_entries({{{}}})".format(
+            ", ".join(
+                "{!r}: {!r}".format(key, value) for key, value in self._entries.items()
+            )
+        )
+
+
+class AnyOf(Matcher):
+    """Matches arguments matching any of the given matchers or values."""
+
+    __slots__ = ("_options",)
+
+    def __init__(self, options):
+        self._options = options
+        checks = tuple(map(_predicate_for, options))
+        self.predicate = lambda argument: any(check(argument) for check in checks)
+
+    def __repr__(self):
+        return "any_of({})".format(", ".join(map(repr, self._options)))
+
+
+class AllOf(Matcher):
+    """Matches arguments matching all of the given matchers or values."""
+
+    __slots__ = ("_requirements",)
+
+    def __init__(self, requirements):
+        self._requirements = requirements
+        checks = tuple(map(_predicate_for, requirements))
+        self.predicate = lambda argument: all(check(argument) for check in checks)
+
+    def __repr__(self):
+        return "all_of({})".format(", ".join(map(repr, self._requirements)))
+
+
+class Not(Matcher):
+    """Matches arguments that do not match a matcher or value."""
+
+    __slots__ = ("_negated",)
+
+    def __init__(self, negated):
+        self._negated = negated
+        check = _predicate_for(negated)
+        self.predicate = lambda argument: not check(argument)
+
+    def __repr__(self):
+        return "not_({!r})".format(self._negated)
+
+
+def any_of_type(*types):
+    """Matches arguments whose type is exactly one of the given types.
+
+    :param type types: The types to accept.
+    :rtype: Matcher
+    """
+
+    return AnyOfType(types)
+
+
+def instance_of(*classes):
+    """Matches instances of any of the given classes or their subclasses.
+
+    :param type classes: The classes to accept.
+    :rtype: Matcher
+    """
+
+    return InstanceOf(classes)
+
+
+def matches_regex(pattern, flags=0):
+    """Matches strings containing a match for a regular expression, as ``re.search`` finds them.
+
+    :param pattern: The regular expression, as a string or compiled pattern.
+    :param int flags: Flags to compile the pattern with.
+    :rtype: Matcher
+    """
+
+    return MatchesRegex(re.compile(pattern, flags))
+
+
+def between(low, high, inclusive=True):
+    """Matches values that lie within a range.
+
+    :param object low: The lower bound.
+    :param object high: The upper bound.
+    :param bool inclusive: Whether the bounds themselves match.
+    :rtype: Matcher
+    :raise: ``TypeError`` if the bounds can't be compared to each other.
+    """
+
+    return Between(low, high, inclusive)
+
+
+def contains(*items):
+    """Matches containers that contain all of the given items, as ``in`` finds them.
+
+    :param object items: The items to look for.
+    :rtype: Matcher
+    """
+
+    return Contains(items)
+
+
+def approximately(value, rel_tol=1e-09, abs_tol=0.0):
+    """Matches numbers close to a value, as ``math.isclose`` compares them.
+
+    :param number value: The value to compare to.
+    :param float rel_tol: The relative tolerance.
+    :param float abs_tol: The absolute tolerance.
+    :rtype: Matcher
+    """
+
+    return Approximately(value, rel_tol, abs_tol)
+
+
+def contains_entries(entries=(), **kwargs):
+    """Matches mappings containing the given keys, whose values match the given ones.
+
+    Values can be matchers themselves. Other keys of the mapping are ignored::
+
+        allow(client).post.with_args(contains_entries(status=between(200, 299)))
+
+    :param dict entries: The entries to look for.
+    :param kwargs: More entries to look for, with string keys.
+    :rtype: Matcher
+    """
+
+    return ContainsEntries(dict(entries, **kwargs))
+
+
+def any_of(*options):
+    """Matches arguments matching any of the given matchers or values.
+
+    :rtype: Matcher
+    """
+
+    return AnyOf(options)
+
+
+def all_of(*requirements):
+    """Matches arguments matching all of the given matchers or values.
+
+    :rtype: Matcher
+    """
+
+    return AllOf(requirements)
+
+
+def not_(negated):
+    """Matches arguments that do not match a matcher or value.
+
+    :rtype: Matcher
+    """
+
+    return Not(negated)
+
+
+def has_matchers(args, kwargs):
+    """Returns whether declared arguments include matchers.
+
+    :param tuple args: The declared positional arguments.
+    :param dict kwargs: The declared keyword arguments.
+    :rtype: bool
+    """
+
+    return any(isinstance(arg, Matcher) for arg in args) or any(
+        isinstance(value, Matcher) for value in kwargs.values()
+    )
+
+
+def compile_arguments(args, kwargs):
+    """Combines declared arguments into a single predicate over the arguments of a call.
+
+    Matchers match the argument in their position, and other values are compared with
+    ``values_equal``. The check of each position is looked up once, when the arguments are
+    declared.
+
+    :param tuple args: The declared positional arguments.
+    :param dict kwargs: The declared keyword arguments.
+    :return: A function taking the args tuple and kwargs dict of a call.
+    :rtype: func
+    """
+
+    arg_count = len(args)
+    arg_checks = tuple(map(_predicate_for, args))
+    kwarg_count = len(kwargs)
+    kwarg_checks = tuple((key, _predicate_for(value)) for key, value in kwargs.items())
+
+    def predicate(call_args, call_kwargs):
+        if len(call_args) != arg_count or len(call_kwargs) != kwarg_count:
+            return False
+
+        for check, argument in zip(arg_checks, call_args):
+            if not check(argument):
+                return False
+
+        for key, check in kwarg_checks:
+            if key not in call_kwargs or not check(call_kwargs[key]):
+                return False
+
+        return True
+
+    return predicate
+
+
+def _matcher_matches(actual, expected):
+    if isinstance(expected, Matcher):
+        return expected.predicate(actual)
+
+    return actual.predicate(expected)
+
+
+register_equality(Matcher, _matcher_matches)
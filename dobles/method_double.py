@@ -1,42 +1,71 @@
+import dobles.lifecycle
 from dobles.allowance import Allowance
+from dobles.call_history import CallHistory, ReceivedCalls
+from dobles.double_index import DoubleIndex
+from dobles.exceptions import MockExpectationError
 from dobles.expectation import Expectation
+from dobles.failure_message import FailureMessage, ReprOf
 from dobles.proxy_method import ProxyMethod
+from dobles.revision import Revision
 from dobles.verification import verify_method
 
 
 class MethodDouble(object):
     """A double of an individual method."""
 
-    def __init__(self, method_name, target):
+    __slots__ = (
+        "_method_name",
+        "_target",
+        "_allowances",
+        "_expectations",
+        "_revision",
+        "_lookup",
+        "_call_history",
+        "_proxy_method",
+    )
+
+    def __init__(self, method_name, target, verify=True):
         """
         :param str method_name: The name of the method to double.
         :param Target target: A ``Target`` object containing the object with the method to double.
+        :param bool verify: Whether to verify that the method may be doubled. Only skipped when
+            ``verify_method`` has already done so.
         """
 
         self._method_name = method_name
         self._target = target
 
-        self._verify_method()
+        if verify:
+            self._verify_method()
 
         self._allowances = []
         self._expectations = []
+        self._revision = Revision()
+        self._lookup = _DoubleLookup(
+            self._allowances, self._expectations, self._revision
+        )
+        self._call_history = CallHistory(dobles.lifecycle.call_history_capacity())
 
         self._proxy_method = ProxyMethod(
             target,
             method_name,
-            lambda args, kwargs: self._find_matching_double(args, kwargs),
+            self._lookup.find_matching_double,
+            self._lookup.find_trivial_allowance,
+            self._revision,
+            self._call_history.record if self._call_history.capacity else None,
         )
 
     def add_allowance(self, caller):
         """Adds a new allowance for the method.
 
-        :param: tuple caller: A tuple indicating where the method was called
+        :param Caller caller: Where the allowance was declared.
         :return: The new ``Allowance``.
         :rtype: Allowance
         """
 
-        allowance = Allowance(self._target, self._method_name, caller)
+        allowance = Allowance(self._target, self._method_name, caller, self._revision)
         self._allowances.insert(0, allowance)
+        self._revision.bump()
         return allowance
 
     def add_expectation(self, caller):
@@ -46,48 +75,134 @@ class MethodDouble(object):
         :rtype: Expectation
         """
 
-        expectation = Expectation(self._target, self._method_name, caller)
+        expectation = Expectation(
+            self._target, self._method_name, caller, self._revision
+        )
         self._expectations.insert(0, expectation)
+        self._revision.bump()
         return expectation
 
+    def received_calls(self):
+        """Returns the calls the method has received, as far as its call history remembers.
+
+        :rtype: ReceivedCalls
+        :raise: ``MockExpectationError`` if calls to the method are not recorded.
+        """
+
+        if not self._call_history.capacity:
+            raise MockExpectationError(
+                FailureMessage(
+                    "Cannot check the calls to '{}' on {}, since calls are not recorded. Turn "
+                    "recording on with set_call_history_capacity before doubling the method.",
+                    self._method_name,
+                    ReprOf(self._target.obj),
+                    max_repr_length=dobles.lifecycle.max_repr_length(),
+                )
+            )
+
+        return ReceivedCalls(self._method_name, self._call_history.calls())
+
     def restore_original_method(self):
         """Removes the proxy method on the target and replaces it with its original value."""
 
         self._proxy_method.restore_original_method()
 
-    def verify(self):
+    def snapshot(self):
+        """Records which allowances and expectations the method has.
+
+        :return: A snapshot for ``restore_snapshot`` and ``verify``.
+        :rtype: tuple
+        """
+
+        return len(self._allowances), len(self._expectations)
+
+    def restore_snapshot(self, snapshot):
+        """Discards the allowances and expectations added since a snapshot was taken, and the
+        calls the method received.
+
+        :param tuple snapshot: A snapshot previously returned by ``snapshot``.
+        """
+
+        allowance_count, expectation_count = snapshot
+        del self._allowances[: len(self._allowances) - allowance_count]
+        del self._expectations[: len(self._expectations) - expectation_count]
+        self._revision.bump()
+        self.forget_calls()
+
+    def forget_calls(self):
+        """Discards the call history of the method."""
+
+        self._call_history.clear()
+
+    def verify(self, snapshot=None):
         """Verifies all expectations on the method.
 
+        :param tuple snapshot: If provided, only the expectations added since this snapshot was
+            taken are verified.
         :raise: ``MockExpectationError`` on the first expectation that is not satisfied, if any.
         """
 
-        for expectation in self._expectations:
+        expectations = self._expectations
+        if snapshot is not None:
+            expectations = expectations[: len(expectations) - snapshot[1]]
+
+        for expectation in expectations:
             if not expectation.is_satisfied():
                 expectation.raise_failure_exception()
 
+    def _verify_method(self):
+        """Verify that a method may be doubled.
+
+        Verifies that the target object has a method matching the name the user is attempting to
+        double.
+
+        :raise: ``VerifyingDoubleError`` if no matching method is found.
+        """
+
+        class_level = self._target.is_class_or_module()
+
+        verify_method(self._target, self._method_name, class_level=class_level)
+
+
+class _DoubleLookup(object):
+    """
+    Finds the allowance or expectation that handles a call to a doubled method. Kept apart from
+    the ``MethodDouble`` so that its ``ProxyMethod`` can call it without referencing the
+    ``MethodDouble``, which would create a reference cycle.
+    """
+
+    __slots__ = (
+        "_allowances",
+        "_expectations",
+        "_allowance_index",
+        "_expectation_index",
+    )
+
+    def __init__(self, allowances, expectations, revision):
+        """
+        :param list allowances: The allowances of the method, newest first.
+        :param list expectations: The expectations of the method, newest first.
+        :param Revision revision: Bumped whenever the dobles of the method change.
+        """
+
+        self._allowances = allowances
+        self._expectations = expectations
+        self._allowance_index = DoubleIndex(allowances, revision)
+        self._expectation_index = DoubleIndex(expectations, revision)
+
     def _find_matching_allowance(self, args, kwargs):
         """Return a matching allowance.
 
-        Returns the first allowance that matches the ones declared. Tries one with specific
-        arguments first, then falls back to an allowance that allows arbitrary arguments.
+        Returns the newest allowance declared with matching arguments or accepting arbitrary
+        arguments, then falls back to allowances with a custom argument matcher.
 
         :return: The matching ``Allowance``, if one was found.
         :rtype: Allowance, None
         """
 
-        for allowance in self._allowances:
-            if allowance.satisfy_exact_match(args, kwargs):
-                return allowance
-
-        for allowance in self._allowances:
-            if allowance.satisfy_custom_matcher(args, kwargs):
-                return allowance
+        return self._allowance_index.find(args, kwargs)
 
-        for allowance in self._allowances:
-            if allowance.satisfy_any_args_match():
-                return allowance
-
-    def _find_matching_double(self, args, kwargs):
+    def find_matching_double(self, args, kwargs):
         """Returns the first matching expectation or allowance.
 
         Returns the first allowance or expectation that matches the ones declared. Tries one
@@ -108,37 +223,32 @@ class MethodDouble(object):
         if allowance:
             return allowance
 
-    def _find_matching_expectation(self, args, kwargs):
-        """Return a matching expectation.
+    def find_trivial_allowance(self):
+        """Return the allowance that handles every call, if there is one.
 
-        Returns the first expectation that matches the ones declared. Tries one with specific
-        arguments first, then falls back to an expectation that allows arbitrary arguments.
+        This is the case when there are no expectations and the newest allowance accepts arbitrary
+        arguments without an upper bound on its call count, since it shadows all older allowances.
 
-        :return: The matching ``Expectation``, if one was found.
-        :rtype: Expectation, None
+        :return: The ``Allowance``, if one was found.
+        :rtype: Allowance, None
         """
 
-        for expectation in self._expectations:
-            if expectation.satisfy_exact_match(args, kwargs):
-                return expectation
+        if self._expectations or not self._allowances:
+            return None
 
-        for expectation in self._expectations:
-            if expectation.satisfy_custom_matcher(args, kwargs):
-                return expectation
+        allowance = self._allowances[0]
 
-        for expectation in self._expectations:
-            if expectation.satisfy_any_args_match():
-                return expectation
+        if allowance.accepts_every_call():
+            return allowance
 
-    def _verify_method(self):
-        """Verify that a method may be doubled.
+    def _find_matching_expectation(self, args, kwargs):
+        """Return a matching expectation.
 
-        Verifies that the target object has a method matching the name the user is attempting to
-        double.
+        Returns the newest expectation declared with matching arguments or accepting arbitrary
+        arguments, then falls back to expectations with a custom argument matcher.
 
-        :raise: ``VerifyingDoubleError`` if no matching method is found.
+        :return: The matching ``Expectation``, if one was found.
+        :rtype: Expectation, None
         """
 
-        class_level = self._target.is_class_or_module()
-
-        verify_method(self._target, self._method_name, class_level=class_level)
+        return self._expectation_index.find(args, kwargs)
@@ -1,5 +1,6 @@
 from dobles.exceptions import VerifyingDoubleError
-from dobles.utils import get_module, get_path_components
+from dobles.target import note_class_modified
+from dobles.utils import resolve_path
 
 
 class Patch(object):
@@ -11,8 +12,7 @@ class Patch(object):
         """
         :param str path: The absolute module path to the class.
         """
-        module_path, self._name = get_path_components(target)
-        self.target = get_module(module_path, target)
+        self.target, self._name = resolve_path(target)
         self._capture_original_object()
         self.set_value(None)
 
@@ -30,6 +30,7 @@ class Patch(object):
         """
         self._value = value
         setattr(self.target, self._name, value)
+        note_class_modified(self.target)
 
     def restore_original_object(self):
         """Restore the target to it's original value."""
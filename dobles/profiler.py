@@ -0,0 +1,219 @@
+"""
+Measures the overhead dobles adds to each test. Enabled by the pytest plugin with
+``--dobles-profile``.
+
+While profiling is enabled, the methods that make up each phase of a double's life are replaced
+with timed versions of themselves, so there is no cost at all while it is disabled:
+
+* setup: ``Space.proxy_for``, ``Proxy.add_allowance``, ``Proxy.add_expectation`` and
+  ``Proxy.add_dobles``, as well as ``Allowance.with_args`` and ``Allowance.with_no_args``, which
+  verify the declared arguments against the signature of the method
+* dispatch: ``ProxyMethod.__call__``
+* verify: ``Space.verify``
+* teardown: ``Space.teardown``
+
+Times are inclusive, so e.g. an allowance declared by a side effect of a doubled method counts
+towards both dispatch and setup.
+"""
+
+from functools import wraps
+from inspect import ismodule
+from time import perf_counter
+
+from dobles.allowance import Allowance
+from dobles.proxy import Proxy
+from dobles.proxy_method import ProxyMethod
+from dobles.space import Space
+
+PHASES = ("setup", "dispatch", "verify", "teardown")
+
+_instrumented = []
+_current = None
+_profiles = []
+_methods = {}
+
+
+class Profile(object):
+    """The dobles overhead of a single test."""
+
+    __slots__ = ("name", "durations", "stubs", "calls", "_method_stats")
+
+    def __init__(self, name):
+        """
+        :param str name: The name of the test.
+        """
+
+        self.name = name
+        self.durations = dict.fromkeys(PHASES, 0.0)
+        self.stubs = 0
+        self.calls = 0
+        # Calls and dispatch time keyed by ``ProxyMethod``, until the test is finished.
+        self._method_stats = {}
+
+    @property
+    def total(self):
+        """The time spent in dobles, in seconds.
+
+        :rtype: float
+        """
+
+        return sum(self.durations.values())
+
+
+def enable():
+    """Start profiling. Replaces the profiled methods with timed versions."""
+
+    if _instrumented:
+        return
+
+    _instrument(Space, "proxy_for", "setup")
+    _instrument(Proxy, "add_allowance", "setup", _count_stub)
+    _instrument(Proxy, "add_expectation", "setup", _count_stub)
+    _instrument(Proxy, "add_dobles", "setup", _count_stubs)
+    _instrument(Allowance, "with_args", "setup")
+    _instrument(Allowance, "with_no_args", "setup")
+    _instrument(ProxyMethod, "__call__", "dispatch", _count_call)
+    _instrument(Space, "verify", "verify")
+    _instrument(Space, "teardown", "teardown")
+
+
+def disable():
+    """Stop profiling, restore the profiled methods and discard the results."""
+
+    global _current
+
+    while _instrumented:
+        cls, name, original = _instrumented.pop()
+        setattr(cls, name, original)
+
+    _current = None
+    del _profiles[:]
+    _methods.clear()
+
+
+def is_enabled():
+    """Determines if profiling is in progress.
+
+    :rtype: bool
+    """
+
+    return bool(_instrumented)
+
+
+def start_test(name):
+    """Attribute the overhead measured from now on to a test.
+
+    :param str name: The name of the test.
+    """
+
+    global _current
+
+    _current = Profile(name)
+
+
+def finish_test():
+    """Stop attributing overhead to the current test and record its profile."""
+
+    global _current
+
+    profile, _current = _current, None
+    if profile is None:
+        return
+
+    for proxy_method, (calls, seconds) in profile._method_stats.items():
+        stats = _methods.setdefault(_describe(proxy_method), [0, 0.0])
+        stats[0] += calls
+        stats[1] += seconds
+    profile._method_stats.clear()
+
+    _profiles.append(profile)
+
+
+def slowest_tests(count):
+    """Returns the profiles of the tests with the most dobles overhead.
+
+    :param int count: The number of profiles to return.
+    :rtype: list
+    """
+
+    return sorted(_profiles, key=lambda profile: profile.total, reverse=True)[:count]
+
+
+def hottest_methods(count):
+    """Returns the doubled methods that took the most time to dispatch over all tests.
+
+    :param int count: The number of methods to return.
+    :return: ``(name, calls, seconds)`` tuples.
+    :rtype: list
+    """
+
+    methods = [(name, calls, seconds) for name, (calls, seconds) in _methods.items()]
+    return sorted(methods, key=lambda method: method[2], reverse=True)[:count]
+
+
+def _instrument(cls, name, phase, count=None):
+    """Replaces a method with a version that adds its duration to a phase of the current test.
+
+    :param type cls: The class the method is defined on.
+    :param str name: The name of the method.
+    :param str phase: The phase the method belongs to.
+    :param func count: Called with the current ``Profile``, the instance, the return value and the
+        duration of each call, if provided. The return value is None if the method raised.
+    """
+
+    original = cls.__dict__[name]
+
+    @wraps(original)
+    def timed(self, *args, **kwargs):
+        profile = _current
+        if profile is None:
+            return original(self, *args, **kwargs)
+
+        result = None
+        start = perf_counter()
+        try:
+            result = original(self, *args, **kwargs)
+            return result
+        finally:
+            duration = perf_counter() - start
+            profile.durations[phase] += duration
+            if count is not None:
+                count(profile, self, result, duration)
+
+    _instrumented.append((cls, name, original))
+    setattr(cls, name, timed)
+
+
+def _count_stub(profile, proxy, double, duration):
+    profile.stubs += 1
+
+
+def _count_stubs(profile, proxy, dobles, duration):
+    if dobles is not None:
+        allowances, expectations = dobles
+        profile.stubs += len(allowances) + len(expectations)
+
+
+def _count_call(profile, proxy_method, result, duration):
+    profile.calls += 1
+    stats = profile._method_stats.get(proxy_method)
+    if stats is None:
+        stats = profile._method_stats[proxy_method] = [0, 0.0]
+    stats[0] += 1
+    stats[1] += duration
+
+
+def _describe(proxy_method):
+    """Returns the fully qualified name of a doubled method.
+
+    :param ProxyMethod proxy_method: The proxy of the method.
+    :rtype: str
+    """
+
+    owner = proxy_method._target.doubled_obj_type
+    if ismodule(owner):
+        prefix = owner.__name__
+    else:
+        prefix = "{}.{}".format(owner.__module__, owner.__qualname__)
+
+    return "{}.{}".format(prefix, proxy_method._method_name)
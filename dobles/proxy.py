@@ -1,5 +1,8 @@
+from itertools import chain
+
 from dobles.method_double import MethodDouble
 from dobles.target import Target
+from dobles.verification import verify_specs
 
 
 class Proxy(object):
@@ -7,25 +10,75 @@ class Proxy(object):
     An intermediate object used to maintain a mapping between target objects and method dobles.
     """
 
-    def __init__(self, obj):
+    __slots__ = ("_target", "_method_dobles")
+
+    def __init__(self, obj, on_release=None):
         """
         :param object obj: The object that will be doubled.
+        :param function on_release: Called once ``obj`` has been garbage collected, if it was
+            only weakly referenced. See ``Target``.
         """
 
-        self._target = Target(obj)
+        self._target = Target(obj, on_release)
         self._method_dobles = {}
 
     def add_allowance(self, method_name, caller):
         """Adds a new allowance for the given method name.
 
         :param str method_name: The name of the method to allow.
-        :param tuple caller: A tuple indicating where the allowance was added
+        :param Caller caller: Where the allowance was declared.
         :return: The new ``Allowance``.
         :rtype: Allowance
         """
 
         return self.method_double_for(method_name).add_allowance(caller)
 
+    def add_dobles(self, allowances, expectations, caller, verify=True):
+        """Adds allowances and expectations for several methods at once.
+
+        :param dict allowances: ``AllowanceSpec``s of the allowances, keyed by method name.
+        :param dict expectations: ``AllowanceSpec``s of the expectations, keyed by method name.
+        :param Caller caller: Where the dobles were declared.
+        :param bool verify: Whether to verify every method and the arguments of every spec before
+            any method is doubled. Only skipped for specs already verified against the same type.
+        :return: The new ``Allowance``s and ``Expectation``s, each keyed by method name.
+        :rtype: tuple
+        :raise: ``VerifyingDoubleGroupError`` listing every method that can't be doubled as
+            declared.
+        """
+
+        if verify:
+            verify_specs(
+                self._target,
+                chain(allowances.items(), expectations.items()),
+                self._method_dobles,
+            )
+
+        if expectations:
+            self._target.pin()
+
+        # Everything has been verified up front, so the dobles are declared without verifying.
+        return (
+            {
+                method_name: spec.apply(
+                    self.method_double_for(method_name, verify=False).add_allowance(
+                        caller
+                    ),
+                    verify=False,
+                )
+                for method_name, spec in allowances.items()
+            },
+            {
+                method_name: spec.apply(
+                    self.method_double_for(method_name, verify=False).add_expectation(
+                        caller
+                    ),
+                    verify=False,
+                )
+                for method_name, spec in expectations.items()
+            },
+        )
+
     def add_expectation(self, method_name, caller):
         """Adds a new expectation for the given method name.
 
@@ -34,8 +87,38 @@ class Proxy(object):
         :rtype: Expectation
         """
 
+        self._target.pin()
         return self.method_double_for(method_name).add_expectation(caller)
 
+    def received_calls(self, method_name):
+        """Returns the calls a doubled method has received.
+
+        :param str method_name: The name of the method.
+        :return: The calls, or None if the method was never doubled.
+        :rtype: ReceivedCalls, None
+        """
+
+        method_double = self._method_dobles.get(method_name)
+        if method_double is not None:
+            return method_double.received_calls()
+
+    def is_proxy_for(self, obj):
+        """Determines if this proxy doubles the given object.
+
+        :param object obj: The object to check.
+        :rtype: bool
+        """
+
+        return self._target.obj is obj and not self._target.is_released()
+
+    def is_released(self):
+        """Determines if the doubled object has been garbage collected.
+
+        :rtype: bool
+        """
+
+        return self._target.is_released()
+
     def restore_original_object(self):
         """Remove all stubs from an object.
 
@@ -46,24 +129,66 @@ class Proxy(object):
         for method_double in self._method_dobles.values():
             method_double.restore_original_method()
 
-    def verify(self):
+    def snapshot(self):
+        """Records which methods are doubled and what their dobles are.
+
+        :return: A snapshot for ``restore_snapshot`` and ``verify``.
+        :rtype: dict
+        """
+
+        return {
+            method_name: method_double.snapshot()
+            for method_name, method_double in self._method_dobles.items()
+        }
+
+    def restore_snapshot(self, snapshot):
+        """Discards the dobles added since a snapshot was taken.
+
+        Methods that were doubled when the snapshot was taken stay doubled, and all others are
+        restored to their original values.
+
+        :param dict snapshot: A snapshot previously returned by ``snapshot``.
+        """
+
+        for method_name, method_double in list(self._method_dobles.items()):
+            if method_name in snapshot:
+                method_double.restore_snapshot(snapshot[method_name])
+            else:
+                method_double.restore_original_method()
+                del self._method_dobles[method_name]
+
+    def forget_calls(self):
+        """Discards the call histories of all method dobles."""
+
+        for method_double in self._method_dobles.values():
+            method_double.forget_calls()
+
+    def verify(self, snapshot=None):
         """Verifies all expectations on all method dobles.
 
+        :param dict snapshot: If provided, only the expectations added since this snapshot was
+            taken are verified.
         :raise: ``MockExpectationError`` on the first expectation that is not satisfied, if any.
         """
 
-        for method_double in self._method_dobles.values():
-            method_double.verify()
+        for method_name, method_double in self._method_dobles.items():
+            if snapshot is None:
+                method_double.verify()
+            else:
+                method_double.verify(snapshot.get(method_name, (0, 0)))
 
-    def method_double_for(self, method_name):
+    def method_double_for(self, method_name, verify=True):
         """Returns the method double for the provided method name, creating one if necessary.
 
         :param str method_name: The name of the method to retrieve a method double for.
+        :param bool verify: Whether to verify that the method may be doubled, if it isn't yet.
         :return: The mapped ``MethodDouble``.
         :rtype: MethodDouble
         """
 
         if method_name not in self._method_dobles:
-            self._method_dobles[method_name] = MethodDouble(method_name, self._target)
+            self._method_dobles[method_name] = MethodDouble(
+                method_name, self._target, verify=verify
+            )
 
         return self._method_dobles[method_name]
@@ -1,10 +1,14 @@
 from functools import wraps
 from inspect import isbuiltin
+from threading import get_ident
+from time import time
 from typing import Set
 
-from dobles.allowance import build_argument_repr_string
+import dobles.lifecycle
 from dobles.exceptions import UnallowedMethodCallError
+from dobles.failure_message import ArgumentsOf, FailureMessage, ReprOf
 from dobles.proxy_property import ProxyProperty
+from dobles.target import note_class_modified
 
 
 def double_name(name):
@@ -54,17 +58,46 @@ class ProxyMethod(object):
     restoring the original value to the hijacked object during teardown.
     """
 
-    def __init__(self, target, method_name, find_expectation):
+    __slots__ = (
+        "_target",
+        "_method_name",
+        "_find_expectation",
+        "_find_trivial_allowance",
+        "_revision",
+        "_record_call",
+        "_dispatch",
+        "_attr",
+        "_original_method",
+    )
+
+    def __init__(
+        self,
+        target,
+        method_name,
+        find_expectation,
+        find_trivial_allowance,
+        revision,
+        record_call,
+    ):
         """
         :param Target target: The object to be hijacked.
         :param str method_name: The name of the method to replace.
         :param function find_expectation: A function to call to look for expectations that match
              any provided arguments.
+        :param function find_trivial_allowance: A function to call to look for an allowance that
+             handles every call on its own.
+        :param Revision revision: Bumped whenever the dobles of the method change.
+        :param function record_call: Called with the args, kwargs, thread ident and timestamp of
+             every call, as a tuple. None if calls are not recorded.
         """
 
         self._target = target
         self._method_name = method_name
         self._find_expectation = find_expectation
+        self._find_trivial_allowance = find_trivial_allowance
+        self._revision = revision
+        self._record_call = record_call
+        self._dispatch = (None, None)
         self._attr = target.get_attr(method_name)
 
         self._capture_original_method()
@@ -80,6 +113,16 @@ class ProxyMethod(object):
         :raise: ``UnallowedMethodCallError`` if no matching dobles were found.
         """
 
+        if self._record_call is not None:
+            self._record_call((args, kwargs, get_ident(), time()))
+
+        revision, dispatch = self._dispatch
+        if revision != self._revision.number:
+            dispatch = self._choose_dispatch()
+
+        if dispatch is not None:
+            return dispatch(args, kwargs)
+
         expectation = self._find_expectation(args, kwargs)
 
         if not expectation:
@@ -122,10 +165,12 @@ class ProxyMethod(object):
                 _restore__new__(self._target.obj, self._original_method)
             else:
                 setattr(self._target.obj, self._method_name, self._original_method)
+            note_class_modified(self._target.obj)
         elif self._attr.kind == "property":
             setattr(
                 self._target.obj.__class__, self._method_name, self._original_method
             )
+            note_class_modified(self._target.obj.__class__)
             del self._target.obj.__dict__[double_name(self._method_name)]
         elif self._attr.kind == "attribute":
             self._target.obj.__dict__[self._method_name] = self._original_method
@@ -136,6 +181,26 @@ class ProxyMethod(object):
         if self._method_name in _ATTR_METHODS:
             self._target.restore_attr(self._method_name)
 
+    def _choose_dispatch(self):
+        """Picks how calls are dispatched based on the current dobles of the method.
+
+        When a single allowance handles every call, calls go straight to a function compiled from
+        it. Otherwise each call looks for the matching expectation or allowance.
+
+        The choice is published together with the revision it was made for, so calls from other
+        threads never pair a dispatch function with the wrong revision.
+
+        :return: The compiled dispatch function, if there is one.
+        :rtype: func, None
+        """
+
+        revision = self._revision.number
+        allowance = self._find_trivial_allowance()
+        dispatch = allowance.compile_dispatch() if allowance else None
+        self._dispatch = (revision, dispatch)
+
+        return dispatch
+
     def _capture_original_method(self):
         """Saves a reference to the original value of the method to be doubled."""
 
@@ -146,17 +211,21 @@ class ProxyMethod(object):
 
         if self._target.is_class_or_module():
             setattr(self._target.obj, self._method_name, self)
+            note_class_modified(self._target.obj)
         elif self._attr.kind == "property":
+            self._target.pin()
             proxy_property = ProxyProperty(
                 double_name(self._method_name),
                 self._original_method,
             )
             setattr(self._target.obj.__class__, self._method_name, proxy_property)
+            note_class_modified(self._target.obj.__class__)
             self._target.obj.__dict__[double_name(self._method_name)] = self
         else:
             self._target.obj.__dict__[self._method_name] = self
 
         if self._method_name in _ATTR_METHODS:
+            self._target.pin()
             self._target.hijack_attr(self._method_name)
 
     def _raise_exception(self, args, kwargs):
@@ -166,14 +235,16 @@ class ProxyMethod(object):
         """
 
         error_message = (
-            "Received unexpected call to '{}' on {!r}.  The supplied arguments "
+            "Received unexpected call to '{}' on {}.  The supplied arguments "
             "{} do not match any available allowances."
         )
 
         raise UnallowedMethodCallError(
-            error_message.format(
+            FailureMessage(
+                error_message,
                 self._method_name,
-                self._target.obj,
-                build_argument_repr_string(args, kwargs),
+                ReprOf(self._target.obj),
+                ArgumentsOf(args, kwargs),
+                max_repr_length=dobles.lifecycle.max_repr_length(),
             )
         )
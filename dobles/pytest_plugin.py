@@ -1,6 +1,98 @@
 import pytest
 
-from dobles.lifecycle import teardown, verify
+from dobles import introspection_cache, profiler
+from dobles.failure_message import DEFAULT_MAX_REPR_LENGTH
+from dobles.lifecycle import set_max_repr_length, teardown, verify
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("dobles")
+    group.addoption(
+        "--dobles-cache",
+        action="store_true",
+        default=False,
+        help="Persist class introspection results in the pytest cache directory.",
+    )
+    group.addoption(
+        "--dobles-profile",
+        action="store_true",
+        default=False,
+        help="Measure the time each test spends in dobles and report the slowest tests.",
+    )
+    group.addoption(
+        "--dobles-profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="The number of tests and doubled methods to report with --dobles-profile.",
+    )
+    group.addoption(
+        "--dobles-max-repr-length",
+        type=int,
+        default=None,
+        metavar="N",
+        help="The length after which failure messages cut off descriptions of objects.",
+    )
+
+
+def pytest_configure(config):
+    cache = getattr(config, "cache", None)
+    if config.getoption("dobles_cache") and cache is not None:
+        introspection_cache.enable(cache.mkdir("dobles"))
+    if config.getoption("dobles_profile"):
+        profiler.enable()
+    if config.getoption("dobles_max_repr_length") is not None:
+        set_max_repr_length(config.getoption("dobles_max_repr_length"))
+
+
+def pytest_unconfigure(config):
+    introspection_cache.disable()
+    profiler.disable()
+    set_max_repr_length(DEFAULT_MAX_REPR_LENGTH)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if not profiler.is_enabled():
+        return (yield)
+
+    profiler.start_test(item.nodeid)
+    try:
+        return (yield)
+    finally:
+        profiler.finish_test()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not profiler.is_enabled():
+        return
+
+    top = config.getoption("dobles_profile_top")
+    terminalreporter.write_sep("=", "dobles profile: top {} tests".format(top))
+    terminalreporter.write_line(
+        "{:>9} {:>9} {:>9} {:>9} {:>9} {:>6} {:>7}  test".format(
+            "total ms", *(phase for phase in profiler.PHASES), "stubs", "calls"
+        )
+    )
+    for profile in profiler.slowest_tests(top):
+        terminalreporter.write_line(
+            "{:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>6} {:>7}  {}".format(
+                profile.total * 1e3,
+                *(profile.durations[phase] * 1e3 for phase in profiler.PHASES),
+                profile.stubs,
+                profile.calls,
+                profile.name,
+            )
+        )
+
+    terminalreporter.write_sep(
+        "=", "dobles profile: top {} doubled methods".format(top)
+    )
+    terminalreporter.write_line("{:>9} {:>9}  method".format("total ms", "calls"))
+    for name, calls, seconds in profiler.hottest_methods(top):
+        terminalreporter.write_line(
+            "{:>9.3f} {:>9}  {}".format(seconds * 1e3, calls, name)
+        )
 
 
 @pytest.hookimpl(wrapper=True)
@@ -0,0 +1,16 @@
+class Revision(object):
+    """
+    A counter shared by a ``MethodDouble`` and its allowances. It is bumped whenever the set of
+    dobles, or the arguments they accept, change so that anything derived from them can be
+    recomputed lazily.
+    """
+
+    __slots__ = ("number",)
+
+    def __init__(self):
+        self.number = 0
+
+    def bump(self):
+        """Records a change."""
+
+        self.number += 1
@@ -7,10 +7,24 @@ class Space(object):
     A container object for all the dobles created during the execution of a test case. Maintains
     a one-to-one mapping of target objects and ``Proxy`` objects. Maintained by the ``lifecycle``
     module and not intended to be used directly by other objects.
+
+    Instances that only have allowances are weakly referenced, and their proxies are released when
+    they are garbage collected. Objects with expectations are kept alive until teardown so they
+    can be verified.
+
+    A space can be layered over the spaces of ``Layer``s. Objects doubled by a layer keep their
+    proxy, so new dobles take priority over the layer's, and teardown only discards the new ones
+    along with the calls the layer's dobles received.
     """
 
-    def __init__(self):
+    def __init__(self, bases=()):
+        """
+        :param list bases: The spaces this space is layered over, oldest first.
+        """
+
+        self._bases = bases
         self._proxies = {}
+        self._snapshots = {}
         self._patches = {}
         self._is_verified = False
         self.skip_builtin_verification = False
@@ -37,27 +51,84 @@ class Space(object):
         """
 
         obj_id = id(obj)
+        proxy = self._proxies.get(obj_id)
+
+        if proxy is None or not proxy.is_proxy_for(obj):
+            proxy = self._base_proxy_for(obj)
+            if proxy is None:
+                proxy = Proxy(obj, self._release)
+            else:
+                self._snapshots[obj_id] = proxy.snapshot()
+            self._proxies[obj_id] = proxy
+
+        return proxy
+
+    def _base_proxy_for(self, obj):
+        """Returns the ``Proxy`` the newest base space has for an object.
+
+        :param object obj: The object that will be doubled.
+        :return: The ``Proxy``, if any base space has one.
+        :rtype: Proxy, None
+        """
+
+        for base in reversed(self._bases):
+            proxy = base._proxies.get(id(obj))
+            if proxy is not None and proxy.is_proxy_for(obj):
+                return proxy
+
+    def _release(self, obj_ref):
+        """Forgets the ``Proxy`` of an object that has been garbage collected.
+
+        :param KeyedRef obj_ref: The dead reference to the object, keyed by the id it had.
+        """
 
-        if obj_id not in self._proxies:
-            self._proxies[obj_id] = Proxy(obj)
+        proxy = self._proxies.get(obj_ref.key)
 
-        return self._proxies[obj_id]
+        if proxy is not None and proxy.is_released():
+            del self._proxies[obj_ref.key]
+            self._snapshots.pop(obj_ref.key, None)
+
+    def _restore(self, obj_id, proxy):
+        """Restores a doubled object to its state before this space doubled it.
+
+        :param int obj_id: The id of the object.
+        :param Proxy proxy: The proxy of the object.
+        """
+
+        snapshot = self._snapshots.pop(obj_id, None)
+        if proxy.is_released():
+            return
+        elif snapshot is None:
+            proxy.restore_original_object()
+        else:
+            proxy.restore_snapshot(snapshot)
 
     def teardown(self):
         """Restores all doubled objects to their original state."""
 
-        for proxy in self._proxies.values():
-            proxy.restore_original_object()
+        for obj_id, proxy in list(self._proxies.items()):
+            self._restore(obj_id, proxy)
 
         for patch in self._patches.values():
             patch.restore_original_object()
 
+        for base in self._bases:
+            base.forget_calls()
+
+        self._proxies.clear()
+
+    def forget_calls(self):
+        """Discards the call histories of all doubled objects."""
+
+        for proxy in self._proxies.values():
+            proxy.forget_calls()
+
     def clear(self, obj):
         """Clear allowances/expectations set on an object.
 
         :param object obj: The object to clear.
         """
-        self.proxy_for(obj).restore_original_object()
+        self._restore(id(obj), self.proxy_for(obj))
         del self._proxies[id(obj)]
 
     def verify(self):
@@ -69,7 +140,7 @@ class Space(object):
         if self._is_verified:
             return
 
-        for proxy in self._proxies.values():
-            proxy.verify()
+        for obj_id, proxy in list(self._proxies.items()):
+            proxy.verify(self._snapshots.get(obj_id))
 
         self._is_verified = True
@@ -1,4 +1,6 @@
-from collections import namedtuple
+from collections import ChainMap, namedtuple
+from collections.abc import Mapping
+from inspect import Attribute as ClassAttribute
 from inspect import (
     classify_class_attrs,
     getmembers,
@@ -7,12 +9,213 @@ from inspect import (
     ismodule,
 )
 from typing import Any
+from weakref import KeyedRef, WeakKeyDictionary, ref
 
+from dobles import introspection_cache
 from dobles.object_double import ObjectDouble
 from dobles.verification import is_callable
 
 Attribute = namedtuple("Attribute", ["object", "kind", "defining_class"])
 
+# Cached entries only describe where the attributes of a class are found, and never reference a
+# class, so entries are dropped along with their class. Bound the cache all the same.
+_CLASS_ATTRS_CACHE_SIZE = 1024
+_class_attrs_cache = WeakKeyDictionary()
+# How many times dobles has modified the namespace of each class, keyed by class.
+_class_versions = WeakKeyDictionary()
+
+# Stands in for ``Target._doubled_obj`` when the doubled object is the target object itself.
+_same_as_obj = object()
+
+
+def _classes_affecting_attrs(cls):
+    """Returns every class whose namespace contributes to ``classify_class_attrs(cls)``.
+
+    :param type cls: The class being classified.
+    :return: The classes in the MRO of ``cls`` and of its metaclass.
+    :rtype: tuple
+    """
+
+    metamro = tuple(klass for klass in type(cls).__mro__ if klass not in (type, object))
+    return cls.__mro__ + metamro
+
+
+def note_class_modified(cls):
+    """Records that dobles modified a class, so that its cached attributes are reclassified.
+
+    Modifications that add or remove attributes are always detected, so this is only needed when an
+    attribute is replaced, e.g. by a doubled method or a patch, or when it is restored.
+
+    :param object cls: The modified object. Ignored unless it is a class.
+    """
+
+    if isclass(cls):
+        _class_versions[cls] = _class_versions.get(cls, 0) + 1
+
+
+def _fingerprint(classes):
+    """Snapshots the state of the classes that determine the attributes of a class.
+
+    :param tuple classes: The result of ``_classes_affecting_attrs``.
+    :return: Weak references to the classes, and the size and version of each of their namespaces.
+    :rtype: tuple
+    """
+
+    return (
+        tuple(map(ref, classes)),
+        tuple(
+            (len(klass.__dict__), _class_versions.get(klass, 0)) for klass in classes
+        ),
+    )
+
+
+def _matches_fingerprint(classes, fingerprint):
+    """Determines if classes are unchanged since they were fingerprinted.
+
+    Costs time in the length of the MRO rather than in the number of attributes. Attributes
+    replaced by anything but dobles, without adding or removing one, go undetected.
+
+    :param tuple classes: The current result of ``_classes_affecting_attrs``.
+    :param tuple fingerprint: A fingerprint previously returned by ``_fingerprint``.
+    :return: True if neither the MRO nor any of the namespaces in it have changed.
+    :rtype: bool
+    """
+
+    refs, states = fingerprint
+
+    if len(classes) != len(refs):
+        return False
+
+    for klass, klass_ref, (size, version) in zip(classes, refs, states):
+        if (
+            klass_ref() is not klass
+            or len(klass.__dict__) != size
+            or _class_versions.get(klass, 0) != version
+        ):
+            return False
+
+    return True
+
+
+def describe_class_attrs(classes, classified):
+    """Describes where ``inspect.classify_class_attrs`` found each attribute of a class.
+
+    :param tuple classes: The result of ``_classes_affecting_attrs`` for the class.
+    :param list classified: The result of ``inspect.classify_class_attrs`` for the class.
+    :return: The ``[kind, defining class, namespace]`` of each attribute, keyed by name. The
+        defining class and the class whose namespace holds the attribute object are indexes into
+        ``classes``, and the namespace is None if the object is what getattr returns. None if an
+        attribute is defined by a class outside of ``classes``.
+    :rtype: dict, None
+    """
+
+    namespaces = [klass.__dict__ for klass in classes]
+    described = {}
+
+    for attr in classified:
+        try:
+            home = classes.index(attr.defining_class)
+        except ValueError:
+            return None
+        owner = next(
+            (
+                i
+                for i, namespace in enumerate(namespaces)
+                if namespace.get(attr.name, attr) is attr.object
+            ),
+            None,
+        )
+        described[attr.name] = [attr.kind, home, owner]
+
+    return described
+
+
+class _ClassAttrs(Mapping):
+    """
+    The attributes of a class, as ``inspect.classify_class_attrs`` describes them. Each attribute
+    object is looked up from the live class the first time it is accessed, and kept from then on
+    like the rest of the attributes of a ``Target``.
+    """
+
+    __slots__ = ("_cls", "_classes", "_described", "_attrs")
+
+    def __init__(self, cls, classes, described):
+        """
+        :param type cls: The class.
+        :param tuple classes: The result of ``_classes_affecting_attrs`` for the class.
+        :param dict described: The result of ``describe_class_attrs`` for the class.
+        """
+
+        self._cls = cls
+        self._classes = classes
+        self._described = described
+        self._attrs = {}
+
+    def __getitem__(self, name):
+        attr = self._attrs.get(name)
+        if attr is not None:
+            return attr
+
+        kind, home, owner = self._described[name]
+
+        try:
+            if owner is None:
+                obj = getattr(self._cls, name)
+            else:
+                obj = self._classes[owner].__dict__[name]
+        except Exception:
+            raise KeyError(name)
+
+        attr = self._attrs[name] = ClassAttribute(name, kind, self._classes[home], obj)
+        return attr
+
+    def __iter__(self):
+        return iter(self._described)
+
+    def __len__(self):
+        return len(self._described)
+
+
+def _classify_class_attrs(cls):
+    """A cached version of ``inspect.classify_class_attrs``.
+
+    Descriptions of where the attributes are found are shared by every ``Target`` of the same
+    class, and are recomputed whenever the MRO of the class changes, an attribute is added to or
+    removed from one of its classes, or dobles modifies one of them. The first classification of a
+    class in a process may come from the ``introspection_cache``.
+
+    :param type cls: The class to classify.
+    :return: The attribute details, keyed by name.
+    :rtype: Mapping
+    """
+
+    classes = _classes_affecting_attrs(cls)
+    # Only the pristine class is persisted, not the states dobles itself puts it in.
+    persist = introspection_cache.is_enabled() and cls not in _class_attrs_cache
+
+    if cls in _class_attrs_cache:
+        fingerprint, described = _class_attrs_cache[cls]
+        if _matches_fingerprint(classes, fingerprint):
+            return _ClassAttrs(cls, classes, described)
+    elif len(_class_attrs_cache) >= _CLASS_ATTRS_CACHE_SIZE:
+        del _class_attrs_cache[next(iter(_class_attrs_cache))]
+
+    described = None
+    if persist:
+        described = introspection_cache.load_class_attrs(cls, classes)
+
+    if described is None:
+        classified = classify_class_attrs(cls)
+        described = describe_class_attrs(classes, classified)
+        if described is None:
+            return {attr.name: attr for attr in classified}
+        if persist:
+            introspection_cache.store_class_attrs(cls, classes, described)
+
+    _class_attrs_cache[cls] = (_fingerprint(classes), described)
+
+    return _ClassAttrs(cls, classes, described)
+
 
 def _proxy_class_method_to_instance(original, name):
     def func(instance, *args, **kwargs):
@@ -30,15 +233,68 @@ class Target(object):
     such as the class and the kind (method, class, property, etc.)
     """
 
-    def __init__(self, obj):
+    __slots__ = (
+        "_obj",
+        "_obj_ref",
+        "_doubled_obj",
+        "doubled_obj_type",
+        "attrs",
+        "verified_call_shapes",
+    )
+
+    def __init__(self, obj, on_release=None):
         """
         :param object obj: The real target object.
+        :param function on_release: If provided, instances are only weakly referenced and this
+            is called with the weak reference, keyed by the id of the object, once the object has
+            been garbage collected, unless the target was pinned first.
         """
 
-        self.obj = obj
-        self.doubled_obj = self._determine_doubled_obj()
+        self._obj = obj
+        self._obj_ref = None
+        doubled_obj = self._determine_doubled_obj()
+        self._doubled_obj = _same_as_obj if doubled_obj is obj else doubled_obj
         self.doubled_obj_type = self._determine_doubled_obj_type()
         self.attrs = self._generate_attrs()
+        self.verified_call_shapes = {}
+
+        if on_release is not None and not self.is_class_or_module():
+            try:
+                self._obj_ref = KeyedRef(obj, on_release, id(obj))
+            except TypeError:
+                return
+            self._obj = None
+
+    @property
+    def obj(self):
+        """The target object, or None if it was only weakly referenced and has been collected."""
+
+        obj_ref = self._obj_ref
+        return self._obj if obj_ref is None else obj_ref()
+
+    @property
+    def doubled_obj(self):
+        doubled_obj = self._doubled_obj
+        return self.obj if doubled_obj is _same_as_obj else doubled_obj
+
+    def pin(self):
+        """Holds a strong reference to the target object from now on.
+
+        Called when the target object is needed after the test stops referencing it, e.g. to
+        verify its expectations or to restore a class it modified.
+        """
+
+        if self._obj_ref is not None:
+            self._obj = self._obj_ref()
+            self._obj_ref = None
+
+    def is_released(self):
+        """Determines if the weakly referenced target object has been garbage collected.
+
+        :rtype: bool
+        """
+
+        return self._obj_ref is not None and self._obj_ref() is None
 
     def is_class_or_module(self):
         """Determines if the object is a class or a module
@@ -84,21 +340,19 @@ class Target(object):
         """Get detailed info about target object.
 
         Uses ``inspect.classify_class_attrs`` to get several important details about each attribute
-        on the target object.
+        on the target object. Class attributes are cached across targets of the same class, and
+        are layered under a mapping of the target's own for attributes added later.
 
-        :return: The attribute details dict.
-        :rtype: dict
+        :return: The attribute details mapping.
+        :rtype: dict, ChainMap
         """
-        attrs = {}
-
         if ismodule(self.doubled_obj):
+            attrs = {}
             for name, func in getmembers(self.doubled_obj, is_callable):
                 attrs[name] = Attribute(func, "toplevel", self.doubled_obj)
-        else:
-            for attr in classify_class_attrs(self.doubled_obj_type):
-                attrs[attr.name] = attr
+            return attrs
 
-        return attrs
+        return ChainMap({}, _classify_class_attrs(self.doubled_obj_type))
 
     def hijack_attr(self, attr_name):
         """Hijack an attribute on the target object.
@@ -117,6 +371,7 @@ class Target(object):
                     getattr(self.obj.__class__, attr_name, None), attr_name
                 ),
             )
+            note_class_modified(self.obj.__class__)
 
     def restore_attr(self, attr_name):
         """Restore an attribute back onto the target object.
@@ -126,6 +381,7 @@ class Target(object):
         original_attr = self._original_attr(attr_name)
         if self._original_attr(attr_name):
             setattr(self.obj.__class__, attr_name, original_attr)
+            note_class_modified(self.obj.__class__)
 
     def _original_attr(self, attr_name):
         """Return the original attribute off of the proxy on the target object.
@@ -166,7 +422,10 @@ class Target(object):
 
     def get_attr(self, method_name):
         """Get attribute from the target object"""
-        return self.attrs.get(method_name) or self.get_callable_attr(method_name)
+        try:
+            return self.attrs[method_name]
+        except KeyError:
+            return self.get_callable_attr(method_name)
 
     def is_attr_async(self, name: str) -> bool:
         attr: Any = self.get_attr(name)
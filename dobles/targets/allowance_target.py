@@ -1,5 +1,7 @@
 import inspect
 
+from dobles.allowance_spec import as_allowance_specs
+from dobles.caller import Caller
 from dobles.class_double import ClassDouble
 from dobles.exceptions import ConstructorDoubleError
 from dobles.lifecycle import current_space
@@ -23,6 +25,34 @@ def allow(target):
     return AllowanceTarget(target)
 
 
+def allow_many(target, allowances):
+    """
+    Prepares a target object for several method call allowances (stubs) at once::
+
+        allow_many(foo, {
+            "bar": "value",
+            "baz": AllowanceSpec().with_args(1).and_return("other value"),
+        })
+
+    Each method is stubbed to return the value it maps to, unless the value is an
+    ``AllowanceSpec``, which configures the allowance instead. Every method name and argument list
+    is verified before any method is stubbed, and all of the problems are reported together.
+
+    :param object target: The object that will be stubbed.
+    :param dict allowances: Return values or ``AllowanceSpec``s keyed by method name.
+    :return: The new ``Allowance``s keyed by method name.
+    :rtype: dict
+    :raise: ``VerifyingDoubleGroupError`` if any of the methods can't be stubbed as declared.
+    """
+
+    if isinstance(target, str):
+        target = get_target(target)
+
+    caller = Caller(inspect.currentframe().f_back)
+    proxy = current_space().proxy_for(target)
+    return proxy.add_dobles(as_allowance_specs(allowances), {}, caller)[0]
+
+
 def allow_constructor(target):
     """
     Set an allowance on a ``ClassDouble`` constructor
@@ -54,6 +84,9 @@ class AllowanceTarget(object):
         if isinstance(target, str):
             target = get_target(target)
 
+        # The space may only weakly reference the target, so keep it alive until the method has
+        # been doubled.
+        self._target = target
         self._proxy = current_space().proxy_for(target)
 
     def __getattribute__(self, attr_name):
@@ -71,5 +104,5 @@ class AllowanceTarget(object):
         if __dict__ and attr_name in __dict__:
             return __dict__[attr_name]
 
-        caller = inspect.getframeinfo(inspect.currentframe().f_back)
+        caller = Caller(inspect.currentframe().f_back)
         return self._proxy.add_allowance(attr_name, caller)
@@ -1,5 +1,6 @@
 import inspect
 
+from dobles.caller import Caller
 from dobles.class_double import ClassDouble
 from dobles.exceptions import ConstructorDoubleError
 from dobles.lifecycle import current_space
@@ -52,6 +53,9 @@ class ExpectationTarget(object):
         if isinstance(target, str):
             target = get_target(target)
 
+        # The space may only weakly reference the target, so keep it alive until the method has
+        # been doubled.
+        self._target = target
         self._proxy = current_space().proxy_for(target)
 
     def __getattribute__(self, attr_name):
@@ -69,5 +73,5 @@ class ExpectationTarget(object):
         if __dict__ and attr_name in __dict__:
             return __dict__[attr_name]
 
-        caller = inspect.getframeinfo(inspect.currentframe().f_back)
+        caller = Caller(inspect.currentframe().f_back)
         return self._proxy.add_expectation(attr_name, caller)
@@ -0,0 +1,67 @@
+from dobles.exceptions import MockExpectationError
+from dobles.failure_message import FailureMessage, ReprOf
+from dobles.lifecycle import current_space, max_repr_length
+from dobles.utils import get_target
+
+
+def received(target):
+    """
+    Looks up the calls received by a doubled method of a target object. The name of the method
+    should be accessed as an attribute of the return value of this function::
+
+        received(foo).bar.with_args(1)
+
+    Accessing the ``bar`` attribute will return a ``ReceivedCalls`` listing the calls ``bar``
+    received since it was allowed or expected.
+
+    :param object target: The object that was doubled.
+    :return: A ``ReceivedTarget`` for the target object.
+    """
+
+    return ReceivedTarget(target)
+
+
+class ReceivedTarget(object):
+    """A wrapper around a doubled object that looks up the calls made to its methods."""
+
+    def __init__(self, target):
+        """
+        :param Union[str, object] target: The object to wrap.
+        """
+
+        if isinstance(target, str):
+            target = get_target(target)
+
+        self._target = target
+        self._proxy = current_space().proxy_for(target)
+
+    def __getattribute__(self, attr_name):
+        """
+        Returns the value of existing attributes, and the calls received by the method of the
+        same name for any attribute that doesn't yet exist.
+
+        :param str attr_name: The name of the attribute to look up.
+        :return: The existing value or a ``ReceivedCalls``.
+        :rtype: object, ReceivedCalls
+        :raise: ``MockExpectationError`` if the method was never allowed or expected.
+        """
+
+        __dict__ = object.__getattribute__(self, "__dict__")
+
+        if __dict__ and attr_name in __dict__:
+            return __dict__[attr_name]
+
+        received_calls = self._proxy.received_calls(attr_name)
+
+        if received_calls is None:
+            raise MockExpectationError(
+                FailureMessage(
+                    "Cannot check the calls to '{}' on {}, since it was never allowed or "
+                    "expected.",
+                    attr_name,
+                    ReprOf(self._target),
+                    max_repr_length=max_repr_length(),
+                )
+            )
+
+        return received_calls
@@ -1,7 +1,13 @@
+import sys
 from importlib import import_module
 
 from dobles.exceptions import VerifyingDoubleImportError
 
+# Maps dotted paths to the module path, attribute name and module they were resolved to. An entry
+# is only used while its module is still the one registered in ``sys.modules``, and attributes are
+# always looked up again, so replaced modules and re-bound attributes are never served stale.
+_resolved_paths = {}
+
 
 def get_module(module_path, full_path):
     """Return the module given its path.
@@ -41,6 +47,29 @@ def get_path_components(path):
     return module_path, class_name
 
 
+def resolve_path(path):
+    """Find the module containing an object and the name of the object within it.
+
+    :param str path: The full path to the object.
+    :return: The module object and the attribute name.
+    :rtype: module, str
+    :raise: ``VerifyingDoubleImportError`` if the path is invalid or the module can't be imported.
+    """
+
+    try:
+        module_path, name, module = _resolved_paths[path]
+    except KeyError:
+        module_path, name = get_path_components(path)
+    else:
+        if sys.modules.get(module_path) is module:
+            return module, name
+
+    module = get_module(module_path, path)
+    _resolved_paths[path] = (module_path, name, module)
+
+    return module, name
+
+
 def get_target(path):
     """Get an object by path
 
@@ -50,8 +79,7 @@ def get_target(path):
     :raise: ``VerifyingDoubleImportError`` if the target object doesn't exist or isn't.
     """
 
-    module_path, class_name = get_path_components(path)
-    module = get_module(module_path, path)
+    module, class_name = resolve_path(path)
     try:
         return getattr(module, class_name)
     except AttributeError:
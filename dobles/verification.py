@@ -1,9 +1,11 @@
-from inspect import isbuiltin, isfunction, ismethod, signature
+from inspect import Parameter, isbuiltin, isfunction, ismethod, ismodule, signature
+from weakref import WeakKeyDictionary
 
 from dobles.exceptions import (
     VerifyingBuiltinDoubleArgumentError,
     VerifyingDoubleArgumentError,
     VerifyingDoubleError,
+    VerifyingDoubleGroupError,
 )
 
 ACCEPTS_ARGS = (list, tuple, set)
@@ -11,6 +13,175 @@ ACCEPTS_KWARGS = (dict,)
 
 SELF_OR_CLASS = "SELF_OR_CLASS"
 
+_bind_plans = WeakKeyDictionary()
+
+
+class _BindPlan(object):
+    """
+    A precomputed summary of a signature that can accept or reject most calls with a few length
+    and membership checks. Calls it cannot accept are handed to ``Signature.bind``, which has the
+    final say and produces the error message.
+    """
+
+    __slots__ = (
+        "signature",
+        "error",
+        "max_positional",
+        "required_positional",
+        "positional_only",
+        "keyword_positions",
+        "required_keyword",
+        "var_keyword",
+    )
+
+    def __init__(self, signature=None, error=None):
+        """
+        :param Signature signature: The signature of the method.
+        :param str error: The reason the signature couldn't be determined, if it couldn't.
+        """
+
+        self.signature = signature
+        self.error = error
+
+        if signature is None:
+            return
+
+        positional = []
+        self.max_positional = None
+        self.required_positional = []
+        self.positional_only = set()
+        self.keyword_positions = {}
+        self.required_keyword = []
+        self.var_keyword = False
+
+        for param in signature.parameters.values():
+            required = param.default is Parameter.empty
+
+            if param.kind == Parameter.POSITIONAL_ONLY:
+                self.positional_only.add(param.name)
+            elif param.kind == Parameter.POSITIONAL_OR_KEYWORD:
+                self.keyword_positions[param.name] = len(positional)
+            elif param.kind == Parameter.VAR_POSITIONAL:
+                self.max_positional = float("inf")
+            elif param.kind == Parameter.KEYWORD_ONLY:
+                self.keyword_positions[param.name] = None
+                if required:
+                    self.required_keyword.append(param.name)
+            elif param.kind == Parameter.VAR_KEYWORD:
+                self.var_keyword = True
+
+            if param.kind in (
+                Parameter.POSITIONAL_ONLY,
+                Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                positional.append(param.name)
+                if required:
+                    self.required_positional.append(param.name)
+
+        if self.max_positional is None:
+            self.max_positional = len(positional)
+
+    def accepts(self, args, kwargs):
+        """Determines if the signature definitely accepts the provided arguments.
+
+        :param tuple args: The positional arguments.
+        :param dict kwargs: The keyword arguments.
+        :return: True if the arguments bind, False if they might not.
+        :rtype: bool
+        """
+
+        count = len(args)
+
+        if count > self.max_positional:
+            return False
+
+        for name in kwargs:
+            position = self.keyword_positions.get(name, -1)
+            if position == -1:
+                if not self.var_keyword or name in self.positional_only:
+                    return False
+            elif position is not None and position < count:
+                return False
+
+        if count < len(self.required_positional):
+            for name in self.required_positional[count:]:
+                if name not in kwargs or name in self.positional_only:
+                    return False
+
+        for name in self.required_keyword:
+            if name not in kwargs:
+                return False
+
+        return True
+
+    def bind(self, args, kwargs):
+        """Verifies the provided arguments against the signature.
+
+        :param tuple args: The positional arguments.
+        :param dict kwargs: The keyword arguments.
+        :raise: ``VerifyingDoubleError`` if the arguments do not match the signature.
+        """
+
+        if self.error is not None:
+            raise VerifyingBuiltinDoubleArgumentError(self.error)
+
+        if self.accepts(args, kwargs):
+            return
+
+        try:
+            self.signature.bind(*args, **kwargs)
+        except TypeError as e:
+            raise VerifyingDoubleArgumentError(str(e))
+
+
+def _build_bind_plan(method):
+    """Computes the ``_BindPlan`` of a method.
+
+    :param func method: The method to inspect.
+    :return: The bind plan.
+    :rtype: _BindPlan
+    :raise: ``VerifyingDoubleArgumentError`` if ``method`` has no signature.
+    """
+
+    try:
+        return _BindPlan(signature(method))
+    except ValueError as e:
+        return _BindPlan(error=str(e))
+    except TypeError as e:
+        raise VerifyingDoubleArgumentError(str(e))
+
+
+def _get_bind_plan(method):
+    """Returns the ``_BindPlan`` of a method, computing it if necessary.
+
+    Plans of python functions and module level builtins are cached weakly by function. Methods
+    share the plan of their underlying function, since the bound argument is the only difference
+    between them.
+
+    :param func method: The method to inspect.
+    :return: The bind plan.
+    :rtype: _BindPlan
+    """
+
+    func, is_bound = method, False
+    if ismethod(method):
+        func, is_bound = method.__func__, True
+
+    if not (isfunction(func) or (isbuiltin(func) and ismodule(func.__self__))):
+        return _build_bind_plan(method)
+
+    try:
+        plans = _bind_plans[func]
+    except KeyError:
+        plans = _bind_plans[func] = {}
+    except TypeError:
+        return _build_bind_plan(method)
+
+    if is_bound not in plans:
+        plans[is_bound] = _build_bind_plan(method)
+
+    return plans[is_bound]
+
 
 def _is_python_function(func):
     if ismethod(func):
@@ -86,9 +257,38 @@ def verify_method(target, method_name, class_level=False):
         raise VerifyingDoubleError(method_name, target.doubled_obj).requires_instance()
 
 
+def verify_specs(target, specs, doubled_methods=()):
+    """Verifies that several methods may be doubled as specified.
+
+    :param Target target: The object owning the methods.
+    :param iterable specs: ``(method name, AllowanceSpec)`` pairs.
+    :param container doubled_methods: The names of methods that are already doubled, and thus
+        known to exist.
+    :raise: ``VerifyingDoubleGroupError`` listing every method that can't be doubled as specified.
+    """
+
+    class_level = target.is_class_or_module()
+    errors = {}
+
+    for method_name, spec in specs:
+        try:
+            if method_name not in doubled_methods:
+                verify_method(target, method_name, class_level=class_level)
+            spec.verify_arguments(target, method_name)
+        except (VerifyingDoubleError, VerifyingDoubleArgumentError) as e:
+            errors.setdefault(method_name, e)
+
+    if errors:
+        raise VerifyingDoubleGroupError(errors, target.doubled_obj)
+
+
 def verify_arguments(target, method_name, args, kwargs):
     """Verifies that the provided arguments match the signature of the provided method.
 
+    Only the number of positional arguments and the names of the keyword arguments determine if a
+    call is valid, so the shapes of valid calls are remembered per method and not verified again
+    until the method is rebound.
+
     :param Target target: A ``Target`` object containing the object with the method to double.
     :param str method_name: The name of the method to double.
     :param tuple args: The positional arguments the method should be called with.
@@ -96,10 +296,56 @@ def verify_arguments(target, method_name, args, kwargs):
     :raise: ``VerifyingDoubleError`` if the provided arguments do not match the signature.
     """
 
+    shape = (len(args), tuple(kwargs)) if kwargs else len(args)
+    attr = _current_attr(target, method_name)
+    method = None if attr is None else attr.object
+    verified = target.verified_call_shapes.get(method_name)
+
+    if verified is None or verified[0] is not method:
+        verified = target.verified_call_shapes[method_name] = (method, set())
+    elif shape in verified[1]:
+        return
+
+    _verify_arguments_of_attr(target, method_name, attr, args, kwargs)
+    verified[1].add(shape)
+
+
+def _current_attr(target, method_name):
+    """Looks up the attribute of the target the arguments are meant for.
+
+    The attributes of a target are captured when they are first looked up, so the namespace of
+    the class or module defining the attribute is checked for a value rebound since then, e.g. by
+    the test or a ``patch``. The dobles installed in its place are not considered a rebinding.
+
+    :param Target target: A ``Target`` object containing the object with the method to double.
+    :param str method_name: The name of the method to double.
+    :return: The attribute, or None if the target has no such attribute.
+    :rtype: Attribute, None
+    """
+
+    attr = target.get_attr(method_name)
+
+    try:
+        current = vars(attr.defining_class).get(method_name, attr.object)
+    except (AttributeError, TypeError):
+        return attr
+
+    current = getattr(current, "_dobles_target_method", current)
+    if current is attr.object or getattr(current, "__wrapped__", None) is attr.object:
+        return attr
+
+    return attr._replace(object=current)
+
+
+def _verify_arguments_of_attr(target, method_name, attr, args, kwargs):
+    """Verifies the provided arguments against the attribute of the target they are meant for.
+
+    :raise: ``VerifyingDoubleError`` if the provided arguments do not match the signature.
+    """
+
     if method_name == "_dobles__new__":
         return _verify_arguments_of_dobles__new__(target, args, kwargs)
 
-    attr = target.get_attr(method_name)
     method = attr.object
 
     if attr.kind in (
@@ -125,9 +371,4 @@ def verify_arguments(target, method_name, args, kwargs):
 
 
 def _verify_arguments(method, method_name, args, kwargs):
-    try:
-        signature(method).bind(*args, **kwargs)
-    except ValueError as e:
-        raise VerifyingBuiltinDoubleArgumentError(str(e))
-    except TypeError as e:
-        raise VerifyingDoubleArgumentError(str(e))
+    _get_bind_plan(method).bind(args, kwargs)
@@ -0,0 +1,143 @@
+from pytest import raises
+
+from dobles import AllowanceSpec, allow_many
+from dobles.exceptions import (
+    MockExpectationError,
+    UnallowedMethodCallError,
+    VerifyingDoubleArgumentError,
+    VerifyingDoubleError,
+    VerifyingDoubleGroupError,
+)
+from dobles.instance_double import InstanceDouble
+from dobles.testing import User
+
+
+class TestAllowMany(object):
+    def test_stubs_each_method_to_return_its_value(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        allowances = allow_many(
+            subject, {"get_name": "Bob", "instance_method": "value"}
+        )
+
+        assert subject.get_name() == "Bob"
+        assert subject.instance_method() == "value"
+        assert set(allowances) == {"get_name", "instance_method"}
+
+    def test_applies_allowance_specs(self):
+        user = User("Alice", 25)
+
+        allow_many(
+            user,
+            {
+                "method_with_positional_arguments": AllowanceSpec()
+                .with_args("foo")
+                .and_return("bar"),
+                "method_with_default_args": AllowanceSpec()
+                .with_args("foo", bar="baz")
+                .and_raise(ValueError),
+                "instance_method": AllowanceSpec().and_return(1, 2).at_most(2).times,
+            },
+        )
+
+        assert user.method_with_positional_arguments("foo") == "bar"
+        with raises(UnallowedMethodCallError):
+            user.method_with_positional_arguments("baz")
+        with raises(ValueError):
+            user.method_with_default_args("foo", bar="baz")
+        assert [user.instance_method(), user.instance_method()] == [1, 2]
+        with raises(MockExpectationError):
+            user.instance_method()
+
+    def test_accepts_a_path_to_a_class(self):
+        allow_many("dobles.testing.User", {"class_method": "value"})
+
+        assert User.class_method("foo") == "value"
+
+    def test_specs_can_be_reused(self):
+        spec = AllowanceSpec().with_args("foo").and_return("bar")
+        first = InstanceDouble("dobles.testing.User")
+        second = InstanceDouble("dobles.testing.User")
+
+        allow_many(first, {"method_with_positional_arguments": spec})
+        allow_many(second, {"method_with_positional_arguments": spec})
+
+        assert first.method_with_positional_arguments("foo") == "bar"
+        assert second.method_with_positional_arguments("foo") == "bar"
+
+    def test_reports_every_invalid_method_together(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        with raises(VerifyingDoubleGroupError) as e:
+            allow_many(
+                subject,
+                {
+                    "get_name": "Bob",
+                    "nonexistent": "value",
+                    "method_with_positional_arguments": AllowanceSpec().with_args(
+                        "foo", "bar"
+                    ),
+                    "class_attribute": "value",
+                },
+            )
+
+        errors = e.value.errors
+        assert set(errors) == {
+            "nonexistent",
+            "method_with_positional_arguments",
+            "class_attribute",
+        }
+        assert isinstance(errors["nonexistent"], VerifyingDoubleError)
+        assert isinstance(
+            errors["method_with_positional_arguments"], VerifyingDoubleArgumentError
+        )
+        assert str(e.value).startswith("Cannot double 3 methods of ")
+        assert "    nonexistent: Cannot double method 'nonexistent'" in str(e.value)
+
+    def test_stubs_nothing_if_any_method_is_invalid(self):
+        user = User("Alice", 25)
+
+        with raises(VerifyingDoubleGroupError):
+            allow_many(user, {"get_name": "Bob", "nonexistent": "value"})
+
+        assert user.get_name() == "Alice"
+
+    def test_verifies_the_methods_only_once(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("verified again")
+
+        monkeypatch.setattr("dobles.method_double.verify_method", fail)
+        monkeypatch.setattr("dobles.allowance.verify_arguments", fail)
+        subject = InstanceDouble("dobles.testing.User")
+
+        allow_many(
+            subject,
+            {
+                "get_name": "Bob",
+                "method_with_positional_arguments": AllowanceSpec().with_args("foo"),
+                "instance_method": AllowanceSpec().with_no_args().and_return(1),
+            },
+        )
+        monkeypatch.undo()
+
+        assert subject.get_name() == "Bob"
+        assert subject.instance_method() == 1
+
+    def test_shares_one_caller_between_the_allowances(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        allowances = allow_many(subject, {"get_name": "Bob", "instance_method": 1})
+
+        first, second = (allowance._caller for allowance in allowances.values())
+        assert first is second
+        assert first.filename == __file__
+
+
+class TestAllowanceSpec(object):
+    def test_rejects_negative_call_counts(self):
+        with raises(TypeError):
+            AllowanceSpec().at_most(-1)
+
+    def test_rejects_missing_return_values(self):
+        with raises(TypeError):
+            AllowanceSpec().and_return()
@@ -162,6 +162,61 @@ class TestWithArgs(object):
 
         assert subject.method_with_varargs("baz") == "blah"
 
+    def test_matches_among_many_allowances(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        for i in range(1000):
+            allow(subject).method_with_default_args.with_args(i, bar=str(i)).and_return(
+                i
+            )
+
+        assert subject.method_with_default_args(500, bar="500") == 500
+        with raises(UnallowedMethodCallError):
+            subject.method_with_default_args(500, bar="501")
+
+    def test_newest_matching_allowance_takes_precedence(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        allow(subject).method_with_varargs.with_args("baz").and_return("first")
+        allow(subject).method_with_varargs.and_return("second")
+        allow(subject).method_with_varargs.with_args("baz").and_return("third")
+
+        assert subject.method_with_varargs("baz") == "third"
+        assert subject.method_with_varargs("bar") == "second"
+
+        allow(subject).method_with_varargs.and_return("fourth")
+
+        assert subject.method_with_varargs("baz") == "fourth"
+
+    def test_matches_equal_arguments_of_different_types(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        allow(subject).method_with_varargs.with_args(1, (2.0,)).and_return("bar")
+
+        assert subject.method_with_varargs(1.0, (2,)) == "bar"
+        assert subject.method_with_varargs(True, (2,)) == "bar"
+
+    def test_matches_unhashable_arguments(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        allow(subject).method_with_varargs.with_args([1], {"a": 1}).and_return("bar")
+        allow(subject).method_with_varargs.with_args(1).and_return("baz")
+
+        assert subject.method_with_varargs([1], {"a": 1}) == "bar"
+        assert subject.method_with_varargs(1) == "baz"
+
+    def test_arguments_can_be_changed_after_being_called(self):
+        subject = InstanceDouble("dobles.testing.User")
+
+        allowance = allow(subject).method_with_varargs.and_return("bar")
+        assert subject.method_with_varargs("foo") == "bar"
+
+        allowance.with_args("baz")
+
+        assert subject.method_with_varargs("baz") == "bar"
+        with raises(UnallowedMethodCallError):
+            subject.method_with_varargs("foo")
+
 
 class TestWithNoArgs(object):
     def test_allows_call_with_no_arguments(self):
@@ -531,3 +586,49 @@ class TestCustomMatcher(object):
         allow(self.subject).instance_method.with_args_validator(lambda x: True)
         with raises(VerifyingDoubleArgumentError):
             self.subject.instance_method("bob")
+
+
+class TestChangingAllowancesAfterCalls(object):
+    def setup_method(self):
+        self.subject = InstanceDouble("dobles.testing.User")
+
+    def test_new_allowances_are_used(self):
+        allow(self.subject).method_with_varargs.and_return("bar")
+        assert self.subject.method_with_varargs("baz") == "bar"
+
+        allow(self.subject).method_with_varargs.with_args("baz").and_return("blah")
+
+        assert self.subject.method_with_varargs("baz") == "blah"
+        assert self.subject.method_with_varargs("bob") == "bar"
+
+    def test_new_return_values_are_used(self):
+        allowance = allow(self.subject).instance_method.and_return("bar")
+        assert self.subject.instance_method() == "bar"
+
+        allowance.and_return("baz")
+        assert self.subject.instance_method() == "baz"
+
+        allowance.and_return_result_of(lambda: "blah")
+        assert self.subject.instance_method() == "blah"
+
+        allowance.and_raise(UserDefinedException)
+        with raises(UserDefinedException):
+            self.subject.instance_method()
+
+    def test_call_counts_include_earlier_calls(self):
+        allowance = allow(self.subject).instance_method
+        self.subject.instance_method()
+        self.subject.instance_method()
+
+        allowance.at_most(2)
+
+        with raises(MockExpectationError):
+            self.subject.instance_method()
+        teardown()
+
+    def test_arguments_are_verified(self):
+        allow(self.subject).instance_method
+        self.subject.instance_method()
+
+        with raises(VerifyingDoubleArgumentError):
+            self.subject.instance_method("bar")
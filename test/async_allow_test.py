@@ -4,7 +4,7 @@ import re
 import pytest
 from pytest import raises
 
-from dobles import allow, no_builtin_verification
+from dobles import allow, no_builtin_verification, raising
 from dobles.exceptions import (
     MockExpectationError,
     UnallowedMethodCallError,
@@ -222,6 +222,30 @@ class TestWithNoArgs(object):
 
         assert (await subject.instance_method()) == "bar"
 
+    @pytest.mark.asyncio
+    async def test_raises_in_turn_before_returning(self):
+        subject = InstanceDouble("dobles.testing.AsyncUser")
+
+        allow(subject).instance_method.and_return(raising(UserDefinedException), "bar")
+
+        with raises(UserDefinedException):
+            await subject.instance_method()
+        assert (await subject.instance_method()) == "bar"
+
+    @pytest.mark.asyncio
+    async def test_raises_a_new_exception_per_call(self):
+        subject = InstanceDouble("dobles.testing.AsyncUser")
+
+        allow(subject).instance_method.and_raise(UserDefinedException, "msg")
+
+        with raises(UserDefinedException) as first:
+            await subject.instance_method()
+        with raises(UserDefinedException) as second:
+            await subject.instance_method()
+
+        assert first.value is not second.value
+        assert str(second.value) == "msg"
+
 
 class TestTwice(object):
     @pytest.mark.asyncio
@@ -593,3 +617,15 @@ class TestCustomMatcher(object):
         allow(self.subject).instance_method.with_args_validator(lambda x: True)
         with raises(VerifyingDoubleArgumentError):
             await self.subject.instance_method("bob")
+
+
+class TestAndReturnFrom(object):
+    @pytest.mark.asyncio
+    async def test_returns_values_in_order(self):
+        subject = InstanceDouble("dobles.testing.AsyncUser")
+
+        allow(subject).instance_method.and_return_from(iter(["bar", "bazz"]))
+
+        assert (await subject.instance_method()) == "bar"
+        assert (await subject.instance_method()) == "bazz"
+        assert (await subject.instance_method()) == "bazz"
@@ -0,0 +1,86 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import mark
+
+from dobles.call_count_accumulator import CallCountAccumulator
+
+
+def accumulator(calls, exact=None, minimum=None, maximum=None):
+    counter = CallCountAccumulator()
+    if exact is not None:
+        counter.set_exact(exact)
+    if minimum is not None:
+        counter.set_minimum(minimum)
+    if maximum is not None:
+        counter.set_maximum(maximum)
+    for _ in range(calls):
+        counter.called()
+    return counter
+
+
+class TestCallCountAccumulator(object):
+    @mark.parametrize(
+        "calls, restrictions, too_few, too_many",
+        [
+            (0, {}, False, False),
+            (5, {}, False, False),
+            (1, {"exact": 2}, True, False),
+            (3, {"exact": 2}, False, True),
+            (1, {"minimum": 2}, True, False),
+            (3, {"maximum": 2}, False, True),
+            (2, {"minimum": 1, "maximum": 3}, False, False),
+            (3, {"exact": 3, "maximum": 2}, False, True),
+            (3, {"exact": 2, "minimum": 4}, True, True),
+        ],
+    )
+    def test_compares_call_count_to_restrictions(
+        self, calls, restrictions, too_few, too_many
+    ):
+        counter = accumulator(calls, **restrictions)
+
+        assert counter.has_too_few_calls() is too_few
+        assert counter.has_too_many_calls() is too_many
+        assert counter.has_correct_call_count() is not (too_few or too_many)
+
+    def test_later_restrictions_replace_earlier_ones(self):
+        counter = accumulator(3, maximum=1)
+        counter.set_maximum(3)
+
+        assert counter.has_correct_call_count()
+
+    @mark.parametrize(
+        "calls, restrictions, message",
+        [
+            (2, {"exact": 2}, ""),
+            (1, {"exact": 2}, "2 times instead of 1 time "),
+            (0, {"exact": 1}, "1 time instead of 0 times "),
+            (1, {"minimum": 2}, "at least 2 times instead of 1 time "),
+            (3, {"maximum": 2}, "at most 2 times instead of 3 times "),
+        ],
+    )
+    def test_error_string(self, calls, restrictions, message):
+        assert accumulator(calls, **restrictions).error_string() == message
+
+    def test_never(self):
+        assert accumulator(0, exact=0).never()
+        assert not accumulator(0, exact=1).never()
+        assert not accumulator(0).never()
+
+    def test_counts_calls_from_many_threads(self):
+        counter = accumulator(0, exact=80000)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        def call(_):
+            for _ in range(10000):
+                counter.called()
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(call, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert counter.count == 80000
+        assert counter.has_correct_call_count()
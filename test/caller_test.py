@@ -0,0 +1,35 @@
+import inspect
+
+from dobles import allow
+from dobles.caller import Caller
+from dobles.testing import User
+
+
+class TestCaller(object):
+    def test_resolves_filename_and_line_number(self):
+        frame = inspect.currentframe()
+        caller, lineno = Caller(frame), frame.f_lineno
+
+        assert caller.filename == __file__
+        assert caller.lineno == lineno
+
+    def test_resolves_line_number_within_multi_line_statements(self):
+        def capture():
+            frame = inspect.currentframe().f_back
+            return Caller(frame), inspect.getframeinfo(frame).lineno
+
+        caller, lineno = (
+            1,
+            capture(),
+        )[1]
+
+        assert caller.lineno == lineno
+
+    def test_records_where_an_allowance_was_declared(self):
+        user = User("Bob Barker", 100)
+
+        lineno = inspect.currentframe().f_lineno + 1
+        allowance = allow(user).instance_method
+
+        assert allowance._caller.filename == __file__
+        assert allowance._caller.lineno == lineno
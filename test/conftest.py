@@ -1,4 +1,8 @@
 from coverage import coverage
+from pytest import fixture
+
+from dobles import set_call_history_capacity
+from dobles.call_history import DEFAULT_CAPACITY
 
 cov = coverage(source=("dobles",))
 cov.start()
@@ -6,6 +10,13 @@ cov.start()
 pytest_plugins = ["dobles.pytest_plugin"]
 
 
+@fixture
+def record_calls():
+    set_call_history_capacity(1000)
+    yield
+    set_call_history_capacity(DEFAULT_CAPACITY)
+
+
 def pytest_sessionfinish(session, exitstatus):
     cov.stop()
     cov.save()
@@ -0,0 +1,119 @@
+from pytest import raises
+
+from dobles import AllowanceSpec, DoubleSpec, InstanceDouble, verify
+from dobles.exceptions import (
+    MockExpectationError,
+    VerifyingDoubleGroupError,
+    VerifyingDoubleImportError,
+)
+from dobles.lifecycle import teardown
+from dobles.testing import User
+
+
+def user_spec():
+    return DoubleSpec(
+        "dobles.testing.User",
+        allow={
+            "get_name": "Bob",
+            "method_with_positional_arguments": AllowanceSpec()
+            .with_args("foo")
+            .and_return("bar", "baz"),
+        },
+        expect={"instance_method": AllowanceSpec().and_return("value").once()},
+    )
+
+
+class TestDoubleSpec(object):
+    def test_stamps_out_instance_dobles(self):
+        spec = user_spec()
+
+        subject = spec.instance_double(age=25)
+        subject.instance_method()
+
+        assert isinstance(subject, InstanceDouble)
+        assert subject.age == 25
+        assert subject.get_name() == "Bob"
+        assert subject.method_with_positional_arguments("foo") == "bar"
+
+    def test_stamped_dobles_are_independent(self):
+        spec = user_spec()
+        first = spec.instance_double()
+        second = spec.instance_double()
+
+        assert first.method_with_positional_arguments("foo") == "bar"
+        assert first.method_with_positional_arguments("foo") == "baz"
+        assert second.method_with_positional_arguments("foo") == "bar"
+
+        first.instance_method()
+
+        with raises(MockExpectationError):
+            verify()
+        teardown()
+
+    def test_applies_to_partial_dobles(self):
+        spec = user_spec()
+        user = User("Alice", 25)
+
+        allowances, expectations = spec.apply(user)
+        user.instance_method()
+
+        assert user.get_name() == "Bob"
+        assert set(allowances) == {"get_name", "method_with_positional_arguments"}
+        assert set(expectations) == {"instance_method"}
+
+    def test_can_be_reused_across_tests(self):
+        spec = user_spec()
+
+        for _ in range(3):
+            subject = spec.instance_double()
+            subject.instance_method()
+            verify()
+            teardown()
+
+    def test_verifies_every_method_when_created(self):
+        with raises(VerifyingDoubleGroupError) as e:
+            DoubleSpec(
+                "dobles.testing.User",
+                allow={
+                    "nonexistent": "value",
+                    "method_with_positional_arguments": AllowanceSpec().with_args(),
+                },
+                expect={"instance_method": AllowanceSpec().with_args("foo")},
+            )
+
+        assert set(e.value.errors) == {
+            "nonexistent",
+            "method_with_positional_arguments",
+            "instance_method",
+        }
+
+    def test_skips_verification_when_stamping(self, monkeypatch):
+        spec = user_spec()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("verified again")
+
+        for name in (
+            "dobles.proxy.verify_specs",
+            "dobles.method_double.verify_method",
+            "dobles.allowance.verify_arguments",
+        ):
+            monkeypatch.setattr(name, fail)
+
+        subject = spec.instance_double()
+        user = User("Alice", 25)
+        spec.apply(user)
+        monkeypatch.undo()
+
+        subject.instance_method()
+        user.instance_method()
+
+    def test_verifies_objects_of_other_types_when_applied(self):
+        spec = DoubleSpec("dobles.testing.User", allow={"get_name": "Bob"})
+
+        with raises(VerifyingDoubleGroupError):
+            spec.apply(InstanceDouble("dobles.testing.EmptyClass"))
+
+    def test_requires_a_class(self):
+        with raises(VerifyingDoubleImportError):
+            DoubleSpec("dobles.testing.top_level_function")
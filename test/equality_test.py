@@ -0,0 +1,180 @@
+import gc
+from array import array
+from weakref import ref
+
+from pytest import importorskip, mark, raises
+
+from dobles import allow, array_close, received, register_equality
+from dobles.equality import _MAX_RESOLVED_TYPES, _resolved, equality_check_for
+from dobles.exceptions import UnallowedMethodCallError
+from dobles.instance_double import InstanceDouble
+
+
+class Frame(object):
+    def __init__(self, rows):
+        self.rows = rows
+
+
+register_equality(Frame, lambda frame, other: frame.rows == other.rows)
+
+
+class TestBuffers(object):
+    def test_matches_buffers_with_the_same_contents(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            b"payload"
+        ).and_return("bytes")
+
+        assert subject.method_with_positional_arguments(b"payload") == "bytes"
+        assert (
+            subject.method_with_positional_arguments(bytearray(b"payload")) == "bytes"
+        )
+        assert (
+            subject.method_with_positional_arguments(memoryview(b"payload")) == "bytes"
+        )
+
+    def test_does_not_match_buffers_with_other_contents(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            memoryview(b"payload")
+        )
+
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(memoryview(b"other"))
+
+    def test_compares_every_byte_of_large_buffers(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            memoryview(b"0123456789" * 10)
+        ).and_return("bytes")
+
+        assert (
+            subject.method_with_positional_arguments(bytearray(b"0123456789" * 10))
+            == "bytes"
+        )
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(
+                memoryview(b"0123456789" * 9 + b"0123456780")
+            )
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(
+                memoryview(b"0123456789" * 10).cast("B", (10, 10))
+            )
+
+    def test_compares_items_of_other_formats_by_value(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            array("B", [255])
+        ).and_return("array")
+
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(array("b", [-1]))
+        assert subject.method_with_positional_arguments(array("d", [255.0])) == "array"
+
+    def test_compares_arrays_by_value(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            array("i", [1, 2, 3])
+        ).and_return("array")
+
+        assert (
+            subject.method_with_positional_arguments(array("i", [1, 2, 3])) == "array"
+        )
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(array("i", [1, 2]))
+
+
+class TestNumpyArrays(object):
+    def test_matches_arrays_with_the_same_shape_dtype_and_contents(self):
+        numpy = importorskip("numpy")
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            numpy.arange(1000)
+        ).and_return("array")
+
+        assert subject.method_with_positional_arguments(numpy.arange(1000)) == "array"
+        assert (
+            subject.method_with_positional_arguments(numpy.arange(1000)[::-1][::-1])
+            == "array"
+        )
+
+    def test_does_not_match_other_arrays(self):
+        numpy = importorskip("numpy")
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(numpy.arange(6))
+
+        for other in [
+            numpy.arange(1, 7),
+            numpy.arange(6.0),
+            numpy.arange(6).reshape(2, 3),
+            list(range(6)),
+        ]:
+            with raises(UnallowedMethodCallError):
+                subject.method_with_positional_arguments(other)
+
+    def test_does_not_match_single_values_that_compare_equal(self):
+        numpy = importorskip("numpy")
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(numpy.array([1]))
+        allow(subject).method_with_default_args.with_args(1)
+
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(numpy.array([[1.0]]))
+        with raises(UnallowedMethodCallError):
+            subject.method_with_default_args(numpy.array([1]))
+
+    def test_matches_arrays_within_a_tolerance(self):
+        numpy = importorskip("numpy")
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            array_close(numpy.ones(3), atol=0.01)
+        ).and_return("close")
+
+        assert (
+            subject.method_with_positional_arguments(numpy.ones(3) + 0.001) == "close"
+        )
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(numpy.ones(3) + 0.1)
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(numpy.ones(4))
+
+    @mark.usefixtures("record_calls")
+    def test_narrows_received_calls(self):
+        numpy = importorskip("numpy")
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments
+
+        subject.method_with_positional_arguments(numpy.zeros(3))
+        subject.method_with_positional_arguments(numpy.ones(3))
+
+        calls = received(subject).method_with_positional_arguments
+        assert calls.with_args(numpy.ones(3)).count == 1
+
+
+class TestRegisterEquality(object):
+    def test_uses_the_registered_check(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(
+            Frame([1, 2])
+        ).and_return("frame")
+
+        assert subject.method_with_positional_arguments(Frame([1, 2])) == "frame"
+        with raises(UnallowedMethodCallError):
+            subject.method_with_positional_arguments(Frame([3]))
+
+    def test_cannot_register_builtin_scalars(self):
+        with raises(TypeError):
+            register_equality(int, lambda x, y: True)
+
+    def test_does_not_keep_classes_created_at_runtime_alive(self):
+        dynamic = type("Dynamic", (object,), {})
+        dynamic_ref = ref(dynamic)
+
+        assert equality_check_for(dynamic) is None
+        del dynamic
+        for _ in range(_MAX_RESOLVED_TYPES):
+            equality_check_for(type("Other", (object,), {}))
+        gc.collect()
+
+        assert dynamic_ref() is None
+        assert len(_resolved) <= _MAX_RESOLVED_TYPES
@@ -0,0 +1,131 @@
+from pytest import fixture, raises
+
+from dobles import allow, expect, set_max_repr_length, teardown, verify
+from dobles.exceptions import MockExpectationError, UnallowedMethodCallError
+from dobles.failure_message import (
+    DEFAULT_MAX_REPR_LENGTH,
+    ArgumentsOf,
+    FailureMessage,
+    ReprOf,
+)
+from dobles.instance_double import InstanceDouble
+from dobles.lifecycle import max_repr_length
+
+pytest_plugins = "pytester"
+
+
+@fixture
+def restore_max_repr_length():
+    yield
+    set_max_repr_length(DEFAULT_MAX_REPR_LENGTH)
+
+
+class CountsReprs(object):
+    def __init__(self):
+        self.reprs = 0
+
+    def __repr__(self):
+        self.reprs += 1
+        return "<CountsReprs>"
+
+
+class TestFailureMessage(object):
+    def test_formats_the_template(self):
+        message = FailureMessage(
+            "{} with {} on {}", "called", ArgumentsOf((1, "a"), {"b": 2}), ReprOf([3])
+        )
+
+        assert str(message) == "called with (1, 'a', b=2) on [3]"
+
+    def test_describes_objects_only_when_rendered_and_only_once(self):
+        obj = CountsReprs()
+        message = FailureMessage("{}", ReprOf(obj))
+
+        assert obj.reprs == 0
+        assert str(message) == str(message) == "<CountsReprs>"
+        assert obj.reprs == 1
+
+    def test_cuts_off_long_reprs(self):
+        message = FailureMessage(
+            "{} {}",
+            ReprOf("a" * 10000),
+            ArgumentsOf((b"b" * 10000,), {}),
+            max_repr_length=20,
+        )
+
+        rendered = str(message)
+
+        assert len(rendered) < 60
+        assert "..." in rendered
+
+    def test_limits_the_number_of_items_shown(self):
+        message = FailureMessage("{}", ReprOf(list(range(10000))))
+
+        assert str(message).endswith("19, ...]")
+
+    def test_cuts_off_nested_containers(self):
+        nested = [[["x" * 1000] * 100] * 100] * 100
+        message = FailureMessage("{}", ReprOf(nested), max_repr_length=50)
+
+        rendered = str(message)
+
+        assert len(rendered) == 50
+        assert rendered.startswith("[[[") and rendered.endswith("...]")
+
+
+class TestFailures(object):
+    def test_unexpected_calls_describe_arguments_lazily(self):
+        subject = InstanceDouble("dobles.testing.User")
+        argument = CountsReprs()
+        allow(subject).method_with_positional_arguments.with_args("foo")
+
+        with raises(UnallowedMethodCallError) as e:
+            subject.method_with_positional_arguments(argument)
+
+        assert argument.reprs == 0
+        assert "(<CountsReprs>)" in str(e.value)
+        assert argument.reprs == 1
+
+    def test_unsatisfied_expectations_respect_the_max_repr_length(
+        self, restore_max_repr_length
+    ):
+        set_max_repr_length(50)
+        subject = InstanceDouble("dobles.testing.User")
+        expect(subject).method_with_positional_arguments.with_args("x" * 10000)
+
+        with raises(MockExpectationError) as e:
+            verify()
+        teardown()
+
+        assert len(str(e.value)) < 500
+        assert "with ('xxxxxxxxxxxxxxxxxxxxxx...xxxxxxxxxxxxxxxxxxxxxxx')" in str(
+            e.value
+        )
+
+    def test_the_max_repr_length_outlives_teardown(self, restore_max_repr_length):
+        set_max_repr_length(50)
+        teardown()
+
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args("foo")
+
+        with raises(UnallowedMethodCallError) as e:
+            subject.method_with_positional_arguments("x" * 10000)
+
+        assert len(str(e.value)) < 500
+
+
+def test_the_max_repr_length_can_be_set_for_a_pytest_run(pytester):
+    pytester.makepyfile(
+        """
+        from dobles.lifecycle import max_repr_length
+
+        def test_max_repr_length():
+            assert max_repr_length() == 50
+        """
+    )
+
+    result = pytester.runpytest("--dobles-max-repr-length=50")
+
+    result.assert_outcomes(passed=1)
+    assert max_repr_length() == DEFAULT_MAX_REPR_LENGTH
@@ -0,0 +1,156 @@
+import enum
+import importlib
+import sys
+from inspect import classify_class_attrs, getmembers, isclass
+
+from pytest import fixture, mark
+
+import dobles.testing
+from dobles import introspection_cache
+from dobles.target import _ClassAttrs, _classes_affecting_attrs, describe_class_attrs
+from dobles.testing import EmptyClass, User
+
+pytest_plugins = "pytester"
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+@fixture
+def cache(tmp_path):
+    introspection_cache.enable(tmp_path)
+    yield tmp_path
+    introspection_cache.disable()
+
+
+def restart(directory):
+    """Simulates a new process reading the cache written by the previous one."""
+
+    introspection_cache.disable()
+    introspection_cache._file_digests.clear()
+    introspection_cache.enable(directory)
+
+
+def classified(cls):
+    return {attr.name: attr for attr in classify_class_attrs(cls)}
+
+
+def store(cls):
+    classes = _classes_affecting_attrs(cls)
+    introspection_cache.store_class_attrs(
+        cls, classes, describe_class_attrs(classes, classify_class_attrs(cls))
+    )
+
+
+def load(cls):
+    classes = _classes_affecting_attrs(cls)
+    described = introspection_cache.load_class_attrs(cls, classes)
+    return None if described is None else dict(_ClassAttrs(cls, classes, described))
+
+
+class TestIntrospectionCache(object):
+    @mark.parametrize(
+        "cls",
+        [
+            cls
+            for _, cls in getmembers(dobles.testing, isclass)
+            if cls.__module__ == "dobles.testing"
+        ],
+    )
+    def test_rebuilds_the_classified_attributes(self, cache, cls):
+        store(cls)
+        restart(cache)
+
+        assert load(cls) == classified(cls)
+
+    def test_rebuilds_dynamic_class_attributes(self, cache):
+        store(Color)
+        restart(cache)
+
+        assert load(Color) == classified(Color)
+
+    def test_misses_classes_that_were_not_stored(self, cache):
+        assert load(User) is None
+
+    def test_does_not_store_local_classes(self, cache):
+        class Local(object):
+            pass
+
+        store(Local)
+
+        assert load(Local) is None
+
+    def test_invalidates_entries_of_changed_source_files(
+        self, cache, tmp_path, monkeypatch
+    ):
+        source = tmp_path.joinpath("dobles_cached_module.py")
+        source.write_text("class Widget(object):\n    def save(self):\n        pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        module = importlib.import_module("dobles_cached_module")
+
+        try:
+            store(module.Widget)
+            restart(cache)
+            assert load(module.Widget) is not None
+
+            source.write_text("class Widget(object):\n    save = None\n")
+            restart(cache)
+            assert load(module.Widget) is None
+        finally:
+            del sys.modules["dobles_cached_module"]
+
+    def test_invalidates_entries_of_modified_classes(self, cache):
+        store(User)
+        restart(cache)
+        User.added_later = lambda self: None
+
+        try:
+            assert load(User) is None
+        finally:
+            del User.added_later
+
+    def test_keeps_the_entries_other_processes_saved(self, cache):
+        path = cache.joinpath("dobles.testing.json")
+        store(EmptyClass)
+        introspection_cache.save()
+        saved_by_another_process = path.read_text()
+        restart(cache)
+        path.unlink()
+
+        store(User)
+        path.write_text(saved_by_another_process)
+        restart(cache)
+
+        assert load(User) == classified(User)
+        assert load(EmptyClass) == classified(EmptyClass)
+
+    def test_does_nothing_while_disabled(self, tmp_path):
+        store(User)
+
+        assert load(User) is None
+        assert not list(tmp_path.iterdir())
+
+
+def test_persists_entries_in_the_pytest_cache(pytester):
+    pytester.makepyfile(
+        test_widget="""
+        from dobles import allow
+
+        class Widget(object):
+            def save(self):
+                return "saved"
+
+        def test_allow():
+            widget = Widget()
+            allow(widget).save.and_return("Bob Barker")
+            assert widget.save() == "Bob Barker"
+    """
+    )
+
+    pytester.runpytest("--dobles-cache").assert_outcomes(passed=1)
+    assert pytester.path.joinpath(
+        ".pytest_cache", "d", "dobles", "test_widget.json"
+    ).exists()
+
+    pytester.runpytest("--dobles-cache").assert_outcomes(passed=1)
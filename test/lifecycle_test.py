@@ -1,3 +1,4 @@
+import asyncio
 from threading import Thread
 
 try:
@@ -5,8 +6,24 @@ try:
 except ImportError:
     from queue import Queue
 
+from pytest import fixture, raises
+
 import dobles.testing
-from dobles import allow, clear, expect, lifecycle
+from dobles import (
+    Layer,
+    allow,
+    clear,
+    expect,
+    isolated_space,
+    lifecycle,
+    received,
+    teardown,
+    verify,
+)
+from dobles.exceptions import MockExpectationError
+from dobles.testing import User
+
+pytest_plugins = "pytester"
 
 
 class TestLifecycle(object):
@@ -68,3 +85,235 @@ class TestClear(object):
 
         result = dobles.testing.top_level_function("bob")
         assert result == "bob -- default"
+
+
+class TestIsolatedSpace(object):
+    def test_uses_its_own_space(self):
+        outer_space = lifecycle.current_space()
+
+        with isolated_space():
+            inner_space = lifecycle.current_space()
+
+            assert inner_space is not outer_space
+            assert lifecycle.current_space() is inner_space
+
+        assert lifecycle.current_space() is outer_space
+
+    def test_verifies_expectations_on_exit(self):
+        user = dobles.testing.User("Bob Barker", 25)
+
+        with raises(MockExpectationError):
+            with isolated_space():
+                expect(user).get_name
+
+    def test_tears_down_on_exit(self):
+        user = dobles.testing.User("Bob Barker", 25)
+
+        with isolated_space():
+            allow(user).get_name.and_return("Drew Carey")
+            assert user.get_name() == "Drew Carey"
+
+        assert user.get_name() == "Bob Barker"
+
+    def test_does_not_verify_after_an_exception(self):
+        user = dobles.testing.User("Bob Barker", 25)
+
+        with raises(ValueError):
+            with isolated_space():
+                expect(user).get_name
+                raise ValueError("The price is wrong")
+
+        assert user.get_name() == "Bob Barker"
+
+    def test_leaves_the_thread_space_alone(self):
+        expect(dobles.testing).top_level_function
+
+        with isolated_space():
+            verify()
+            teardown()
+
+        with raises(MockExpectationError):
+            verify()
+        teardown()
+
+    def test_isolates_concurrent_tasks(self):
+        async def satisfied(declared, finished):
+            user = dobles.testing.User("Bob Barker", 25)
+            with isolated_space():
+                expect(user).get_name
+                declared.set()
+                await finished.wait()
+                user.get_name()
+
+        async def unsatisfied(declared, finished):
+            user = dobles.testing.User("Drew Carey", 60)
+            with isolated_space():
+                await declared.wait()
+                expect(user).get_name
+                finished.set()
+
+        async def run():
+            declared, finished = asyncio.Event(), asyncio.Event()
+            return await asyncio.gather(
+                satisfied(declared, finished),
+                unsatisfied(declared, finished),
+                return_exceptions=True,
+            )
+
+        first, second = asyncio.run(run())
+
+        assert first is None
+        assert isinstance(second, MockExpectationError)
+
+    def test_tasks_spawned_inside_share_the_space(self):
+        user = dobles.testing.User("Bob Barker", 25)
+
+        async def call():
+            return user.get_name()
+
+        async def run():
+            with isolated_space():
+                allow(user).get_name.and_return("Drew Carey")
+                return await asyncio.create_task(call())
+
+        assert asyncio.run(run()) == "Drew Carey"
+
+
+@fixture
+def layer():
+    layer = Layer()
+    yield layer
+    teardown()
+    layer.teardown()
+
+
+class TestLayer(object):
+    def test_keeps_its_dobles_across_tests(self, layer):
+        with layer:
+            allow(User).class_method.and_return("layer value")
+        proxy_method = User.__dict__["class_method"]
+
+        teardown()
+
+        assert User.class_method("foo") == "layer value"
+        assert User.__dict__["class_method"] is proxy_method
+
+    def test_allowances_of_tests_take_priority_until_teardown(self, layer):
+        user = User("Alice", 25)
+        with layer:
+            allow(user).get_name.and_return("layer value")
+
+        allow(user).get_name.and_return("test value")
+        assert user.get_name() == "test value"
+
+        teardown()
+
+        assert user.get_name() == "layer value"
+
+    def test_restores_methods_doubled_by_tests_only(self, layer):
+        user = User("Alice", 25)
+        with layer:
+            allow(user).get_name.and_return("layer value")
+
+        allow(user).instance_method.and_return("test value")
+        teardown()
+
+        assert user.instance_method() == "instance_method return value"
+        assert user.get_name() == "layer value"
+
+    def test_tests_only_verify_their_own_expectations(self, layer):
+        user = User("Alice", 25)
+        with layer:
+            expect(user).get_name
+
+        expect(user).instance_method
+        with raises(MockExpectationError) as e:
+            verify()
+        teardown()
+
+        assert "instance_method" in str(e.value)
+        verify()
+        with raises(MockExpectationError):
+            layer.verify()
+        user.get_name()
+
+    def test_received_calls_do_not_outlive_teardown(self, layer, record_calls):
+        user = User("Alice", 25)
+        with layer:
+            allow(user).get_name.and_return("layer value")
+            user.get_name()
+
+        assert received(user).get_name.count == 0
+        user.get_name()
+        assert received(user).get_name.count == 1
+        teardown()
+
+        user.get_name()
+        assert received(user).get_name.count == 1
+        teardown()
+
+        assert received(user).get_name.count == 0
+
+    def test_restores_the_original_objects_on_teardown(self):
+        layer = Layer()
+        user = User("Alice", 25)
+        with layer:
+            allow(user).get_name.and_return("layer value")
+            allow(User).class_method.and_return("layer value")
+
+        layer.teardown()
+
+        assert user.get_name() == "Alice"
+        assert User.class_method("foo") == "class_method return value: foo"
+
+    def test_stacks_layers(self, layer):
+        user = User("Alice", 25)
+        with layer:
+            allow(user).get_name.and_return("outer value")
+        inner = Layer()
+        with inner:
+            allow(user).get_name.and_return("inner value")
+
+        try:
+            allow(user).get_name.and_return("test value")
+            assert user.get_name() == "test value"
+            teardown()
+            assert user.get_name() == "inner value"
+        finally:
+            inner.teardown()
+
+        assert user.get_name() == "outer value"
+
+
+def test_layers_in_session_fixtures_double_objects_once(pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+
+        from dobles import Layer, allow, expect
+        from dobles.testing import User
+
+        @pytest.fixture(scope="module", autouse=True)
+        def stubbed_user():
+            layer = Layer()
+            with layer:
+                allow(User).class_method.and_return("layer value")
+            yield User.__dict__["class_method"]
+            layer.teardown()
+
+        def test_overrides(stubbed_user):
+            allow(User).class_method.and_return("test value")
+            assert User.class_method("foo") == "test value"
+
+        def test_expects(stubbed_user):
+            expect(User).class_method.once()
+            User.class_method("foo")
+
+        def test_sees_the_layer(stubbed_user):
+            assert User.class_method("foo") == "layer value"
+            assert User.__dict__["class_method"] is stubbed_user
+        """
+    )
+
+    pytester.runpytest().assert_outcomes(passed=3)
+    assert User.class_method("foo") == "class_method return value: foo"
@@ -0,0 +1,148 @@
+import re
+from collections import OrderedDict
+from datetime import date, datetime
+
+from pytest import importorskip, mark, raises
+
+from dobles import allow, expect, received, teardown, verify
+from dobles.exceptions import MockExpectationError, UnallowedMethodCallError
+from dobles.instance_double import InstanceDouble
+from dobles.matchers import (
+    all_of,
+    any_of,
+    any_of_type,
+    approximately,
+    between,
+    contains,
+    contains_entries,
+    instance_of,
+    matches_regex,
+    not_,
+)
+
+
+class Unhashable(object):
+    __hash__ = None
+
+
+class Incomparable(object):
+    def __eq__(self, other):
+        raise ValueError("Cannot be compared")
+
+    __hash__ = object.__hash__
+
+
+@mark.parametrize(
+    "matcher, matching, non_matching",
+    [
+        (any_of_type(int, str), [1, "a"], [True, 1.0, None]),
+        (instance_of(int), [1, True], [1.0, "1"]),
+        (matches_regex(r"^b.b$"), ["bob", "bib"], ["bobby", b"bob", 1]),
+        (matches_regex(r"BOB", re.IGNORECASE), ["bob"], ["bill"]),
+        (between(1, 10), [1, 5.5, 10], [0, 11, "5", None]),
+        (between(1, 10, inclusive=False), [2], [1, 10]),
+        (
+            between(date(2020, 1, 1), date(2021, 1, 1)),
+            [date(2020, 6, 1)],
+            [1, datetime(2020, 6, 1)],
+        ),
+        (contains("b"), ["abc", ["b"], {"b": 1}], ["a", [b"b"], 1, {1}]),
+        (contains(Unhashable), [[Unhashable]], [{1}, {1: 2}, "Unhashable"]),
+        (contains(instance_of(str)), [[1, "a"], ("a",)], [[1, 2], 1]),
+        (contains(1), [[1]], [[Incomparable()]]),
+        (approximately(0.3), [0.1 + 0.2], [0.31, "0.3"]),
+        (approximately(1.0), [1], [10**400, -(10**400)]),
+        (approximately(float("inf")), [float("inf")], [10**400]),
+        (approximately(1j), [1j], [10**400]),
+        (approximately(1, abs_tol=0.5), [1.4], [1.6]),
+        (approximately(1j, abs_tol=0.5), [1.2j], [2j]),
+        (
+            contains_entries(a=1, b=instance_of(str)),
+            [{"a": 1, "b": "x", "c": 3}, OrderedDict(a=1, b="y")],
+            [{"a": 1}, {"a": 2, "b": "x"}, ["a", "b"]],
+        ),
+        (any_of(1, instance_of(str)), [1, "a"], [2, Incomparable()]),
+        (all_of(instance_of(int), between(1, 3)), [2], [2.0, 4]),
+        (not_(instance_of(int)), ["a"], [1]),
+        (instance_of(int) | None, [1, None], ["a"]),
+        (instance_of(int) & ~between(1, 3), [5], [2, "a"]),
+    ],
+)
+def test_matchers(matcher, matching, non_matching):
+    for value in matching:
+        assert matcher.predicate(value), value
+    for value in non_matching:
+        assert not matcher.predicate(value), value
+
+
+def test_arguments_that_cannot_be_compared_do_not_match():
+    numpy = importorskip("numpy")
+
+    array = numpy.ones(2)
+
+    assert contains(array).predicate([array])
+    assert not contains(array).predicate([numpy.zeros(2), numpy.ones(2)])
+    assert not contains(1).predicate([numpy.ones(2)])
+    assert not any_of([1, 2]).predicate([numpy.ones(2)])
+
+
+def test_between_requires_comparable_bounds():
+    with raises(TypeError):
+        between(1, "z")
+
+
+@mark.parametrize("stubber", [allow, expect])
+class TestWithArgs(object):
+    def test_matches_arguments_in_any_position(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+        stubber(subject).method_with_default_args.with_args(
+            instance_of(str), bar=between(1, 3)
+        ).and_return("matched")
+
+        assert subject.method_with_default_args("foo", bar=2) == "matched"
+        with raises(UnallowedMethodCallError):
+            subject.method_with_default_args("foo", bar=4)
+        teardown()
+
+    def test_mixes_matchers_and_values(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+        stubber(subject).method_with_varargs.with_args(
+            "exact", matches_regex("^a")
+        ).and_return("matched")
+
+        assert subject.method_with_varargs("exact", "abc") == "matched"
+        with raises(UnallowedMethodCallError):
+            subject.method_with_varargs("other", "abc")
+        with raises(UnallowedMethodCallError):
+            subject.method_with_varargs("exact", "abc", "extra")
+        teardown()
+
+
+class TestFailureMessages(object):
+    def test_describe_the_matchers(self):
+        subject = InstanceDouble("dobles.testing.User")
+        expect(subject).method_with_default_args.with_args(
+            any_of(instance_of(int), matches_regex("^a")),
+            bar=contains_entries({"a": not_(approximately(1.0))}),
+        )
+
+        with raises(MockExpectationError) as e:
+            verify()
+        teardown()
+
+        assert (
+            "with (any_of(instance_of(int), matches_regex('^a')), "
+            "bar=contains_entries({'a': not_(approximately(1.0, rel_tol=1e-09, abs_tol=0.0))}))"
+        ) in str(e.value)
+
+
+@mark.usefixtures("record_calls")
+def test_narrows_received_calls():
+    subject = InstanceDouble("dobles.testing.User")
+    allow(subject).method_with_positional_arguments
+
+    subject.method_with_positional_arguments(1)
+    subject.method_with_positional_arguments("a")
+
+    calls = received(subject).method_with_positional_arguments
+    assert calls.with_args(instance_of(str)).count == 1
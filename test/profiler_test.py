@@ -0,0 +1,136 @@
+from pytest import fixture
+
+from dobles import allow, allow_many, expect, profiler
+from dobles.allowance import Allowance
+from dobles.lifecycle import teardown, verify
+from dobles.proxy_method import ProxyMethod
+from dobles.space import Space
+from dobles.testing import User
+
+pytest_plugins = "pytester"
+
+
+@fixture
+def profiling():
+    profiler.enable()
+    yield
+    profiler.disable()
+
+
+def profile_test(name, body):
+    profiler.start_test(name)
+    try:
+        body()
+        verify()
+        teardown()
+    finally:
+        profiler.finish_test()
+
+
+class TestProfiler(object):
+    def test_restores_the_profiled_methods_when_disabled(self):
+        originals = (
+            ProxyMethod.__call__,
+            Allowance.with_args,
+            Space.verify,
+            Space.teardown,
+        )
+
+        profiler.enable()
+        assert ProxyMethod.__call__ is not originals[0]
+        profiler.disable()
+
+        assert (
+            ProxyMethod.__call__,
+            Allowance.with_args,
+            Space.verify,
+            Space.teardown,
+        ) == originals
+
+    def test_counts_stubs_and_calls(self, profiling):
+        def body():
+            user = User("Alice", 25)
+            allow(user).get_name.and_return("Bob")
+            expect(user).instance_method
+            user.get_name()
+            user.get_name()
+            user.instance_method()
+
+        profile_test("test_body", body)
+
+        (profile,) = profiler.slowest_tests(10)
+        assert profile.name == "test_body"
+        assert profile.stubs == 2
+        assert profile.calls == 3
+        assert all(profile.durations[phase] > 0 for phase in profiler.PHASES)
+        assert profile.total == sum(profile.durations.values())
+
+    def test_counts_stubs_declared_together(self, profiling):
+        def body():
+            user = User("Alice", 25)
+            allow_many(user, {"get_name": "Bob", "instance_method": None})
+
+        profile_test("test_body", body)
+
+        (profile,) = profiler.slowest_tests(10)
+        assert profile.stubs == 2
+        assert profile.durations["setup"] > 0
+
+    def test_reports_the_hottest_methods_over_all_tests(self, profiling):
+        def body():
+            user = User("Alice", 25)
+            allow(user).get_name
+            allow(user).instance_method
+            for _ in range(10):
+                user.get_name()
+            user.instance_method()
+
+        profile_test("test_first", body)
+        profile_test("test_second", body)
+
+        calls = {name: calls for name, calls, _ in profiler.hottest_methods(10)}
+        assert calls == {
+            "dobles.testing.User.get_name": 20,
+            "dobles.testing.User.instance_method": 2,
+        }
+        assert len(profiler.slowest_tests(1)) == 1
+
+    def test_ignores_dobles_used_outside_of_tests(self, profiling):
+        user = User("Alice", 25)
+        allow(user).get_name
+        user.get_name()
+        teardown()
+
+        assert profiler.slowest_tests(10) == []
+        assert profiler.hottest_methods(10) == []
+
+
+def test_reports_the_slowest_tests(pytester):
+    pytester.makepyfile(
+        """
+        from dobles import allow
+        from dobles.testing import User
+
+        def test_allow():
+            user = User("Alice", 25)
+            allow(user).get_name.and_return("Bob")
+            assert user.get_name() == "Bob"
+
+        def test_nothing():
+            pass
+        """
+    )
+
+    result = pytester.runpytest("--dobles-profile", "--dobles-profile-top=1")
+
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*dobles profile: top 1 tests*",
+            "*total ms*setup*dispatch*verify*teardown*stubs*calls*test",
+            "* 1 * 1  test_reports_the_slowest_tests.py::test_allow",
+            "*dobles profile: top 1 doubled methods*",
+            "* 1  dobles.testing.User.get_name",
+        ]
+    )
+    assert not profiler.is_enabled()
@@ -0,0 +1,138 @@
+from threading import Thread, get_ident
+
+from pytest import mark, raises
+
+from dobles import allow, expect, received, set_call_history_capacity, teardown
+from dobles.exceptions import MockExpectationError, UnallowedMethodCallError
+from dobles.instance_double import InstanceDouble
+from dobles.testing import User
+
+
+@mark.usefixtures("record_calls")
+class TestReceived(object):
+    def test_records_the_arguments_of_each_call(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_varargs
+
+        subject.method_with_varargs("foo", "bar")
+        subject.method_with_varargs()
+
+        calls = received(subject).method_with_varargs.calls
+
+        assert [(call.args, call.kwargs) for call in calls] == [
+            (("foo", "bar"), {}),
+            ((), {}),
+        ]
+
+    def test_records_the_thread_and_time_of_each_call(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).instance_method
+        thread = Thread(target=subject.instance_method)
+
+        subject.instance_method()
+        thread.start()
+        thread.join()
+
+        first, second = received(subject).instance_method.calls
+
+        assert first.thread == get_ident()
+        assert second.thread == thread.ident
+        assert first.timestamp <= second.timestamp
+
+    def test_narrows_calls_down_by_arguments(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_default_args
+
+        subject.method_with_default_args("foo")
+        subject.method_with_default_args("bar", bar="baz")
+        subject.method_with_default_args("foo")
+
+        calls = received(subject).method_with_default_args
+
+        assert calls.with_args("foo").count == 2
+        assert calls.with_args("bar", bar="baz").count == 1
+        assert not calls.with_no_args()
+        assert calls.last.args == ("foo",)
+
+    def test_records_calls_that_were_not_allowed(self):
+        user = User("Alice", 25)
+        allow(user).method_with_positional_arguments.with_args("foo")
+
+        with raises(UnallowedMethodCallError):
+            user.method_with_positional_arguments("bar")
+
+        assert (
+            received(user).method_with_positional_arguments.with_args("bar").count == 1
+        )
+
+    def test_records_calls_to_expected_methods(self):
+        user = User("Alice", 25)
+        expect(user).get_name
+
+        user.get_name()
+
+        assert len(received(user).get_name) == 1
+
+    def test_accepts_a_path_to_a_class(self):
+        allow("dobles.testing.User").class_method
+
+        User.class_method("foo")
+
+        assert received("dobles.testing.User").class_method.with_args("foo")
+
+    def test_raises_for_methods_that_were_never_doubled(self):
+        user = User("Alice", 25)
+        allow(user).get_name
+
+        with raises(MockExpectationError) as e:
+            received(user).instance_method
+
+        assert "Cannot check the calls to 'instance_method'" in str(e.value)
+
+
+@mark.usefixtures("record_calls")
+class TestCallHistoryCapacity(object):
+    def test_keeps_only_the_most_recent_calls(self):
+        set_call_history_capacity(3)
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments
+
+        for i in range(10):
+            subject.method_with_positional_arguments(i)
+
+        calls = received(subject).method_with_positional_arguments
+
+        assert [call.args for call in calls] == [(7,), (8,), (9,)]
+
+    def test_a_capacity_of_zero_disables_recording(self):
+        set_call_history_capacity(0)
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).instance_method.and_return("foo")
+
+        assert subject.instance_method() == "foo"
+        with raises(MockExpectationError) as e:
+            received(subject).instance_method
+
+        assert "since calls are not recorded" in str(e.value)
+
+    def test_the_capacity_outlives_teardown(self):
+        set_call_history_capacity(3)
+        teardown()
+
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments
+
+        for i in range(5):
+            subject.method_with_positional_arguments(i)
+
+        assert received(subject).method_with_positional_arguments.count == 3
+
+
+def test_calls_are_not_recorded_by_default():
+    subject = InstanceDouble("dobles.testing.User")
+    allow(subject).instance_method
+
+    subject.instance_method()
+
+    with raises(MockExpectationError):
+        received(subject).instance_method
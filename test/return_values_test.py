@@ -1,10 +1,23 @@
-from pytest import mark, raises
+import gc
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-from dobles import allow, expect
+from pytest import fixture, mark, raises
+
+from dobles import allow, expect, raising
 from dobles.instance_double import InstanceDouble
 from dobles.lifecycle import teardown
 
 
+@fixture
+def frequent_thread_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
 class UserDefinedException(Exception):
     pass
 
@@ -67,6 +80,61 @@ class TestReturnValues(object):
         with raises(UserDefinedExceptionWithArgs):
             subject.instance_method()
 
+    def test_raises_a_new_exception_built_with_the_provided_arguments(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_raise(ValueError, "msg", 1)
+
+        with raises(ValueError) as first:
+            subject.instance_method()
+        with raises(ValueError) as second:
+            subject.instance_method()
+
+        assert first.value.args == second.value.args == ("msg", 1)
+        assert first.value is not second.value
+
+    def test_raises_the_result_of_an_exception_factory(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_raise(
+            lambda code: UserDefinedExceptionWithArgs("msg", code), 503
+        )
+
+        with raises(UserDefinedExceptionWithArgs):
+            subject.instance_method()
+
+    def test_raising_an_instance_again_discards_its_earlier_traceback(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+        exception = UserDefinedException()
+
+        stubber(subject).instance_method.and_raise(exception)
+
+        depths = []
+        for _ in range(3):
+            with raises(UserDefinedException) as e:
+                subject.instance_method()
+            depths.append(len(traceback.extract_tb(e.value.__traceback__)))
+
+        assert e.value is exception
+        assert depths[0] == depths[1] == depths[2]
+
+    def test_raising_leaves_no_reference_cycles(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+        stubber(subject).instance_method.and_raise(UserDefinedException)
+        stubber(subject).get_name.and_raise(UserDefinedException())
+
+        gc.collect()
+        gc.disable()
+        try:
+            with raises(UserDefinedException):
+                subject.instance_method()
+            with raises(UserDefinedException):
+                subject.get_name()
+
+            assert gc.collect() == 0
+        finally:
+            gc.enable()
+
     def test_chaining_result_methods_gives_the_last_one_precedence(self, stubber):
         subject = InstanceDouble("dobles.testing.User")
 
@@ -119,3 +187,109 @@ class TestAndReturn(object):
         stubber(subject).instance_method.and_return("baz")
 
         assert subject.instance_method() == "baz"
+
+
+@mark.parametrize("stubber", [allow, expect])
+class TestRaising(object):
+    def test_raises_in_turn_before_returning(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_return(
+            raising(UserDefinedException), raising(ValueError, "msg"), "bar"
+        )
+
+        with raises(UserDefinedException):
+            subject.instance_method()
+        with raises(ValueError) as e:
+            subject.instance_method()
+        assert str(e.value) == "msg"
+        assert subject.instance_method() == "bar"
+        assert subject.instance_method() == "bar"
+
+    def test_keeps_raising_if_it_is_the_last_value(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_return_from(
+            ["bar", raising(UserDefinedException)]
+        )
+
+        assert subject.instance_method() == "bar"
+        for _ in range(2):
+            with raises(UserDefinedException):
+                subject.instance_method()
+
+    def test_raises_if_it_is_the_only_value(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_return(raising(UserDefinedException))
+
+        with raises(UserDefinedException):
+            subject.instance_method()
+
+
+@mark.parametrize("stubber", [allow, expect])
+class TestAndReturnFrom(object):
+    def test_returns_values_in_order(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_return_from(["bar", "bazz"])
+
+        assert subject.instance_method() == "bar"
+        assert subject.instance_method() == "bazz"
+
+    def test_returns_the_last_value_multiple_times(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_return_from(["bar", "bazz"])
+
+        assert subject.instance_method() == "bar"
+        assert subject.instance_method() == "bazz"
+        assert subject.instance_method() == "bazz"
+
+    def test_consumes_values_lazily(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+        produced = []
+
+        def values():
+            for i in range(1000000):
+                produced.append(i)
+                yield i
+
+        stubber(subject).instance_method.and_return_from(values())
+
+        assert produced == []
+        assert subject.instance_method() == 0
+        assert subject.instance_method() == 1
+        assert produced == [0, 1]
+
+    def test_raises_if_the_iterable_is_empty(self, stubber):
+        subject = InstanceDouble("dobles.testing.User")
+
+        stubber(subject).instance_method.and_return_from([])
+
+        with raises(TypeError) as e:
+            subject.instance_method()
+
+        assert str(e.value) == "and_return_from() expected at least 1 return value"
+        teardown()
+
+    def test_hands_each_value_to_one_of_many_threads(
+        self, stubber, frequent_thread_switches
+    ):
+        subject = InstanceDouble("dobles.testing.User")
+
+        def values():
+            for i in range(8000):
+                yield int(str(i))
+
+        stubber(subject).instance_method.and_return_from(values())
+
+        def call(_):
+            return [subject.instance_method() for _ in range(1000)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = [
+                value for batch in executor.map(call, range(8)) for value in batch
+            ]
+
+        assert sorted(results) == list(range(8000))
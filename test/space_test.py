@@ -0,0 +1,168 @@
+import gc
+from inspect import currentframe
+from weakref import ref
+
+from pytest import raises
+
+from dobles import InstanceDouble, allow, expect, received, teardown, verify
+from dobles.caller import Caller
+from dobles.exceptions import MockExpectationError
+from dobles.space import Space
+from dobles.testing import User
+
+
+class TestProxyRegistry(object):
+    def test_returns_the_same_proxy_for_an_object(self):
+        space = Space()
+        user = User("Bob Barker", 100)
+
+        assert space.proxy_for(user) is space.proxy_for(user)
+
+    def test_releases_allowed_instances_once_collected(self):
+        space = Space()
+        user = User("Bob Barker", 100)
+        space.proxy_for(user).add_allowance(
+            "get_name", Caller(currentframe())
+        ).and_return("Drew Carey")
+        user_ref = ref(user)
+
+        assert user.get_name() == "Drew Carey"
+
+        del user
+        gc.collect()
+
+        assert user_ref() is None
+        assert not space._proxies
+
+    def test_does_not_reuse_the_proxy_of_a_collected_object(self):
+        space = Space()
+        user = User("Bob Barker", 100)
+        proxy = space.proxy_for(user)
+        proxy.add_allowance("get_name", Caller(currentframe())).and_return("Drew Carey")
+
+        del user
+        gc.collect()
+
+        other_user = User("Drew Carey", 60)
+        assert not proxy.is_proxy_for(other_user)
+        assert space.proxy_for(other_user) is not proxy
+
+    def test_pins_instances_with_expectations(self):
+        space = Space()
+        user = User("Bob Barker", 100)
+        space.proxy_for(user).add_expectation("get_name", Caller(currentframe()))
+        user_ref = ref(user)
+
+        del user
+        gc.collect()
+
+        assert user_ref() is not None
+        with raises(MockExpectationError):
+            space.verify()
+
+    def test_pins_instances_that_modify_their_class(self):
+        space = Space()
+        user = User("Bob Barker", 100)
+        space.proxy_for(user).add_allowance("some_property", Caller(currentframe()))
+        user_ref = ref(user)
+
+        del user
+        gc.collect()
+
+        assert user_ref() is not None
+
+        space.teardown()
+
+        assert User("Drew Carey", 60).some_property == "some_property return value"
+
+    def test_keeps_classes_and_modules_until_teardown(self):
+        space = Space()
+        space.proxy_for(User).add_allowance("class_method", Caller(currentframe()))
+
+        space.teardown()
+
+        assert User.class_method("foo") == "class_method return value: foo"
+
+    def test_restores_live_instances_on_teardown(self):
+        space = Space()
+        user = User("Bob Barker", 100)
+        space.proxy_for(user).add_allowance(
+            "get_name", Caller(currentframe())
+        ).and_return("Drew Carey")
+
+        space.teardown()
+
+        assert user.get_name() == "Bob Barker"
+
+
+class TestLifecycleRegistry(object):
+    def test_allowed_instances_are_not_kept_alive(self):
+        user = User("Bob Barker", 100)
+        allow(user).instance_method.and_return("Drew Carey")
+        user_ref = ref(user)
+
+        del user
+        gc.collect()
+
+        assert user_ref() is None
+
+    def test_expected_instances_are_kept_alive(self):
+        user = User("Bob Barker", 100)
+        expect(user).instance_method.and_return("Drew Carey")
+        user_ref = ref(user)
+        user.instance_method()
+
+        del user
+        gc.collect()
+
+        assert user_ref() is not None
+
+
+def double_everything():
+    import dobles.testing
+
+    subject = InstanceDouble("dobles.testing.User")
+    allow(subject).instance_method.and_return("value")
+    allow(subject).method_with_positional_arguments.with_args("foo").and_return(1)
+    allow(subject).method_with_default_args.with_args_validator(lambda *args: True)
+    allow(subject).get_name.and_raise(ValueError)
+    subject.instance_method()
+    subject.method_with_positional_arguments("foo")
+    subject.method_with_default_args("foo")
+    with raises(ValueError):
+        subject.get_name()
+    received(subject).instance_method.with_no_args()
+
+    user = User("Bob Barker", 100)
+    expect(user).get_name.and_return("Drew Carey")
+    allow(user).some_property.and_return("value")
+    allow(user).__call__.and_return("value")
+    user.get_name()
+    user.some_property
+    user()
+
+    allow(User).class_method.and_return_from(iter(range(10)))
+    User.class_method("foo")
+    allow(dobles.testing).top_level_function.and_return("value")
+    dobles.testing.top_level_function("foo")
+
+
+class TestReclamation(object):
+    def test_torn_down_dobles_are_freed_by_reference_counting(self, record_calls):
+        gc.collect()
+        gc.disable()
+        gc.set_debug(gc.DEBUG_SAVEALL)
+        try:
+            double_everything()
+            verify()
+            teardown()
+            gc.collect()
+            leaked = [
+                obj for obj in gc.garbage if type(obj).__module__.startswith("dobles.")
+            ]
+        finally:
+            gc.set_debug(0)
+            del gc.garbage[:]
+            gc.enable()
+
+        assert leaked == []
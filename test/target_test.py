@@ -0,0 +1,90 @@
+import gc
+from weakref import ref
+
+from dobles import allow
+from dobles.proxy_method import ProxyMethod
+from dobles.target import Target, _class_attrs_cache
+from dobles.testing import User
+
+
+class Model(object):
+    def save(self):
+        pass
+
+
+class TestClassAttributeCache(object):
+    def test_targets_of_the_same_class_share_attributes(self):
+        first = Target(User("Bob Barker", 100))
+        second = Target(User("Drew Carey", 60))
+
+        assert first.attrs == second.attrs
+        assert first.attrs.maps[1]._described is second.attrs.maps[1]._described
+
+    def test_attributes_added_to_a_target_are_not_shared(self):
+        first = Target(User("Bob Barker", 100))
+        first.get_callable_attr("callable_instance_attribute")
+
+        second = Target(User("Drew Carey", 60))
+
+        assert "callable_instance_attribute" in first.attrs
+        assert "callable_instance_attribute" not in second.attrs
+
+    def test_detects_monkeypatched_methods(self):
+        Target(Model())
+
+        def save(self):
+            pass
+
+        original = Model.save
+        Model.save = save
+        try:
+            assert Target(Model()).attrs["save"].object is save
+        finally:
+            Model.save = original
+
+        assert Target(Model()).attrs["save"].object is original
+
+    def test_detects_added_and_deleted_methods(self):
+        Target(Model())
+
+        Model.delete = lambda self: None
+        try:
+            assert "delete" in Target(Model()).attrs
+        finally:
+            del Model.delete
+
+        assert "delete" not in Target(Model()).attrs
+
+    def test_detects_changes_to_base_classes(self):
+        class Child(Model):
+            pass
+
+        Target(Child())
+
+        Model.delete = lambda self: None
+        try:
+            assert Target(Child()).attrs["delete"].defining_class is Model
+        finally:
+            del Model.delete
+
+    def test_detects_methods_hijacked_by_dobles(self):
+        Target(User("Bob Barker", 100))
+
+        allow(User).class_method
+
+        attr = Target(User("Bob Barker", 100)).attrs["class_method"]
+        assert isinstance(attr.object, ProxyMethod)
+
+    def test_does_not_keep_classes_alive(self):
+        class Local(Model):
+            def save(self):
+                return super().save()
+
+        Target(Local())
+        assert Local in _class_attrs_cache
+        local_ref = ref(Local)
+
+        del Local
+        gc.collect()
+
+        assert local_ref() is None
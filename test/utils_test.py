@@ -0,0 +1,96 @@
+import importlib
+import sys
+from types import ModuleType
+
+from pytest import fixture, raises
+
+import dobles.testing
+from dobles import InstanceDouble, patch, teardown
+from dobles.exceptions import VerifyingDoubleImportError
+from dobles.utils import get_target
+
+
+class Widget(object):
+    pass
+
+
+@fixture
+def module():
+    module = ModuleType("dobles_utils_test_module")
+    module.Widget = Widget
+    sys.modules[module.__name__] = module
+    yield module
+    del sys.modules[module.__name__]
+
+
+class TestGetTarget(object):
+    def test_returns_the_object_at_the_path(self):
+        assert get_target("dobles.testing.User") is dobles.testing.User
+        assert get_target("dobles.testing.User") is dobles.testing.User
+
+    def test_sees_rebound_attributes(self, module):
+        assert get_target("dobles_utils_test_module.Widget") is Widget
+
+        class OtherWidget(object):
+            pass
+
+        module.Widget = OtherWidget
+
+        assert get_target("dobles_utils_test_module.Widget") is OtherWidget
+
+    def test_sees_patched_attributes(self, module):
+        get_target("dobles_utils_test_module.Widget")
+
+        patch("dobles_utils_test_module.Widget", "patched")
+        assert get_target("dobles_utils_test_module.Widget") == "patched"
+
+        teardown()
+        assert get_target("dobles_utils_test_module.Widget") is Widget
+
+    def test_sees_replaced_modules(self, module):
+        get_target("dobles_utils_test_module.Widget")
+
+        replacement = ModuleType("dobles_utils_test_module")
+        replacement.Widget = "replaced"
+        sys.modules[module.__name__] = replacement
+
+        assert get_target("dobles_utils_test_module.Widget") == "replaced"
+
+    def test_sees_reloaded_modules(self, tmp_path, monkeypatch):
+        tmp_path.joinpath("dobles_reloaded_module.py").write_text(
+            "class Widget(object):\n    pass\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        module = importlib.import_module("dobles_reloaded_module")
+
+        try:
+            original = get_target("dobles_reloaded_module.Widget")
+            importlib.reload(module)
+
+            assert get_target("dobles_reloaded_module.Widget") is not original
+            assert get_target("dobles_reloaded_module.Widget") is module.Widget
+        finally:
+            del sys.modules["dobles_reloaded_module"]
+
+    def test_sees_attributes_that_were_removed(self, module):
+        get_target("dobles_utils_test_module.Widget")
+        del module.Widget
+
+        with raises(VerifyingDoubleImportError):
+            get_target("dobles_utils_test_module.Widget")
+
+    def test_raises_for_missing_modules_every_time(self):
+        for _ in range(2):
+            with raises(VerifyingDoubleImportError):
+                get_target("dobles.missing.Widget")
+
+    def test_instance_dobles_use_the_current_class(self, module):
+        InstanceDouble("dobles_utils_test_module.Widget")
+
+        class OtherWidget(object):
+            pass
+
+        module.Widget = OtherWidget
+
+        double = InstanceDouble("dobles_utils_test_module.Widget")
+        assert double._dobles_target is OtherWidget
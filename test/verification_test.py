@@ -0,0 +1,106 @@
+from inspect import signature
+
+from pytest import mark, raises
+
+from dobles import allow
+from dobles.exceptions import (
+    VerifyingBuiltinDoubleArgumentError,
+    VerifyingDoubleArgumentError,
+)
+from dobles.instance_double import InstanceDouble
+from dobles.lifecycle import current_space
+from dobles.testing import User
+from dobles.verification import _BindPlan, _get_bind_plan, _verify_arguments
+
+
+def positional_only(a, b=1, /, c=2, *, d, **kwargs):
+    pass
+
+
+def keyword_only(a, *args, c, d=1):
+    pass
+
+
+CALLS = [
+    ((), {}),
+    ((1,), {}),
+    ((1,), {"d": 1}),
+    ((1, 2), {"d": 1}),
+    ((1, 2, 3, 4), {"d": 1}),
+    ((1,), {"a": 1, "d": 1}),
+    ((1,), {"b": 1, "d": 1}),
+    ((1,), {"c": 1}),
+    ((), {"a": 1, "c": 1}),
+    ((1, 2, 3), {"c": 1, "e": 1}),
+]
+
+
+class TestBindPlan(object):
+    @mark.parametrize("func", [positional_only, keyword_only])
+    @mark.parametrize("args, kwargs", CALLS)
+    def test_only_accepts_arguments_that_bind(self, func, args, kwargs):
+        if not _BindPlan(signature(func)).accepts(args, kwargs):
+            return
+
+        signature(func).bind(*args, **kwargs)
+
+    def test_is_shared_by_methods_of_the_same_function(self):
+        first = User("Bob Barker", 100).get_name
+        second = User("Drew Carey", 60).get_name
+
+        assert _get_bind_plan(first) is _get_bind_plan(second)
+
+    def test_distinguishes_bound_and_unbound_functions(self):
+        assert _get_bind_plan(User.get_name) is not _get_bind_plan(
+            User("Bob Barker", 100).get_name
+        )
+
+    def test_raises_the_message_of_signature_bind(self):
+        with raises(TypeError) as expected:
+            signature(keyword_only).bind(1, 2)
+
+        with raises(VerifyingDoubleArgumentError) as e:
+            _verify_arguments(keyword_only, "keyword_only", (1, 2), {})
+
+        assert str(e.value) == str(expected.value)
+
+    def test_raises_for_builtins_without_a_signature(self):
+        with raises(VerifyingBuiltinDoubleArgumentError):
+            _verify_arguments(getattr, "getattr", (), {})
+
+
+class TestVerifiedCallShapes(object):
+    def test_remembers_valid_call_shapes(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_default_args
+
+        subject.method_with_default_args("foo")
+        subject.method_with_default_args("foo", bar="baz")
+
+        shapes = current_space().proxy_for(subject)._target.verified_call_shapes
+        assert shapes["method_with_default_args"][1] == {1, (1, ("bar",))}
+
+    def test_does_not_remember_invalid_call_shapes(self):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_default_args
+
+        for _ in range(2):
+            with raises(VerifyingDoubleArgumentError) as e:
+                subject.method_with_default_args("foo", baz="bar")
+
+            assert str(e.value) == "got an unexpected keyword argument 'baz'"
+
+    def test_verifies_calls_again_once_the_method_is_rebound(self, monkeypatch):
+        subject = InstanceDouble("dobles.testing.User")
+        allow(subject).method_with_positional_arguments.with_args(1)
+
+        def method_with_positional_arguments(self, foo, bar):
+            pass
+
+        monkeypatch.setattr(
+            User, "method_with_positional_arguments", method_with_positional_arguments
+        )
+
+        with raises(VerifyingDoubleArgumentError):
+            allow(subject).method_with_positional_arguments.with_args(1)
+        allow(subject).method_with_positional_arguments.with_args(1, 2)